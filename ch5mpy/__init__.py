@@ -4,10 +4,13 @@ import ch5mpy.dict
 import ch5mpy.functions.random
 from ch5mpy import indexing
 from ch5mpy.array import H5Array
+from ch5mpy.array.functions.grouping import group_reduce
 from ch5mpy.attributes import AttributeManager
 from ch5mpy.dict import H5Dict
 from ch5mpy.functions import AnonymousArrayCreationFunc, empty, full, ones, zeros
 from ch5mpy.io import (
+    LazyObject,
+    load_object,
     read_object,
     store_dataset,
     write_dataset,
@@ -18,14 +21,15 @@ from ch5mpy.io import (
 from ch5mpy.list import H5List
 from ch5mpy.names import H5Mode
 from ch5mpy.np import arange_nd
-from ch5mpy.objects import Dataset, File, Group
+from ch5mpy.objects import Dataset, File, Group, file_pool
 from ch5mpy.options import options, set_options
-from ch5mpy.types import SupportsH5Read, SupportsH5ReadWrite, SupportsH5Write
+from ch5mpy.types import H5Filters, SupportsH5Read, SupportsH5ReadWrite, SupportsH5Write
 
 random = ch5mpy.functions.random
 
 __all__ = [
     "File",
+    "file_pool",
     "Group",
     "Dataset",
     "H5Dict",
@@ -38,8 +42,11 @@ __all__ = [
     "write_object",
     "write_objects",
     "read_object",
+    "load_object",
+    "LazyObject",
     "H5Mode",
     "arange_nd",
+    "group_reduce",
     "empty",
     "zeros",
     "ones",
@@ -50,6 +57,7 @@ __all__ = [
     "SupportsH5Write",
     "SupportsH5Read",
     "SupportsH5ReadWrite",
+    "H5Filters",
     "indexing",
 ]
 
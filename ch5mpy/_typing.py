@@ -21,3 +21,6 @@ SELECTOR = Union[
 
 NP_FUNC = Callable[..., Any]
 H5_FUNC = Callable[..., Any]
+
+# (start, count, stride) of an HDF5 hyperslab
+HYPERSLAB = tuple[tuple[int, ...], tuple[int, ...], tuple[int, ...]]
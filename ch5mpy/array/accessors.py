@@ -0,0 +1,69 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any, Generic, TypeVar, cast
+
+import numpy as np
+import numpy.typing as npt
+
+from ch5mpy._typing import SELECTOR
+
+if TYPE_CHECKING:
+    from ch5mpy.array.array import H5Array
+
+
+_T = TypeVar("_T", bound=np.generic, covariant=True)
+
+
+def _is_coordinate(index: SELECTOR | tuple[SELECTOR, ...], ndim: int) -> bool:
+    if not isinstance(index, tuple):
+        index = (index,)
+
+    return len(index) == ndim and all(
+        isinstance(i, (int, np.integer)) and not isinstance(i, (bool, np.bool_)) for i in index
+    )
+
+
+class ArrayAccessor(Generic[_T]):
+    """
+    Eager access to elements of an H5Array (see `H5Array.at` and `H5Array.iat`).
+    Selections made only of integers and slices with step 1 are read or written with a single hyperslab, without
+    building a Selection. Other selections go through regular indexing.
+    """
+
+    __slots__ = "_array", "_scalar_only"
+
+    # region magic methods
+    def __init__(self, array: H5Array[_T], scalar_only: bool):
+        self._array = array
+        self._scalar_only = scalar_only
+
+    def __repr__(self) -> str:
+        return f"{'iat' if self._scalar_only else 'at'}[...] accessor on {self._array.__class__.__name__}"
+
+    def __getitem__(self, index: SELECTOR | tuple[SELECTOR, ...]) -> _T | npt.NDArray[_T]:
+        self._check_index(index)
+        hyperslab = self._array._get_hyperslab(index)
+
+        if hyperslab is not None:
+            values = self._array._read_hyperslab(*hyperslab)
+            return cast(_T, values[()]) if values.ndim == 0 else values
+
+        selected = self._array[index]
+        if isinstance(selected, np.ndarray):
+            # H5Arrays spoof np.ndarray's class
+            return np.array(selected)
+
+        return cast(_T, selected)
+
+    def __setitem__(self, index: SELECTOR | tuple[SELECTOR, ...], value: Any) -> None:
+        self._check_index(index)
+        self._array[index] = value
+
+    # endregion
+
+    # region methods
+    def _check_index(self, index: SELECTOR | tuple[SELECTOR, ...]) -> None:
+        if self._scalar_only and not _is_coordinate(index, self._array.ndim):
+            raise IndexError(f"iat[] requires exactly one integer per axis ({self._array.ndim}), got {index}.")
+
+    # endregion
@@ -10,14 +10,23 @@ import numpy.typing as npt
 from numpy._typing import _ArrayLikeInt_co
 
 import ch5mpy.io
-from ch5mpy._typing import NP_FUNC, SELECTOR
+from ch5mpy._typing import HYPERSLAB, NP_FUNC, SELECTOR
 from ch5mpy.array import repr
-from ch5mpy.array.chunks.iter import ChunkIterator, PairedChunkIterator
+from ch5mpy.array.accessors import ArrayAccessor
+from ch5mpy.array.chunks.iter import ChunkIterator, FollowingChunkIterator, PairedChunkIterator
 from ch5mpy.array.functions import HANDLED_FUNCTIONS
-from ch5mpy.array.io import read_one_from_dataset, write_to_dataset
-from ch5mpy.indexing import Selection, map_slice
+from ch5mpy.array.io import (
+    read_hyperslab,
+    read_one_from_dataset,
+    supports_direct_io,
+    write_hyperslab,
+    write_to_dataset,
+)
+from ch5mpy.array.memmap import memory_map
+from ch5mpy.indexing import FullSlice, Selection, SingleIndex, as_hyperslab, map_slice
+from ch5mpy.io.direct import read_direct_chunks, write_direct_chunks
 from ch5mpy.names import H5Mode
-from ch5mpy.objects import Dataset, DatasetWrapper, File, Group, H5Object
+from ch5mpy.objects import Dataset, DatasetWrapper, File, Group, H5Object, open_file
 from ch5mpy.options import _OPTIONS
 
 if TYPE_CHECKING:
@@ -58,14 +67,23 @@ def _dtype_repr(dset: Dataset[Any] | DatasetWrapper[Any]) -> str:
 
 
 class H5Array(H5Object, Collection[_T], numpy.lib.mixins.NDArrayOperatorsMixin):
-    """Wrapper around Dataset objects to interface with numpy's API."""
+    """
+    Wrapper around Dataset objects to interface with numpy's API.
+
+    With `mmap=True`, contiguous datasets of numbers are read through a read-only memory map of the file instead of
+    HDF5 : selections of integers and slices, chunks and conversions to numpy arrays are zero-copy views on the file.
+    Other datasets (chunked, compressed, ...) are still read with h5py. Writes always go through h5py.
+    """
 
     __class__ = np.ndarray  # type: ignore[assignment]
 
     # region magic methods
-    def __init__(self, dset: Dataset[_T] | DatasetWrapper[_T] | H5Array[_T]):
+    def __init__(self, dset: Dataset[_T] | DatasetWrapper[_T] | H5Array[_T], mmap: bool = False):
         if isinstance(dset, H5Array):
             self._dset: Dataset[_T] | DatasetWrapper[_T] = dset.dset
+            self._mmap: np.memmap[Any, np.dtype[_T]] | None = (
+                dset._mmap if dset.is_mapped or not mmap else memory_map(dset.dset)
+            )
             super().__init__(dset.dset.file)
             return
 
@@ -78,6 +96,7 @@ class H5Array(H5Object, Collection[_T], numpy.lib.mixins.NDArrayOperatorsMixin):
         else:
             self._dset = dset
 
+        self._mmap = memory_map(self._dset) if mmap else None
         super().__init__(self._dset.file)
 
     def __repr__(self) -> str:
@@ -92,20 +111,36 @@ class H5Array(H5Object, Collection[_T], numpy.lib.mixins.NDArrayOperatorsMixin):
     def __getitem__(self, index: SELECTOR | tuple[SELECTOR, ...]) -> _T | H5Array[_T] | H5ArrayView[_T]:
         from ch5mpy.array.view import H5ArrayView
 
+        hyperslab = self._get_hyperslab(index)
+        if hyperslab is not None and hyperslab[1] == ():
+            # fast path for reading one element
+            return cast(_T, self._read_hyperslab(*hyperslab)[()])
+
         selection = Selection.from_selector(index, self._dset.shape)
 
         if selection.is_empty:
-            return H5Array(dset=self._dset)
+            return H5Array(self)
 
         elif selection.out_shape == ():
             return read_one_from_dataset(self._dset, selection, self.dtype)
 
         else:
-            return H5ArrayView(dset=self._dset, sel=selection)
+            return H5ArrayView(dset=self._dset, sel=selection, memmap=self._mmap)
 
     def __setitem__(self, index: SELECTOR | tuple[SELECTOR, ...], value: Any) -> None:
-        selection = Selection.from_selector(index, self.shape)
-        write_to_dataset(self._dset, as_array(value, self.dtype), selection)
+        values = as_array(value, self.dtype)
+        hyperslab = self._get_hyperslab(index)
+
+        if hyperslab is not None:
+            # fast path for writing to one hyperslab
+            if not write_direct_chunks(self._dset, values, *hyperslab):
+                write_hyperslab(self._dset, values, *hyperslab)  # type: ignore[arg-type]
+
+        else:
+            selection = Selection.from_selector(index, self.shape)
+            write_to_dataset(self._dset, values, selection)
+
+        self._flush_mapped()
 
     def __len__(self) -> int:
         return len(self._dset)
@@ -128,19 +163,27 @@ class H5Array(H5Object, Collection[_T], numpy.lib.mixins.NDArrayOperatorsMixin):
         # special case : 0D array
         if self.shape == ():
             self._dset[:] = func(self._dset[:], value)
+            self._flush_mapped()
             return self
 
         # general case : 1D+ array
         for index, chunk in self.iter_chunks():
+            if not chunk.flags.writeable:
+                # chunks of memory-mapped arrays are read-only views on the file
+                chunk = chunk.copy()
+
             func(chunk, value, out=chunk)
 
             # write back result into array
-            self.dset.write_direct(
-                chunk,
-                source_sel=map_slice(index, shift_to_zero=True),
-                dest_sel=map_slice(index),
-            )
-
+            hyperslab = as_hyperslab(map_slice(index), self.shape)
+            if hyperslab is None or not write_direct_chunks(self._dset, chunk, *hyperslab):
+                self.dset.write_direct(
+                    chunk,
+                    source_sel=map_slice(index, shift_to_zero=True),
+                    dest_sel=map_slice(index),
+                )
+
+        self._flush_mapped()
         return self
 
     def __add__(self, other: Any) -> Number | str | npt.NDArray[Any]:
@@ -219,7 +262,7 @@ class H5Array(H5Object, Collection[_T], numpy.lib.mixins.NDArrayOperatorsMixin):
 
     # region interface
     def __array__(self, dtype: npt.DTypeLike | None = None) -> npt.NDArray[Any]:
-        array = np.array(self._dset)
+        array = np.array(self._dset) if self._mmap is None else np.asarray(self._mmap)
 
         if dtype is None:
             return array
@@ -233,9 +276,13 @@ class H5Array(H5Object, Collection[_T], numpy.lib.mixins.NDArrayOperatorsMixin):
 
             return HANDLED_FUNCTIONS[ufunc](*inputs, **kwargs)
 
-        else:
+        # ufunc methods (e.g. np.add.reduceat) are registered as bound methods
+        ufunc_method = getattr(ufunc, method)
+        if ufunc_method not in HANDLED_FUNCTIONS:
             raise NotImplementedError
 
+        return HANDLED_FUNCTIONS[ufunc_method](*inputs, **kwargs)
+
     def __array_function__(
         self,
         func: NP_FUNC,
@@ -254,13 +301,15 @@ class H5Array(H5Object, Collection[_T], numpy.lib.mixins.NDArrayOperatorsMixin):
 
     # region class methods
     @classmethod
-    def read(cls, path: str | Path | File | Group, name: str | None = None, mode: H5Mode = H5Mode.READ) -> H5Array[Any]:
-        file = File(path, mode=mode) if isinstance(path, (str, Path)) else path
+    def read(
+        cls, path: str | Path | File | Group, name: str | None = None, mode: H5Mode = H5Mode.READ, mmap: bool = False
+    ) -> H5Array[Any]:
+        file = open_file(path, mode=mode) if isinstance(path, (str, Path)) else path
 
         if name is None:
-            return H5Array(next(iter(file.values())))  # type: ignore[arg-type]
+            return H5Array(next(iter(file.values())), mmap=mmap)  # type: ignore[arg-type]
 
-        return H5Array(file[name])
+        return H5Array(file[name], mmap=mmap)
 
     # endregion
 
@@ -269,6 +318,11 @@ class H5Array(H5Object, Collection[_T], numpy.lib.mixins.NDArrayOperatorsMixin):
     def is_chunked(self) -> bool:
         return self._dset.chunks is not None
 
+    @property
+    def is_mapped(self) -> bool:
+        """Is the dataset read through a memory map of the file ?"""
+        return self._mmap is not None
+
     # endregion
 
     # region attributes
@@ -301,6 +355,19 @@ class H5Array(H5Object, Collection[_T], numpy.lib.mixins.NDArrayOperatorsMixin):
     def attributes(self) -> AttributeManager:
         return self._dset.attrs
 
+    @property
+    def at(self) -> ArrayAccessor[_T]:
+        """
+        Eager access to elements : selections return numpy arrays instead of views. Selections made only of integers
+        and slices with step 1 are read and written with a single hyperslab.
+        """
+        return ArrayAccessor(self, scalar_only=False)
+
+    @property
+    def iat(self) -> ArrayAccessor[_T]:
+        """Access to single elements, given by one integer per axis."""
+        return ArrayAccessor(self, scalar_only=True)
+
     @property
     def flat(self) -> np.flatiter[npt.NDArray[_T]]:
         return np.array(self).flat
@@ -312,6 +379,35 @@ class H5Array(H5Object, Collection[_T], numpy.lib.mixins.NDArrayOperatorsMixin):
     # endregion
 
     # region methods
+    def _get_hyperslab(self, index: SELECTOR | tuple[SELECTOR, ...]) -> tuple[HYPERSLAB, tuple[int, ...]] | None:
+        """
+        Get the hyperslab and the shape selected by an index made only of integers and slices with step 1, if it can be
+        read or written directly.
+        """
+        if not supports_direct_io(self._dset):
+            return None
+
+        return as_hyperslab(index, self._dset.shape)
+
+    def _read_hyperslab(self, hyperslab: HYPERSLAB, shape: tuple[int, ...]) -> npt.NDArray[_T]:
+        if self._mmap is None:
+            return read_hyperslab(self._dset, hyperslab, shape)  # type: ignore[arg-type]
+
+        start, count, _ = hyperslab
+        return np.asarray(self._mmap[tuple(slice(s, s + c) for s, c in zip(start, count))]).reshape(shape)
+
+    def _get_mapped_chunk(self, index: tuple[FullSlice | SingleIndex, ...]) -> npt.NDArray[_T] | None:
+        """Get a read-only view on a chunk of a memory-mapped array (see `iter_chunks()`), or None if not mapped."""
+        if self._mmap is None:
+            return None
+
+        return np.asarray(self._mmap[map_slice(index)])
+
+    def _flush_mapped(self) -> None:
+        # HDF5 buffers small writes to contiguous datasets, they must be flushed to be seen through the memory map
+        if self._mmap is not None:
+            self._dset.file.flush()
+
     def _resize(self, amount: int, axis: int | tuple[int, ...] | None = None) -> None:
         if axis is None:
             axis = 0
@@ -332,6 +428,37 @@ class H5Array(H5Object, Collection[_T], numpy.lib.mixins.NDArrayOperatorsMixin):
         self._resize(amount, axis)
         self[0]
 
+    def append(self, values: Any, axis: int = 0) -> None:
+        """
+        Add values at the end of an axis, values can omit the axis to append a single element along it.
+        In SWMR mode, the dataset is flushed every time a chunk is filled along that axis, to make the new elements
+        visible to readers : call `flush()` once done to publish the last elements.
+
+        Raises:
+            TypeError: if the H5Array does not wrap a chunked Dataset.
+        """
+        values = as_array(values, self.dtype)
+        if values.ndim == self.ndim - 1:
+            values = np.expand_dims(values, axis)
+
+        start = self.shape[axis]
+        self._resize(values.shape[axis], axis)
+        self[(slice(None),) * axis + (slice(start, None),)] = values
+
+        if self._dset.file.swmr_mode:  # type: ignore[union-attr]
+            chunk_length = cast(tuple[int, ...], self._dset.chunks)[axis]
+
+            if start // chunk_length != self.shape[axis] // chunk_length:
+                self.flush()
+
+    def flush(self) -> None:
+        """Write the data and metadata (e.g. the shape) of the dataset to the file, for SWMR readers to see them."""
+        self._dset.flush()  # type: ignore[union-attr]
+
+    def refresh(self) -> None:
+        """Reload the metadata (e.g. the shape) of the dataset from the file, to see elements appended in SWMR mode."""
+        self._dset.refresh()  # type: ignore[union-attr]
+
     def contract(self, amount: int, axis: int | tuple[int, ...] | None = None) -> None:
         """
         Resize an H5Array by removing `amount` elements along the selected axis.
@@ -369,10 +496,19 @@ class H5Array(H5Object, Collection[_T], numpy.lib.mixins.NDArrayOperatorsMixin):
 
         if inplace:
             file, name = self._dset.file, self._dset.name
+            # keep the filters, unless they might not apply to the new kind of data (e.g. scale-offset)
+            filters = self._dset.filters if np.dtype(dtype).kind == self.dtype.kind else None
             del file[name]
 
             # FIXME : conversion to np happens anyway but might be expensive, could we save data without conversion ?
-            ch5mpy.io.write_dataset(np.array(new_dset), file, name, chunks=new_dset.chunks, maxshape=new_dset.maxshape)
+            ch5mpy.io.write_dataset(
+                np.array(new_dset),
+                file,
+                name,
+                chunks=new_dset.chunks,
+                maxshape=new_dset.maxshape,
+                filters=filters,
+            )
 
             if file[name].dtype == object:
                 self._dset = file[name].asstr()
@@ -380,6 +516,9 @@ class H5Array(H5Object, Collection[_T], numpy.lib.mixins.NDArrayOperatorsMixin):
             else:
                 self._dset = file[name]
 
+            if self._mmap is not None:
+                self._mmap = memory_map(self._dset)
+
         if copy:
             return np.array(new_dset)
         return H5Array(new_dset)
@@ -392,11 +531,25 @@ class H5Array(H5Object, Collection[_T], numpy.lib.mixins.NDArrayOperatorsMixin):
         """
         return H5Array(self._dset.maptype(otype))
 
-    def iter_chunks(self, keepdims: bool = False) -> ChunkIterator:
+    def iter_chunks(
+        self, keepdims: bool = False, follow: bool = False, poll_interval: float = 0.1, timeout: float | None = None
+    ) -> ChunkIterator:
+        """
+        Iterate by chunks over the data in the array, as (index, chunk) pairs.
+
+        Args:
+            keepdims: keep the dimensions of the array in chunks ? (default: False)
+            follow: after reading all rows, keep reading rows appended along the first axis (e.g. by a SWMR writer).
+            poll_interval: when following, seconds to wait before refreshing the array to look for new rows.
+            timeout: when following, stop after `timeout` seconds without new rows (never stop if None).
+        """
+        if follow:
+            return FollowingChunkIterator(self, keepdims, poll_interval, timeout)
+
         return ChunkIterator(self, keepdims)
 
     def iter_chunks_with(self, other: npt.NDArray[Any] | H5Array[Any], keepdims: bool = False) -> PairedChunkIterator:
-        return PairedChunkIterator(self, other, keepdims)
+        return PairedChunkIterator(self, other, keepdims=keepdims)
 
     def read_direct(
         self,
@@ -404,6 +557,10 @@ class H5Array(H5Object, Collection[_T], numpy.lib.mixins.NDArrayOperatorsMixin):
         source_sel: tuple[int | slice, ...],
         dest_sel: tuple[int | slice, ...],
     ) -> None:
+        hyperslab = as_hyperslab(source_sel, self.shape)
+        if hyperslab is not None and read_direct_chunks(self._dset, hyperslab[0], dest[dest_sel]):
+            return
+
         dset = self._dset.asstr() if np.issubdtype(self.dtype, str) else self._dset
         dset.read_direct(dest, source_sel=source_sel, dest_sel=dest_sel)
 
@@ -424,6 +581,25 @@ class H5Array(H5Object, Collection[_T], numpy.lib.mixins.NDArrayOperatorsMixin):
     ) -> _T | npt.NDArray[_T]:
         return np.sum(self, axis=axis, out=out)
 
+    def cumsum(
+        self, axis: int | None = None, dtype: npt.DTypeLike | None = None, out: npt.NDArray[Any] | None = None
+    ) -> npt.NDArray[Any]:
+        return np.cumsum(self, axis=axis, dtype=dtype, out=out)  # type: ignore[arg-type]
+
+    def cumprod(
+        self, axis: int | None = None, dtype: npt.DTypeLike | None = None, out: npt.NDArray[Any] | None = None
+    ) -> npt.NDArray[Any]:
+        return np.cumprod(self, axis=axis, dtype=dtype, out=out)  # type: ignore[arg-type]
+
+    def argmax(self, axis: int | None = None, out: npt.NDArray[np.intp] | None = None) -> Any:
+        return np.argmax(self, axis=axis, out=out)
+
+    def argmin(self, axis: int | None = None, out: npt.NDArray[np.intp] | None = None) -> Any:
+        return np.argmin(self, axis=axis, out=out)
+
+    def nonzero(self) -> tuple[npt.NDArray[np.intp], ...]:
+        return np.nonzero(self)
+
     def ravel(self, order: Literal["C", "F", "A", "K"] = "C") -> npt.NDArray[_T]:
         return np.ravel(self, order=order)
 
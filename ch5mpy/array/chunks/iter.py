@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import time
 from numbers import Number
 from typing import TYPE_CHECKING, Any, Generator, TypeVar, cast
 
@@ -94,7 +95,8 @@ def _get_chunk_indices(
 
     # if there are more axes, we must also select each index in those axes one by one
     left_shape = shape[: -(chunk_ndim + 1)]
-    left_chunks = np.array(np.meshgrid(*map(range, left_shape))).T.reshape(-1, len(left_shape))
+    # in C order, so that chunks follow each other in the flattened array
+    left_chunks = np.stack(np.meshgrid(*map(range, left_shape), indexing="ij"), axis=-1).reshape(-1, len(left_shape))
 
     return tuple(
         tuple(SingleIndex(_l, _s) for _l, _s in zip(left, shape)) + tuple(iter_axis_chunk)
@@ -145,66 +147,140 @@ class ChunkIterator:
         self,
     ) -> Generator[tuple[tuple[FullSlice | SingleIndex, ...], npt.NDArray[Any]], None, None]:
         for index in self._chunk_indices:
+            yield index, self._read_chunk(index, self._work_array)
+
+    def _read_chunk(self, index: tuple[FullSlice | SingleIndex, ...], work_array: npt.NDArray[Any]) -> npt.NDArray[Any]:
+        res = self._array._get_mapped_chunk(index)
+
+        if res is None:
             work_subset = map_slice(index, shift_to_zero=True)
-            self._array.read_direct(self._work_array, source_sel=map_slice(index), dest_sel=work_subset)
+            self._array.read_direct(work_array, source_sel=map_slice(index), dest_sel=work_subset)
 
             # cast to str if needed
-            res = _as_valid_dtype(self._work_array, self._array.dtype)[work_subset]
+            res = _as_valid_dtype(work_array, self._array.dtype)[work_subset]
+
+        # reshape to keep dimensions if needed
+        if self._keepdims:
+            res = res.reshape((1,) * (self._array.ndim - res.ndim) + res.shape)
+
+        return res
 
-            # reshape to keep dimensions if needed
-            if self._keepdims:
-                res = res.reshape((1,) * (self._array.ndim - res.ndim) + res.shape)
 
-            yield index, res
+def _shift_first_axis(
+    index: tuple[FullSlice | SingleIndex, ...], offset: int, max: int
+) -> tuple[FullSlice | SingleIndex, ...]:
+    first = index[0]
+
+    if isinstance(first, SingleIndex):
+        return (SingleIndex(first.as_numpy_index() + offset, max), *index[1:])
+
+    return (FullSlice(first.start + offset, first.stop + offset, first.step, max), *index[1:])
+
+
+class FollowingChunkIterator(ChunkIterator):
+    def __init__(
+        self,
+        array: H5Array[Any],
+        keepdims: bool = False,
+        poll_interval: float = 0.1,
+        timeout: float | None = None,
+    ):
+        """
+        Iterate by chunks over data in an array, then over rows appended to it along the first axis (e.g. by a writer in
+        SWMR mode). The array is refreshed every `poll_interval` seconds to look for new rows.
+
+        Args:
+            array: H5Array to iterate over
+            keepdims: keep the dimensions of the array in chunks, i.e. axes indexed by a single index (such as the first
+                axis when iterating row by row) are kept with length 1 instead of being dropped (default: False)
+            poll_interval: number of seconds to wait between two refreshes of the array (default: 0.1)
+            timeout: number of seconds without new rows after which the iteration stops (default: None, never stop)
+        """
+        if array.ndim == 0:
+            raise ValueError("Cannot follow a 0D array.")
+
+        self._array = array
+        self._keepdims = keepdims
+        self._poll_interval = poll_interval
+        self._timeout = timeout
+
+    def __repr__(self) -> str:
+        return f"<FollowingChunkIterator over {self._array.shape} H5Array>"
+
+    def __iter__(
+        self,
+    ) -> Generator[tuple[tuple[FullSlice | SingleIndex, ...], npt.NDArray[Any]], None, None]:
+        start = 0
+        last_read = time.monotonic()
+
+        while True:
+            end = self._array.shape[0]
+
+            if end > start:
+                # iterate over the new rows as over an array of shape (end - start, ...) and shift indices to the rows
+                shape = (end - start, *self._array.shape[1:])
+                chunk_indices = _get_chunk_indices(self._array.chunk_size, shape)
+                work_array = get_work_array(shape, chunk_indices[0], dtype=self._array.dtype)
+
+                for index in chunk_indices:
+                    index = _shift_first_axis(index, start, end)
+                    yield index, self._read_chunk(index, work_array)
+
+                start = end
+                last_read = time.monotonic()
+
+            elif self._timeout is not None and time.monotonic() - last_read >= self._timeout:
+                return
+
+            else:
+                time.sleep(self._poll_interval)
+                self._array.refresh()
 
 
 class PairedChunkIterator:
+    """Iterate over matching chunks of two (or more) arrays, broadcast to a common shape."""
+
     def __init__(
         self,
         arr_1: H5Array[Any] | npt.NDArray[Any],
         arr_2: H5Array[Any] | npt.NDArray[Any],
+        *arrays: H5Array[Any] | npt.NDArray[Any],
         keepdims: bool = False,
     ):
-        broadcasted_shape = np.broadcast_shapes(arr_1.shape, arr_2.shape)
-        self._arr_1 = RepeatedArray(arr_1, broadcasted_shape)
-        self._arr_2 = RepeatedArray(arr_2, broadcasted_shape)
+        broadcasted_shape = np.broadcast_shapes(arr_1.shape, arr_2.shape, *(arr.shape for arr in arrays))
+        self._arrays = [RepeatedArray(arr, broadcasted_shape) for arr in (arr_1, arr_2, *arrays)]
 
         self._keepdims = keepdims
 
-        chunk_size = min(
-            arr_1.chunk_size if isinstance(arr_1, ch5mpy.H5Array) else INF,
-            arr_2.chunk_size if isinstance(arr_2, ch5mpy.H5Array) else INF,
-        )
+        chunk_size = min(arr.chunk_size if isinstance(arr, ch5mpy.H5Array) else INF for arr in (arr_1, arr_2, *arrays))
 
         if np.prod(broadcasted_shape) > 0:
             self._chunk_indices = _get_chunk_indices(chunk_size, shape=arr_1.shape)
-            self._work_array_1 = get_work_array(broadcasted_shape, self._chunk_indices[0], dtype=arr_1.dtype)
-            self._work_array_2 = get_work_array(broadcasted_shape, self._chunk_indices[0], dtype=arr_2.dtype)
+            self._work_arrays = [
+                get_work_array(broadcasted_shape, self._chunk_indices[0], dtype=arr.dtype)
+                for arr in (arr_1, arr_2, *arrays)
+            ]
         else:
             self._chunk_indices = ()
-            self._work_array_1 = np.empty(0)
-            self._work_array_2 = np.empty(0)
+            self._work_arrays = [np.empty(0) for _ in self._arrays]
 
     def __repr__(self) -> str:
-        return f"<PairedChunkIterator over 2 {self._arr_1.shape} arrays>"
+        return f"<PairedChunkIterator over {len(self._arrays)} {self._arrays[0].shape} arrays>"
 
     def __iter__(
         self,
-    ) -> Generator[
-        tuple[tuple[SingleIndex | FullSlice, ...], npt.NDArray[Any], npt.NDArray[Any]],
-        None,
-        None,
-    ]:
+    ) -> Generator[tuple[Any, ...], None, None]:
+        # index of the chunk, then one chunk per array
         for index in self._chunk_indices:
-            work_subset = map_slice(index, shift_to_zero=True)
-            res_1 = self._arr_1.read(self._work_array_1, map_slice(index), work_subset)
-            res_2 = self._arr_2.read(self._work_array_2, map_slice(index), work_subset)
+            selection, work_subset = map_slice(index), map_slice(index, shift_to_zero=True)
+            results = [arr.read(work, selection, work_subset) for arr, work in zip(self._arrays, self._work_arrays)]
 
             if self._keepdims:
-                res_1 = res_1.reshape((1,) * (self._arr_1.ndim - res_1.ndim) + res_1.shape)
-                res_2 = res_2.reshape((1,) * (self._arr_2.ndim - res_2.ndim) + res_2.shape)
+                results = [
+                    res.reshape((1,) * (arr.ndim - res.ndim) + res.shape) for arr, res in zip(self._arrays, results)
+                ]
 
-            yield index, res_1, res_2
+            yield index, *results
 
 
 def iter_chunks_2(
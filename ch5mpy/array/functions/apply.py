@@ -139,6 +139,25 @@ def _get_indices(
     return where_to_compute, selected_index, where_output[selected_index]
 
 
+def _normalize_axis(axis: int, ndim: int) -> int:
+    if not -ndim <= axis < ndim:
+        raise np.AxisError(axis, ndim)
+
+    return axis % ndim
+
+
+def _get_lane_selection(index: tuple[SingleIndex | FullSlice, ...], axis: int) -> tuple[slice, ...]:
+    """
+    Get the selection of lanes (1D sub-arrays along `axis`) crossed by a chunk, in an array of length 1 along `axis`.
+    """
+    return tuple(slice(None) if i == axis else s for i, s in enumerate(map_slice(index)))
+
+
+def _is_first_along(index: tuple[SingleIndex | FullSlice, ...], axis: int) -> bool:
+    """Is this the first chunk crossing its lanes along `axis` ?"""
+    return bool(index[axis].as_slice().start == 0)
+
+
 def _apply_operation(
     operation: ApplyOperation,
     dest: H5Array[Any] | npt.NDArray[Any],
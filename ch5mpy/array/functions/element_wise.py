@@ -9,8 +9,16 @@ import numpy.typing as npt
 from numpy import _NoValue as NoValue  # type: ignore[attr-defined]
 
 from ch5mpy._typing import NP_FUNC
-from ch5mpy.array.functions.apply import ApplyOperation, apply, apply_everywhere
+from ch5mpy.array.functions.apply import (
+    ApplyOperation,
+    _get_lane_selection,
+    _is_first_along,
+    _normalize_axis,
+    apply,
+    apply_everywhere,
+)
 from ch5mpy.array.functions.implement import implements, register
+from ch5mpy.indexing import map_slice
 
 if TYPE_CHECKING:
     from ch5mpy import H5Array
@@ -332,3 +340,101 @@ def diff(
     output_array[len(prepend) + len(a) - 1 :] = np.diff(np.r_[a[-1], append])
 
     return output_array
+
+
+def _cumulative(
+    func: NP_FUNC,
+    combine: NP_FUNC,
+    a: H5Array[Any],
+    axis: int | None,
+    dtype: npt.DTypeLike | None,
+    out: H5Array[Any] | npt.NDArray[Any] | None,
+) -> npt.NDArray[Any] | H5Array[Any]:
+    # special case : 0D array
+    if a.ndim == 0:
+        return func(np.array(a), axis=axis, dtype=dtype, out=out)  # type: ignore[no-any-return]
+
+    dtype = func(np.empty(0, dtype=a.dtype), dtype=dtype).dtype
+    expected_shape = (a.size,) if axis is None else a.shape
+
+    if out is None:
+        out = np.empty(expected_shape, dtype=dtype)
+
+    elif out.shape != expected_shape:
+        raise ValueError(f"Output array has the wrong shape: Found {out.shape} but expected {expected_shape}")
+
+    if not a.size:
+        return out
+
+    # flattened array : chunks are contiguous in C order, carry the last value of a chunk to the next one
+    if axis is None:
+        offset = 0
+        carry: npt.NDArray[Any] | None = None
+
+        for _, chunk in a.iter_chunks():
+            result = func(chunk.ravel(), dtype=dtype)
+
+            if carry is not None:
+                combine(result, carry, out=result)
+
+            out[offset : offset + result.size] = result
+            carry = result[-1]
+            offset += result.size
+
+        return out
+
+    # nD array : carry the last values of each lane crossed by a chunk to the next chunk crossing the same lanes
+    axis = _normalize_axis(axis, a.ndim)
+    carry = np.empty(a.shape[:axis] + (1,) + a.shape[axis + 1 :], dtype=dtype)
+
+    for index, chunk in a.iter_chunks(keepdims=True):
+        result = func(chunk, axis=axis, dtype=dtype)
+        lane = _get_lane_selection(index, axis)
+
+        if not _is_first_along(index, axis):
+            combine(result, carry[lane], out=result)
+
+        carry[lane] = result.take([-1], axis=axis)
+        out[map_slice(index)] = result
+
+    return out
+
+
+@implements(np.cumsum)
+def cumsum(
+    a: H5Array[Any],
+    axis: int | None = None,
+    dtype: npt.DTypeLike | None = None,
+    out: H5Array[Any] | npt.NDArray[Any] | None = None,
+) -> npt.NDArray[Any] | H5Array[Any]:
+    return _cumulative(np.cumsum, np.add, a, axis, dtype, out)
+
+
+@implements(np.cumprod)
+def cumprod(
+    a: H5Array[Any],
+    axis: int | None = None,
+    dtype: npt.DTypeLike | None = None,
+    out: H5Array[Any] | npt.NDArray[Any] | None = None,
+) -> npt.NDArray[Any] | H5Array[Any]:
+    return _cumulative(np.cumprod, np.multiply, a, axis, dtype, out)
+
+
+@implements(np.nancumsum)
+def nancumsum(
+    a: H5Array[Any],
+    axis: int | None = None,
+    dtype: npt.DTypeLike | None = None,
+    out: H5Array[Any] | npt.NDArray[Any] | None = None,
+) -> npt.NDArray[Any] | H5Array[Any]:
+    return _cumulative(np.nancumsum, np.add, a, axis, dtype, out)
+
+
+@implements(np.nancumprod)
+def nancumprod(
+    a: H5Array[Any],
+    axis: int | None = None,
+    dtype: npt.DTypeLike | None = None,
+    out: H5Array[Any] | npt.NDArray[Any] | None = None,
+) -> npt.NDArray[Any] | H5Array[Any]:
+    return _cumulative(np.nancumprod, np.multiply, a, axis, dtype, out)
@@ -0,0 +1,303 @@
+from __future__ import annotations
+
+import tempfile
+from functools import partial
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Literal
+
+import numpy as np
+import numpy.typing as npt
+
+import ch5mpy
+from ch5mpy.array.chunks.iter import PairedChunkIterator, _get_chunk_indices
+from ch5mpy.array.functions.apply import _normalize_axis
+from ch5mpy.array.functions.implement import register
+from ch5mpy.indexing import map_slice
+from ch5mpy.names import H5Mode
+
+if TYPE_CHECKING:
+    from ch5mpy import H5Array
+
+
+GROUP_FUNC = Literal["sum", "prod", "min", "max", "count", "mean"]
+
+# ufuncs used to combine the partial results stored in each column of a group table
+_GROUP_UFUNCS: dict[str, tuple[np.ufunc, ...]] = {
+    "sum": (np.add,),
+    "prod": (np.multiply,),
+    "min": (np.minimum,),
+    "max": (np.maximum,),
+    "count": (np.add,),
+    "mean": (np.add, np.add),
+}
+
+
+# reduceat --------------------------------------------------------------------
+def reduceat(
+    array: H5Array[Any],
+    indices: npt.ArrayLike,
+    axis: int = 0,
+    dtype: npt.DTypeLike | None = None,
+    out: tuple[H5Array[Any] | npt.NDArray[Any]] | H5Array[Any] | npt.NDArray[Any] | None = None,
+    *,
+    np_ufunc: np.ufunc,
+) -> Any:
+    if isinstance(out, tuple):
+        out = out[0]
+
+    # special case : 0D array
+    if array.ndim == 0:
+        return np_ufunc.reduceat(np.array(array), indices, axis=axis, dtype=dtype, out=out)
+
+    indices = np.asarray(indices, dtype=np.intp)
+    if indices.ndim != 1:
+        raise ValueError("index array must be 1-D")
+
+    axis = _normalize_axis(axis, array.ndim)
+    length = array.shape[axis]
+
+    out_of_bounds = (indices < 0) | (indices >= length)
+    if np.any(out_of_bounds):
+        raise IndexError(
+            f"index {indices[out_of_bounds][0]} out-of-bounds in {np_ufunc.__name__}.reduceat [0, {length})"
+        )
+
+    # segment i spans [indices[i], stops[i]), or only indices[i] when indices are not increasing
+    stops = np.append(indices[1:], length)
+    stops = np.where(stops > indices, stops, indices + 1)
+
+    dtype = np_ufunc.reduceat(np.zeros(1, dtype=array.dtype), [0], dtype=dtype).dtype
+    other_shape = array.shape[:axis] + array.shape[axis + 1 :]
+    expected_shape = array.shape[:axis] + (len(indices),) + array.shape[axis + 1 :]
+
+    if out is not None and out.shape != expected_shape:
+        raise ValueError(f"Output array has the wrong shape: Found {out.shape} but expected {expected_shape}")
+
+    # compute with the reduction axis first : each chunk spans a range along `axis` and a box in other axes
+    result = np.empty((len(indices),) + other_shape, dtype=dtype)
+
+    for index in _get_chunk_indices(array.chunk_size, (length,) + other_shape) if len(indices) else ():
+        axis_range, *box = map_slice(index)
+        segments = np.flatnonzero((indices < axis_range.stop) & (stops > axis_range.start))
+
+        if not len(segments):
+            continue
+
+        block = np.asarray(array[tuple(box[:axis]) + (axis_range,) + tuple(box[axis:])])
+        block = np.moveaxis(block, axis, 0)
+
+        # reduce all segments crossing the block at once with interleaved (start, stop) indices, the block is padded
+        # with one element to allow stops at the end of the block
+        local_starts = np.maximum(indices[segments], axis_range.start) - axis_range.start
+        local_stops = np.minimum(stops[segments], axis_range.stop) - axis_range.start
+        partials = np_ufunc.reduceat(
+            np.concatenate((block, block[:1])),
+            np.column_stack((local_starts, local_stops)).ravel(),
+            axis=0,
+            dtype=dtype,
+        )[::2]
+
+        # combine with partial results from previous blocks for segments that started before this block
+        continued = indices[segments] < axis_range.start
+        selection = (segments,) + tuple(box)
+        partials[continued] = np_ufunc(result[selection][continued], partials[continued])
+        result[selection] = partials
+
+    result = np.moveaxis(result, 0, axis)
+
+    if out is not None:
+        out[()] = result
+        return out
+
+    return result
+
+
+for _ufunc in (np.add, np.multiply, np.minimum, np.maximum, np.logical_and, np.logical_or):
+    register(partial(reduceat, np_ufunc=_ufunc), _ufunc.reduceat)
+
+
+# group by --------------------------------------------------------------------
+def _reduce_by_key(
+    keys: npt.NDArray[Any], columns: list[npt.NDArray[Any]], ufuncs: tuple[np.ufunc, ...]
+) -> tuple[npt.NDArray[Any], list[npt.NDArray[Any]]]:
+    """Sort keys and reduce values in columns sharing the same key."""
+    if not len(keys):
+        return keys, columns
+
+    order = np.argsort(keys, kind="stable")
+    keys = keys[order]
+    starts = np.flatnonzero(np.concatenate(([True], keys[1:] != keys[:-1])))
+
+    return keys[starts], [ufunc.reduceat(column[order], starts) for column, ufunc in zip(columns, ufuncs)]
+
+
+class _GroupTable:
+    """
+    In-memory table of partial reductions, sorted by key. When the table grows larger than the memory budget, it is
+    spilled to a temporary file as a sorted run and all runs are merged when computing the final result.
+    """
+
+    # region magic methods
+    def __init__(self, ufuncs: tuple[np.ufunc, ...], budget: int, spill_directory: str):
+        self._ufuncs = ufuncs
+        self._budget = budget
+        self._spill_path = Path(spill_directory) / "runs.h5"
+        self._spill_file: ch5mpy.File | None = None
+        self._runs: list[ch5mpy.Group] = []
+
+        self._keys: npt.NDArray[Any] | None = None
+        self._columns: list[npt.NDArray[Any]] = []
+
+    # endregion
+
+    # region methods
+    def add(self, keys: npt.NDArray[Any], columns: list[npt.NDArray[Any]]) -> None:
+        keys, columns = _reduce_by_key(keys, columns, self._ufuncs)
+
+        if self._keys is not None:
+            keys, columns = _reduce_by_key(
+                np.concatenate((self._keys, keys)),
+                [np.concatenate((table_column, column)) for table_column, column in zip(self._columns, columns)],
+                self._ufuncs,
+            )
+
+        self._keys, self._columns = keys, columns
+
+        if len(self._keys) > self._budget:
+            self._spill()
+
+    def _spill(self) -> None:
+        if self._keys is None:
+            return
+
+        if self._spill_file is None:
+            self._spill_file = ch5mpy.File(self._spill_path, mode=H5Mode.WRITE_TRUNCATE)
+
+        run = self._spill_file.create_group(f"run_{len(self._runs)}")
+        ch5mpy.write_dataset(self._keys, run, "keys")
+        for i, column in enumerate(self._columns):
+            ch5mpy.write_dataset(column, run, f"column_{i}")
+        self._runs.append(run)
+
+        self._keys, self._columns = None, []
+
+    def _merge_runs(self) -> tuple[npt.NDArray[Any], list[npt.NDArray[Any]]]:
+        """K-way merge of sorted runs, read by blocks."""
+        block_size = max(1, self._budget // len(self._runs))
+        cursors = [0 for _ in self._runs]
+        lengths = [len(run["keys"]) for run in self._runs]
+
+        merged_keys: list[npt.NDArray[Any]] = []
+        merged_columns: list[list[npt.NDArray[Any]]] = [[] for _ in self._ufuncs]
+        pending_keys = np.empty(0, dtype=self._runs[0]["keys"].dtype)
+        pending_columns = [np.empty(0, dtype=self._runs[0][f"column_{i}"].dtype) for i in range(len(self._ufuncs))]
+
+        while any(cursor < length for cursor, length in zip(cursors, lengths)):
+            frontier = None
+
+            for i, run in enumerate(self._runs):
+                if cursors[i] == lengths[i]:
+                    continue
+
+                block = slice(cursors[i], min(cursors[i] + block_size, lengths[i]))
+                pending_keys = np.concatenate((pending_keys, run["keys"][block]))
+                pending_columns = [
+                    np.concatenate((pending_column, run[f"column_{c}"][block]))
+                    for c, pending_column in enumerate(pending_columns)
+                ]
+                cursors[i] = block.stop
+
+                # keys of a run that is not exhausted yet can still receive contributions from its next blocks
+                if cursors[i] < lengths[i]:
+                    last_key = pending_keys[-1]
+                    frontier = last_key if frontier is None else min(frontier, last_key)
+
+            pending_keys, pending_columns = _reduce_by_key(pending_keys, pending_columns, self._ufuncs)
+            nb_final = len(pending_keys) if frontier is None else int(np.searchsorted(pending_keys, frontier))
+
+            merged_keys.append(pending_keys[:nb_final])
+            pending_keys = pending_keys[nb_final:]
+
+            for merged_column, pending_column in zip(merged_columns, pending_columns):
+                merged_column.append(pending_column[:nb_final])
+
+            pending_columns = [pending_column[nb_final:] for pending_column in pending_columns]
+
+        return np.concatenate(merged_keys), [np.concatenate(column) for column in merged_columns]
+
+    def result(self) -> tuple[npt.NDArray[Any] | None, list[npt.NDArray[Any]]]:
+        if not len(self._runs):
+            return self._keys, self._columns
+
+        self._spill()
+
+        try:
+            return self._merge_runs()
+
+        finally:
+            assert self._spill_file is not None
+            self._spill_file.close()
+
+    # endregion
+
+
+def _get_columns(func: GROUP_FUNC, values: npt.NDArray[Any]) -> list[npt.NDArray[Any]]:
+    if func == "sum":
+        return [values.astype(np.sum(np.empty(0, dtype=values.dtype)).dtype)]
+
+    if func == "prod":
+        return [values.astype(np.prod(np.empty(0, dtype=values.dtype)).dtype)]
+
+    if func == "count":
+        return [np.ones(len(values), dtype=np.intp)]
+
+    if func == "mean":
+        return [values.astype(np.float64), np.ones(len(values), dtype=np.intp)]
+
+    return [values]
+
+
+def group_reduce(
+    values: H5Array[Any] | npt.NDArray[Any],
+    keys: H5Array[Any] | npt.NDArray[Any],
+    func: GROUP_FUNC = "sum",
+) -> tuple[npt.NDArray[Any], npt.NDArray[Any]]:
+    """
+    Reduce values sharing the same key, e.g. compute per-group sums where group ids are stored in another array.
+    Both arrays are read chunk by chunk and partial results are kept in a table sorted by key. For high-cardinality
+    keys, sorted parts of this table are spilled to a temporary file and merged at the end.
+
+    Args:
+        values: array of values to reduce.
+        keys: array of keys (group ids) of the same shape as `values`.
+        func: reduction to compute for each group, one of 'sum', 'prod', 'min', 'max', 'count' or 'mean'.
+
+    Returns:
+        The sorted unique keys and the reduced value for each key.
+    """
+    if func not in _GROUP_UFUNCS:
+        raise ValueError(f"'func' must be one of {tuple(_GROUP_UFUNCS)}, got '{func}'.")
+
+    if values.shape != keys.shape:
+        raise ValueError(f"values and keys must have the same shape, got {values.shape} and {keys.shape}.")
+
+    budget = min(
+        values.chunk_size if isinstance(values, ch5mpy.H5Array) else len(values),
+        keys.chunk_size if isinstance(keys, ch5mpy.H5Array) else len(keys),
+    )
+
+    with tempfile.TemporaryDirectory() as spill_directory:
+        table = _GroupTable(_GROUP_UFUNCS[func], max(1, budget), spill_directory)
+
+        for _, values_chunk, keys_chunk in PairedChunkIterator(values, keys):
+            table.add(keys_chunk.ravel(), _get_columns(func, values_chunk.ravel()))
+
+        unique_keys, columns = table.result()
+
+    if unique_keys is None:
+        return np.empty(0, dtype=keys.dtype), _get_columns(func, np.empty(0, dtype=values.dtype))[0]
+
+    if func == "mean":
+        return unique_keys, columns[0] / columns[1]
+
+    return unique_keys, columns[0]
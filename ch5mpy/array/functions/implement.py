@@ -30,3 +30,6 @@ importlib.__import__("ch5mpy.array.functions.creation_routines")
 importlib.__import__("ch5mpy.array.functions.two_arrays")
 importlib.__import__("ch5mpy.array.functions.element_wise")
 importlib.__import__("ch5mpy.array.functions.attributes")
+importlib.__import__("ch5mpy.array.functions.statistics")
+importlib.__import__("ch5mpy.array.functions.searching")
+importlib.__import__("ch5mpy.array.functions.grouping")
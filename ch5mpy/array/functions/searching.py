@@ -0,0 +1,191 @@
+from __future__ import annotations
+
+from functools import partial
+from typing import TYPE_CHECKING, Any
+
+import numpy as np
+import numpy.typing as npt
+
+from ch5mpy._typing import NP_FUNC
+from ch5mpy.array.functions.apply import (
+    ApplyOperation,
+    _get_lane_selection,
+    _is_first_along,
+    _normalize_axis,
+    apply_everywhere,
+)
+from ch5mpy.array.functions.implement import implements
+from ch5mpy.indexing import FullSlice, SingleIndex, map_slice
+
+if TYPE_CHECKING:
+    from ch5mpy import H5Array
+
+
+def _get_start(index: tuple[SingleIndex | FullSlice, ...]) -> tuple[int, ...]:
+    """Get the coordinates of the first element of a chunk in the whole array."""
+    return tuple(s.start for s in map_slice(index))
+
+
+def _get_flat_start(index: tuple[SingleIndex | FullSlice, ...], shape: tuple[int, ...]) -> int:
+    """Get the flat index of the first element of a chunk (chunks are contiguous in C order)."""
+    return int(np.ravel_multi_index(_get_start(index), shape))
+
+
+# argmax / argmin -------------------------------------------------------------
+def _arg_extremum(
+    func: NP_FUNC,
+    better: NP_FUNC,
+    a: H5Array[Any],
+    axis: int | None,
+    out: npt.NDArray[np.intp] | None,
+    keepdims: bool,
+) -> Any:
+    # special case : 0D array
+    if a.ndim == 0:
+        return func(np.array(a), axis=axis, out=out, keepdims=keepdims)
+
+    if a.size == 0:
+        raise ValueError(f"attempt to get {func.__name__} of an empty sequence")
+
+    can_be_nan = a.dtype.kind in "fc"
+
+    # flattened array : keep the first best value, NaNs win over any other value as in numpy
+    if axis is None:
+        best_index, best_value = 0, None
+
+        for index, chunk in a.iter_chunks():
+            local_index = int(func(chunk))
+            value = chunk.flat[local_index]
+
+            if best_value is None or better(value, best_value) or (can_be_nan and np.isnan(value)):
+                best_index, best_value = _get_flat_start(index, a.shape) + local_index, value
+
+            if can_be_nan and np.isnan(best_value):
+                break
+
+        result = np.array(best_index, dtype=np.intp).reshape((1,) * a.ndim if keepdims else ())
+
+    # nD array : keep the best value and its index for each lane along `axis`
+    else:
+        axis = _normalize_axis(axis, a.ndim)
+        lanes_shape = a.shape[:axis] + (1,) + a.shape[axis + 1 :]
+        best_values = np.empty(lanes_shape, dtype=a.dtype)
+        result = np.empty(lanes_shape, dtype=np.intp)
+
+        for index, chunk in a.iter_chunks(keepdims=True):
+            local_index = func(chunk, axis=axis, keepdims=True)
+            values = np.take_along_axis(chunk, local_index, axis=axis)
+            lane = _get_lane_selection(index, axis)
+
+            if _is_first_along(index, axis):
+                replace = np.ones(values.shape, dtype=bool)
+
+            else:
+                replace = better(values, best_values[lane])
+
+                if can_be_nan:
+                    replace |= np.isnan(values) & ~np.isnan(best_values[lane])
+
+            best_values[lane] = np.where(replace, values, best_values[lane])
+            result[lane] = np.where(replace, local_index + index[axis].as_slice().start, result[lane])
+
+        if not keepdims:
+            result = result.reshape(a.shape[:axis] + a.shape[axis + 1 :])
+
+    if out is not None:
+        out[...] = result
+        return out
+
+    return result[()]
+
+
+@implements(np.argmax)
+def argmax(
+    a: H5Array[Any],
+    axis: int | None = None,
+    out: npt.NDArray[np.intp] | None = None,
+    *,
+    keepdims: bool = False,
+) -> Any:
+    return _arg_extremum(np.argmax, np.greater, a, axis, out, keepdims)
+
+
+@implements(np.argmin)
+def argmin(
+    a: H5Array[Any],
+    axis: int | None = None,
+    out: npt.NDArray[np.intp] | None = None,
+    *,
+    keepdims: bool = False,
+) -> Any:
+    return _arg_extremum(np.argmin, np.less, a, axis, out, keepdims)
+
+
+# non-zero elements -----------------------------------------------------------
+@implements(np.count_nonzero)
+def count_nonzero(
+    a: H5Array[Any],
+    axis: int | tuple[int, ...] | None = None,
+    *,
+    keepdims: bool = False,
+) -> Any:
+    return apply_everywhere(
+        partial(np.count_nonzero, axis=axis, keepdims=keepdims),
+        ApplyOperation.iadd,
+        a,
+        None,
+        dtype=np.intp,
+        initial=0,
+    )
+
+
+def _fill_nonzero(a: H5Array[Any], out: npt.NDArray[np.intp]) -> npt.NDArray[np.intp]:
+    """
+    Write the coordinates of non-zero elements (one row per element) into a pre-allocated array, chunk by chunk.
+    Coordinates are in C order since chunks are contiguous in C order.
+    """
+    position = 0
+
+    for index, chunk in a.iter_chunks(keepdims=True):
+        coordinates = np.argwhere(chunk)
+        out[position : position + len(coordinates)] = coordinates + _get_start(index)
+        position += len(coordinates)
+
+    return out
+
+
+@implements(np.argwhere)
+def argwhere(a: H5Array[Any]) -> npt.NDArray[np.intp]:
+    if a.ndim == 0:
+        return np.argwhere(np.array(a))
+
+    # count non-zero elements first to allocate the result once and fill it incrementally
+    return _fill_nonzero(a, np.empty((count_nonzero(a), a.ndim), dtype=np.intp))
+
+
+@implements(np.nonzero)
+def nonzero(a: H5Array[Any]) -> tuple[npt.NDArray[np.intp], ...]:
+    if a.ndim == 0:
+        raise ValueError("Calling nonzero on 0d arrays is not allowed. Use np.atleast_1d(scalar).nonzero() instead.")
+
+    # fill a (ndim, n) array through its transposed view to get contiguous index arrays for each dimension
+    coordinates = np.empty((a.ndim, count_nonzero(a)), dtype=np.intp)
+    _fill_nonzero(a, coordinates.T)
+
+    return tuple(coordinates)
+
+
+@implements(np.flatnonzero)
+def flatnonzero(a: H5Array[Any]) -> npt.NDArray[np.intp]:
+    if a.ndim == 0:
+        return np.flatnonzero(np.array(a))
+
+    result = np.empty(count_nonzero(a), dtype=np.intp)
+    position = 0
+
+    for index, chunk in a.iter_chunks():
+        flat_indices = np.flatnonzero(chunk)
+        result[position : position + len(flat_indices)] = flat_indices + _get_flat_start(index, a.shape)
+        position += len(flat_indices)
+
+    return result
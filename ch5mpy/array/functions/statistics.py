@@ -0,0 +1,486 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any, Generator, Literal, cast
+
+import numpy as np
+import numpy.typing as npt
+
+import ch5mpy
+from ch5mpy.array.chunks.iter import PairedChunkIterator, _get_chunk_indices
+from ch5mpy.array.functions.apply import _normalize_axis
+from ch5mpy.array.functions.implement import implements
+from ch5mpy.array.sketch import QuantileSketch
+from ch5mpy.indexing import FullSlice, SingleIndex, map_slice
+
+if TYPE_CHECKING:
+    from ch5mpy import H5Array
+
+
+# "approximate" estimates quantiles from a sketch, in a single pass over arrays (or lanes along an axis) that do not fit
+# in memory, others are computed exactly as with the "linear" method
+QUANTILE_METHOD = Literal["linear", "lower", "higher", "midpoint", "nearest", "approximate"]
+_QUANTILE_METHODS = ("linear", "lower", "higher", "midpoint", "nearest", "approximate")
+_NB_BUCKETS = 1024
+
+
+# exact selection -------------------------------------------------------------
+class _RankSearch:
+    """
+    Search for the values at given ranks (in the sorted array), knowing that those values are in the interval [lo, hi]
+    (or [lo, hi[ if `hi_included` is False) and that `below` values of the array are smaller than `lo`.
+    """
+
+    # region magic methods
+    def __init__(self, ranks: npt.NDArray[np.int64], lo: Any, hi: Any, hi_included: bool, below: int):
+        self.ranks = ranks
+        self.lo = lo
+        self.hi = hi
+        self.hi_included = hi_included
+        self.below = below
+
+        self.count = 0
+        self.min: Any = None
+        self.max: Any = None
+        self.collected: list[npt.NDArray[Any]] | None = []
+        self.edges = self._get_edges()
+        self.histogram = np.zeros(len(self.edges) + 1, dtype=np.int64)
+
+    # endregion
+
+    # region methods
+    def _get_edges(self) -> npt.NDArray[Any]:
+        if np.asarray(self.lo).dtype.kind in "iu":
+            lo, span = int(self.lo), int(self.hi) - int(self.lo)
+            edges = np.array([lo + i * span // _NB_BUCKETS for i in range(1, _NB_BUCKETS)], dtype=type(self.lo))
+
+        else:
+            with np.errstate(over="ignore", invalid="ignore"):
+                edges = np.linspace(self.lo, self.hi, _NB_BUCKETS + 1)[1:-1]
+
+        edges = np.unique(edges[(edges > self.lo) & (edges < self.hi)])
+
+        # always isolate values equal to `hi` to guarantee progress once the interval is reduced to [min, max]
+        if self.hi_included:
+            edges = np.append(edges, self.hi)
+
+        return edges
+
+    def update(self, chunk: npt.NDArray[Any], budget: int) -> None:
+        mask = chunk >= self.lo
+        mask &= (chunk <= self.hi) if self.hi_included else (chunk < self.hi)
+        values = chunk[mask]
+
+        if not values.size:
+            return
+
+        self.count += values.size
+        self.min = values.min() if self.min is None else min(self.min, values.min())
+        self.max = values.max() if self.max is None else max(self.max, values.max())
+        self.histogram += np.bincount(
+            np.searchsorted(self.edges, values, side="right"), minlength=len(self.histogram)
+        )
+
+        if self.collected is not None:
+            if self.count <= budget:
+                self.collected.append(values)
+
+            else:
+                self.collected = None
+
+    def refine(self, values: dict[int, Any]) -> list[_RankSearch]:
+        """
+        Store values at ranks that could be resolved during the last pass and get the searches for the remaining ranks.
+        """
+        if self.collected is not None:
+            in_interval = np.sort(np.concatenate(self.collected))
+
+            for rank in self.ranks:
+                values[int(rank)] = in_interval[rank - self.below]
+
+            return []
+
+        if self.min == self.max:
+            for rank in self.ranks:
+                values[int(rank)] = self.min
+
+            return []
+
+        cumulative = np.cumsum(self.histogram)
+        buckets = np.searchsorted(cumulative, self.ranks - self.below, side="right")
+
+        # no progress : all values of the interval are in the same bucket, reduce the interval to [min, max]
+        if np.all(self.histogram[buckets] == self.count):
+            return [_RankSearch(self.ranks, self.min, self.max, True, self.below)]
+
+        searches = []
+        for bucket in np.unique(buckets):
+            lo = self.lo if bucket == 0 else self.edges[bucket - 1]
+            hi, hi_included = (
+                (self.edges[bucket], False) if bucket < len(self.edges) else (self.hi, self.hi_included)
+            )
+            below = self.below + (int(cumulative[bucket - 1]) if bucket else 0)
+
+            searches.append(_RankSearch(self.ranks[buckets == bucket], lo, hi, hi_included, below))
+
+        return searches
+
+    # endregion
+
+
+def _get_values_at_ranks(a: H5Array[Any], ranks: npt.NDArray[np.int64], lo: Any, hi: Any, below: int) -> dict[int, Any]:
+    """
+    Find the values at given ranks in the flattened and sorted array by iteratively refining a histogram of values in
+    [lo, hi], knowing that `below` values are smaller than `lo`. Each pass over the array reduces the interval
+    containing the values of interest until they fit in memory.
+    """
+    values: dict[int, Any] = {}
+    searches = [_RankSearch(ranks, lo, hi, True, below)]
+
+    while len(searches):
+        budget = max(1, a.chunk_size // len(searches))
+
+        for _, chunk in a.iter_chunks():
+            for search in searches:
+                search.update(chunk, budget)
+
+        searches = [new_search for search in searches for new_search in search.refine(values)]
+
+    return values
+
+
+def _lerp(below: npt.NDArray[Any], above: npt.NDArray[Any], t: npt.NDArray[Any] | float) -> npt.NDArray[Any]:
+    """Linear interpolation between two values, computed as in numpy for numerical stability."""
+    diff = np.subtract(above, below)
+    return np.where(
+        np.asarray(t) >= 0.5, np.subtract(above, diff * (1 - np.asarray(t))), np.add(below, diff * t)
+    )
+
+
+def _quantile_1d(a: H5Array[Any], q: npt.NDArray[np.float64], method: QUANTILE_METHOD) -> npt.NDArray[Any]:
+    """Compute quantiles of the flattened array `a`."""
+    if a.size <= a.chunk_size:
+        # the array fits in memory : exact quantiles, even for the "approximate" method
+        return np.quantile(  # type: ignore[no-any-return]
+            np.asarray(a), q, method="linear" if method == "approximate" else method
+        )
+
+    if method == "approximate":
+        sketch = QuantileSketch()
+
+        for _, chunk in a.iter_chunks():
+            sketch.update(chunk)
+
+        return sketch.quantile(q)
+
+    # infinite values are counted apart, the search for values at other ranks is done in the range of finite values
+    n, lo, hi, has_nan, n_neg_inf, n_pos_inf = 0, None, None, False, 0, 0
+    for _, chunk in a.iter_chunks():
+        if chunk.dtype.kind in "fc" and np.isnan(chunk).any():
+            has_nan = True
+            break
+
+        n += chunk.size
+
+        if chunk.dtype.kind == "f":
+            n_neg_inf += int(np.count_nonzero(chunk == -np.inf))
+            n_pos_inf += int(np.count_nonzero(chunk == np.inf))
+            chunk = chunk[np.isfinite(chunk)]
+
+            if not chunk.size:
+                continue
+
+        lo = chunk.min() if lo is None else min(lo, chunk.min())
+        hi = chunk.max() if hi is None else max(hi, chunk.max())
+
+    if has_nan:
+        return np.full(q.shape, np.nan)
+
+    virtual_rank = q * (n - 1)
+    below, above = np.floor(virtual_rank).astype(np.int64), np.ceil(virtual_rank).astype(np.int64)
+
+    if method == "lower":
+        above = below
+
+    elif method == "higher":
+        below = above
+
+    elif method == "nearest":
+        below = above = np.around(virtual_rank).astype(np.int64)
+
+    ranks = np.unique(np.concatenate((below, above)))
+    is_finite = (ranks >= n_neg_inf) & (ranks < n - n_pos_inf)
+
+    values = {int(rank): -np.inf if rank < n_neg_inf else np.inf for rank in ranks[~is_finite]}
+    if is_finite.any():
+        values |= _get_values_at_ranks(a, ranks[is_finite], lo, hi, n_neg_inf)
+
+    values_below = np.array([values[r] for r in below], dtype=a.dtype)
+    values_above = np.array([values[r] for r in above], dtype=a.dtype)
+
+    if method == "linear":
+        return _lerp(values_below.astype(np.float64), values_above.astype(np.float64), virtual_rank - below)
+
+    if method == "midpoint":
+        return _lerp(values_below.astype(np.float64), values_above.astype(np.float64), 0.5)
+
+    return values_below
+
+
+def _quantile(
+    a: H5Array[Any],
+    q: npt.NDArray[np.float64],
+    axis: int | tuple[int, ...] | None,
+    out: npt.NDArray[Any] | None,
+    method: QUANTILE_METHOD,
+    keepdims: bool,
+) -> Any:
+    if method not in _QUANTILE_METHODS:
+        raise ValueError(f"'method' must be one of {_QUANTILE_METHODS}, got '{method}'.")
+
+    if isinstance(axis, tuple):
+        raise NotImplementedError("Quantiles along multiple axes are not supported.")
+
+    # special case : 0D and empty arrays
+    if a.ndim == 0 or a.size == 0:
+        return np.quantile(
+            np.asarray(a),
+            q,
+            axis=axis,
+            out=out,
+            method="linear" if method == "approximate" else method,
+            keepdims=keepdims,
+        )
+
+    dtype = np.quantile(np.zeros(1, dtype=a.dtype), 0.5, method="linear" if method == "approximate" else method).dtype
+
+    if axis is None:
+        result = _quantile_1d(a, q.ravel(), method).astype(dtype).reshape(q.shape + (1,) * a.ndim * keepdims)
+
+    else:
+        axis = _normalize_axis(axis, a.ndim)
+        lanes_shape = a.shape[:axis] + (1,) + a.shape[axis + 1 :]
+        result = np.empty((q.size,) + lanes_shape, dtype=dtype)
+        lanes_budget = a.chunk_size // a.shape[axis]
+
+        if lanes_budget > 1:
+            # load blocks of whole lanes along `axis` and compute quantiles in memory
+            for index in _get_chunk_indices(lanes_budget, lanes_shape):
+                lanes = map_slice(index)
+                block = np.asarray(a[lanes[:axis] + (slice(None),) + lanes[axis + 1 :]])
+                result[(slice(None),) + lanes] = np.quantile(
+                    block, q.ravel(), axis=axis, method="linear" if method == "approximate" else method, keepdims=True
+                )
+
+        else:
+            # lanes are too large to fit in memory, compute quantiles lane by lane
+            for lane in np.ndindex(lanes_shape):
+                result[(slice(None),) + lane] = _quantile_1d(
+                    a[lane[:axis] + (slice(None),) + lane[axis + 1 :]], q.ravel(), method
+                )
+
+        result = result.reshape(q.shape + (lanes_shape if keepdims else a.shape[:axis] + a.shape[axis + 1 :]))
+
+    if out is not None:
+        out[...] = result
+        return out
+
+    return result[()]
+
+
+@implements(np.quantile)
+def quantile(
+    a: H5Array[Any],
+    q: npt.ArrayLike,
+    axis: int | tuple[int, ...] | None = None,
+    out: npt.NDArray[Any] | None = None,
+    overwrite_input: bool = False,
+    method: QUANTILE_METHOD = "linear",
+    keepdims: bool = False,
+    *,
+    interpolation: QUANTILE_METHOD | None = None,
+) -> Any:
+    q = np.asanyarray(q, dtype=np.float64)
+    if np.any((q < 0) | (q > 1)):
+        raise ValueError("Quantiles must be in the range [0, 1]")
+
+    return _quantile(a, q, axis, out, method if interpolation is None else interpolation, keepdims)
+
+
+@implements(np.percentile)
+def percentile(
+    a: H5Array[Any],
+    q: npt.ArrayLike,
+    axis: int | tuple[int, ...] | None = None,
+    out: npt.NDArray[Any] | None = None,
+    overwrite_input: bool = False,
+    method: QUANTILE_METHOD = "linear",
+    keepdims: bool = False,
+    *,
+    interpolation: QUANTILE_METHOD | None = None,
+) -> Any:
+    q = np.true_divide(q, 100)
+    if np.any((q < 0) | (q > 1)):
+        raise ValueError("Percentiles must be in the range [0, 100]")
+
+    return _quantile(
+        a, cast(npt.NDArray[np.float64], q), axis, out, method if interpolation is None else interpolation, keepdims
+    )
+
+
+@implements(np.median)
+def median(
+    a: H5Array[Any],
+    axis: int | tuple[int, ...] | None = None,
+    out: npt.NDArray[Any] | None = None,
+    overwrite_input: bool = False,
+    keepdims: bool = False,
+) -> Any:
+    return _quantile(a, np.array(0.5), axis, out, "linear", keepdims)
+
+
+# histograms ------------------------------------------------------------------
+def _min_max(a: H5Array[Any] | npt.NDArray[Any]) -> tuple[Any, Any]:
+    """Get the min and max values of an array in a single pass."""
+    if not isinstance(a, ch5mpy.H5Array):
+        return a.min(), a.max()
+
+    lo, hi = None, None
+    for _, chunk in a.iter_chunks():
+        lo = chunk.min() if lo is None else min(lo, chunk.min())
+        hi = chunk.max() if hi is None else max(hi, chunk.max())
+
+    return lo, hi
+
+
+def _get_bin_edges(
+    a: H5Array[Any] | npt.NDArray[Any], bins: int | npt.ArrayLike, range: tuple[float, float] | None
+) -> npt.NDArray[Any]:
+    """Get bin edges, with a min/max pre-pass over the array when the range of values needs to be inferred."""
+    if isinstance(bins, str):
+        raise NotImplementedError("Automatic estimation of the number of bins is not supported.")
+
+    if np.ndim(bins) > 0:
+        return np.asarray(bins)
+
+    if range is None:
+        range = _min_max(a) if a.size else (0, 1)
+
+    return np.histogram_bin_edges(np.empty(0, dtype=a.dtype), cast(int, bins), range=range)
+
+
+def _check_weights(
+    a: H5Array[Any] | npt.NDArray[Any], weights: H5Array[Any] | npt.NDArray[Any] | None
+) -> H5Array[Any] | npt.NDArray[Any] | None:
+    if weights is None:
+        return None
+
+    weights = weights if isinstance(weights, ch5mpy.H5Array) else np.asarray(weights)
+    if weights.shape != a.shape:
+        raise ValueError("weights should have the same shape as a.")
+
+    return weights
+
+
+def _iter_with_weights(
+    a: H5Array[Any] | npt.NDArray[Any], weights: H5Array[Any] | npt.NDArray[Any] | None
+) -> Generator[tuple[tuple[SingleIndex | FullSlice, ...], npt.NDArray[Any], npt.NDArray[Any] | None], None, None]:
+    if weights is None:
+        for index, chunk in cast("H5Array[Any]", a).iter_chunks():
+            yield index, chunk, None
+
+    else:
+        yield from PairedChunkIterator(a, weights)
+
+
+@implements(np.histogram)
+def histogram(
+    a: H5Array[Any] | npt.NDArray[Any],
+    bins: int | npt.ArrayLike = 10,
+    range: tuple[float, float] | None = None,
+    density: bool | None = None,
+    weights: H5Array[Any] | npt.NDArray[Any] | None = None,
+) -> tuple[npt.NDArray[Any], npt.NDArray[Any]]:
+    weights = _check_weights(a, weights)
+    edges = _get_bin_edges(a, bins, range)
+
+    # count values in each chunk with the same arguments as numpy to get identical results
+    bins_args: dict[str, Any] = (
+        {"bins": edges} if np.ndim(bins) > 0 else {"bins": len(edges) - 1, "range": (edges[0], edges[-1])}
+    )
+    counts = np.histogram(
+        np.empty(0, dtype=a.dtype), weights=None if weights is None else np.empty(0, weights.dtype), **bins_args
+    )[0]
+
+    for _, chunk, chunk_weights in _iter_with_weights(a, weights):
+        counts += np.histogram(chunk, weights=chunk_weights, **bins_args)[0]
+
+    if density:
+        return counts / np.diff(edges) / counts.sum(), edges
+
+    return counts, edges
+
+
+@implements(np.histogram2d)
+def histogram2d(
+    x: H5Array[Any] | npt.NDArray[Any],
+    y: H5Array[Any] | npt.NDArray[Any],
+    bins: int | npt.ArrayLike = 10,
+    range: npt.ArrayLike | None = None,
+    density: bool | None = None,
+    weights: H5Array[Any] | npt.NDArray[Any] | None = None,
+) -> tuple[npt.NDArray[Any], npt.NDArray[Any], npt.NDArray[Any]]:
+    if x.ndim != 1 or y.ndim != 1:
+        raise ValueError("x and y must be 1D arrays.")
+
+    if len(x) != len(y):
+        raise ValueError("x and y must have the same length.")
+
+    weights = _check_weights(x, weights)
+
+    # bins is either a number of bins, an array of edges or a pair of those (one per dimension)
+    if np.ndim(bins) > 0 and len(cast(npt.NDArray[Any], bins)) == 2:
+        x_bins, y_bins = cast(tuple[Any, Any], bins)
+
+    else:
+        x_bins = y_bins = bins
+
+    x_range, y_range = (None, None) if range is None else cast(tuple[Any, Any], range)
+    x_edges, y_edges = _get_bin_edges(x, x_bins, x_range), _get_bin_edges(y, y_bins, y_range)
+
+    counts = np.zeros((len(x_edges) - 1, len(y_edges) - 1))
+
+    chunks = PairedChunkIterator(x, y) if weights is None else PairedChunkIterator(x, y, weights)
+
+    for _, x_chunk, y_chunk, *chunk_weights in chunks:
+        counts += np.histogram2d(
+            x_chunk, y_chunk, bins=[x_edges, y_edges], weights=chunk_weights[0] if chunk_weights else None
+        )[0]
+
+    if density:
+        counts = counts / np.diff(x_edges)[:, None] / np.diff(y_edges)[None, :] / counts.sum()
+
+    return counts, x_edges, y_edges
+
+
+@implements(np.bincount)
+def bincount(
+    x: H5Array[Any] | npt.NDArray[Any],
+    weights: H5Array[Any] | npt.NDArray[Any] | None = None,
+    minlength: int = 0,
+) -> npt.NDArray[Any]:
+    if x.ndim != 1:
+        raise ValueError("object too deep for desired array")
+
+    weights = _check_weights(x, weights)
+    counts: npt.NDArray[Any] = np.zeros(minlength, dtype=np.intp if weights is None else np.float64)
+
+    for _, chunk, chunk_weights in _iter_with_weights(x, weights):
+        chunk_counts = np.bincount(chunk, weights=chunk_weights)
+
+        # grow the result when larger values are found
+        if len(chunk_counts) > len(counts):
+            counts = np.pad(counts, (0, len(chunk_counts) - len(counts)))
+
+        counts[: len(chunk_counts)] += chunk_counts
+
+    return counts
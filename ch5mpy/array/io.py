@@ -1,23 +1,361 @@
 from __future__ import annotations
 
-from typing import Any, Generator, TypeVar, cast
+from typing import Any, Callable, Iterator, TypeVar, cast
 
 import numpy as np
 from numpy import typing as npt
 
+from ch5mpy._typing import HYPERSLAB
+from ch5mpy.indexing.planner import get_chunk_cache_size, get_points_batch_size, plan_read, plan_write
 from ch5mpy.indexing.selection import Selection
+from ch5mpy.indexing.utils import runs_to_mask
+from ch5mpy.io.direct import read_direct_chunks
 from ch5mpy.objects import Dataset, DatasetWrapper
+from ch5mpy.options import _OPTIONS
 
 _DT = TypeVar("_DT", bound=np.generic)
 
 
-class IterWithFinalReordering:
-    def __init__(self, gen: Generator[Any, Any, Any]):
-        self.gen = gen
-        self.final_reordering: tuple[npt.NDArray[np.int_] | slice, ...] | None = None
+def supports_direct_io(dataset: Dataset[Any] | DatasetWrapper[Any]) -> bool:
+    """Can elements be read or written directly with low-level HDF5 calls (no wrapper and no variable-length types) ?"""
+    return isinstance(dataset, Dataset) and dataset.dtype.kind in "biufc"
 
-    def __iter__(self) -> Generator[Any, Any, Any]:
-        self.final_reordering = yield from self.gen
+
+def _supports_direct_io(dataset: Dataset[_DT] | DatasetWrapper[_DT], array: npt.NDArray[Any]) -> bool:
+    return supports_direct_io(dataset) and array.dtype.kind in "biufc"
+
+
+def read_hyperslab(dataset: Dataset[_DT], hyperslab: HYPERSLAB, shape: tuple[int, ...]) -> npt.NDArray[_DT]:
+    """Read a single hyperslab (with unit strides) in one HDF5 call, the result is reshaped to `shape`."""
+    start, count, _ = hyperslab
+
+    if _OPTIONS["io_threads"] > 1:
+        buffer = np.empty(count, dtype=dataset.dtype)
+        if read_direct_chunks(dataset, hyperslab, buffer):
+            return buffer.reshape(shape)
+
+    # h5py reads simple slices with its compiled fast reader
+    values = dataset[tuple(slice(s, s + c) for s, c in zip(start, count))]
+    return cast(npt.NDArray[_DT], np.asarray(values).reshape(shape))
+
+
+def write_hyperslab(
+    dataset: Dataset[_DT], values: npt.NDArray[_DT], hyperslab: HYPERSLAB, shape: tuple[int, ...]
+) -> None:
+    """Write values, broadcast to `shape`, to a single hyperslab with one low-level HDF5 call."""
+    if values.size == np.prod(shape) and values.shape != shape:
+        values = values.reshape(shape)
+
+    dataset.write_hyperslabs(np.broadcast_to(values, shape), [hyperslab])
+
+
+def _fill_by_points(
+    selection: Selection,
+    loading_array: npt.NDArray[_DT],
+    read: Callable[[npt.NDArray[_DT], npt.NDArray[np.intp]], None],
+) -> None:
+    """
+    Fill the loading array by batches of selected elements. `read(dest, coordinates)` must fill the 1D array `dest`
+    with the values at `coordinates`.
+    """
+    contiguous = loading_array.flags.c_contiguous
+    flat_loading_array = loading_array.reshape(-1) if contiguous else np.empty(0, dtype=loading_array.dtype)
+    position = 0
+
+    for coordinates in selection.iter_points(get_points_batch_size(len(selection.in_shape))):
+        batch = slice(position, position + len(coordinates))
+
+        if contiguous:
+            read(flat_loading_array[batch], coordinates)
+
+        else:
+            values = np.empty(len(coordinates), dtype=loading_array.dtype)
+            read(values, coordinates)
+            loading_array[np.unravel_index(np.arange(batch.start, batch.stop), loading_array.shape)] = values
+
+        position = batch.stop
+
+
+def _read_bounding_box_from_dataset(
+    dataset: Dataset[_DT], selection: Selection, loading_array: npt.NDArray[_DT]
+) -> None:
+    """Read the box covering all selected elements with a single hyperslab and gather the elements in memory."""
+    box_start, box_count, box_stride = box = selection.get_bounding_box()
+    buffer = np.empty(box_count, dtype=loading_array.dtype)
+    if not read_direct_chunks(dataset, box, buffer):
+        dataset.read_hyperslabs(buffer.reshape(-1), [box])
+
+    if selection.uses_single_vector:
+        # sorted list : compress the box along the list's axis, directly into the loading array when possible
+        list_axis, run_starts, run_lengths, _ = selection.get_vector_runs()
+        mask = runs_to_mask(run_starts, run_lengths, box_start[list_axis], box_count[list_axis])
+        out_shape = box_count[:list_axis] + (int(np.sum(mask)),) + box_count[list_axis + 1 :]
+
+        if loading_array.flags.c_contiguous:
+            np.compress(mask, buffer, axis=list_axis, out=loading_array.reshape(out_shape))
+
+        else:
+            loading_array[...] = np.compress(mask, buffer, axis=list_axis).reshape(loading_array.shape)
+
+        return
+
+    def gather(dest: npt.NDArray[_DT], coordinates: npt.NDArray[np.intp]) -> None:
+        dest[:] = buffer[tuple(((coordinates - box_start) // box_stride).T)]
+
+    _fill_by_points(selection, loading_array, gather)
+
+
+def _group_by_chunk(coordinates: npt.NDArray[np.intp], dataset: Dataset[Any]) -> list[npt.NDArray[np.intp]]:
+    """
+    Group elements (given by their coordinates) by the HDF5 chunk they belong to. Groups are sorted in chunk order and,
+    within a group, elements keep their original order.
+    """
+    assert dataset.chunks is not None
+    chunks_per_axis = [-(-axis_size // chunk_size) for axis_size, chunk_size in zip(dataset.shape, dataset.chunks)]
+    chunk_ids = np.ravel_multi_index(tuple((coordinates // dataset.chunks).T), chunks_per_axis)
+
+    order = np.argsort(chunk_ids, kind="stable")
+    return np.split(order, np.flatnonzero(np.diff(chunk_ids[order])) + 1)
+
+
+def _get_box(coordinates: npt.NDArray[np.intp]) -> HYPERSLAB:
+    start = coordinates.min(axis=0)
+    return tuple(start), tuple(coordinates.max(axis=0) - start + 1), (1,) * coordinates.shape[1]
+
+
+def _gather_by_chunks(dataset: Dataset[_DT], selection: Selection, loading_array: npt.NDArray[_DT]) -> None:
+    """Read selected elements chunk by chunk : each HDF5 chunk is decoded once and all its elements are extracted."""
+
+    def gather(dest: npt.NDArray[_DT], coordinates: npt.NDArray[np.intp]) -> None:
+        for group in _group_by_chunk(coordinates, dataset):
+            box_start, box_count, _ = box = _get_box(coordinates[group])
+            buffer = np.empty(box_count, dtype=dest.dtype)
+            dataset.read_hyperslabs(buffer.reshape(-1), [box])
+            dest[group] = buffer[tuple((coordinates[group] - box_start).T)]
+
+    _fill_by_points(selection, loading_array, gather)
+
+
+def _scatter_by_chunks(dataset: Dataset[_DT], values: npt.NDArray[_DT], selection: Selection) -> None:
+    """
+    Write values chunk by chunk : for each HDF5 chunk, the region containing selected elements is read, modified and
+    written back once. As in numpy, the last value is written for duplicate elements.
+    """
+    flat_values = np.broadcast_to(values, selection.out_shape).reshape(-1)
+    position = 0
+
+    for coordinates in selection.iter_points(get_points_batch_size(len(selection.in_shape))):
+        batch_values = flat_values[position : position + len(coordinates)]
+
+        for group in _group_by_chunk(coordinates, dataset):
+            box_start, box_count, _ = box = _get_box(coordinates[group])
+            buffer = np.empty(box_count, dtype=dataset.dtype)
+            dataset.read_hyperslabs(buffer.reshape(-1), [box])
+            buffer[tuple((coordinates[group] - box_start).T)] = batch_values[group]
+            dataset.write_hyperslabs(buffer, [box])
+
+        position += len(coordinates)
+
+
+def _read_hyperslabs_from_dataset(
+    dataset: Dataset[_DT], hyperslabs: list[HYPERSLAB], loading_array: npt.NDArray[_DT]
+) -> None:
+    if loading_array.flags.c_contiguous:
+        dataset.read_hyperslabs(loading_array.reshape(-1), hyperslabs)
+
+    else:
+        buffer = np.empty(loading_array.shape, dtype=loading_array.dtype)
+        dataset.read_hyperslabs(buffer.reshape(-1), hyperslabs)
+        loading_array[...] = buffer
+
+
+def _iter_run_batches(selection: Selection, itemsize: int) -> Iterator[tuple[slice, Selection]]:
+    """
+    Split a selection with a single sorted list into selections of consecutive runs of elements, holding about as many
+    elements as fit in the memory budget (at least one run). Yields the positions of each batch's elements in the list
+    and the batch's selection, whose elements are not computed.
+    """
+    list_axis, starts, lengths, _ = selection.get_vector_runs()
+    _, box_count, _ = selection.get_bounding_box()
+    lane_size = int(np.prod(box_count[:list_axis] + box_count[list_axis + 1 :])) * itemsize
+    block_size = max(1, _OPTIONS["max_memory_usage"].get() // max(1, lane_size))
+
+    ends = np.cumsum(lengths)
+    first, position = 0, 0
+
+    while first < len(starts):
+        last = max(first + 1, int(np.searchsorted(ends, position + block_size, side="right")))
+
+        yield slice(position, int(ends[last - 1])), selection.with_runs(starts[first:last], lengths[first:last])
+        first, position = last, int(ends[last - 1])
+
+
+def _read_by_indexers(
+    dataset: Dataset[_DT] | DatasetWrapper[_DT],
+    selection: Selection,
+    loading_array: npt.NDArray[_DT],
+) -> None:
+    for dataset_idx, dataset_expand_idx, loading_array_idx in selection.iter_indexers():
+        dataset.read_direct(
+            loading_array,
+            source_sel=dataset_idx,  # type: ignore[arg-type]
+            dest_sel=loading_array_idx,
+            expand_sel=dataset_expand_idx,
+        )
+
+
+def _read_runs_by_batches(
+    dataset: Dataset[_DT] | DatasetWrapper[_DT],
+    selection: Selection,
+    loading_array: npt.NDArray[_DT],
+) -> None:
+    """
+    Read a selection with a single sorted list with h5py's fancy indexing, by batches of runs of consecutive elements
+    (e.g. from a mask) : the list's elements are only computed for one batch at a time.
+    """
+    list_axis = selection.get_vector_runs()[0]
+    _, box_count, _ = selection.get_bounding_box()
+    before, after = box_count[:list_axis], box_count[list_axis + 1 :]
+
+    if not loading_array.flags.c_contiguous:
+        buffer = np.empty(loading_array.shape, dtype=loading_array.dtype)
+        _read_runs_by_batches(dataset, selection, buffer)
+        loading_array[...] = buffer
+        return
+
+    destination = loading_array.reshape(before + (-1,) + after)
+
+    for positions, batch_selection in _iter_run_batches(selection, loading_array.dtype.itemsize):
+        batch = destination[(slice(None),) * list_axis + (positions,)]
+
+        if batch.flags.c_contiguous:
+            _read_by_indexers(dataset, batch_selection, batch.reshape(batch_selection.out_shape))
+
+        else:
+            buffer = np.empty(batch_selection.out_shape, dtype=loading_array.dtype)
+            _read_by_indexers(dataset, batch_selection, buffer)
+            batch[...] = buffer.reshape(batch.shape)
+
+
+def _write_by_indexers(
+    dataset: Dataset[_DT] | DatasetWrapper[_DT],
+    values: npt.NDArray[_DT],
+    selection: Selection,
+) -> None:
+    if values.shape != selection.out_shape:
+        # h5py cannot broadcast values to selections made of lists
+        values = np.ascontiguousarray(np.broadcast_to(values, selection.out_shape))
+
+    for dataset_idx, _, array_idx in selection.iter_indexers(can_reorder=False):
+        dataset.write_direct(values, source_sel=array_idx, dest_sel=dataset_idx)
+
+
+def _write_runs_by_batches(
+    dataset: Dataset[_DT] | DatasetWrapper[_DT],
+    values: npt.NDArray[_DT],
+    selection: Selection,
+) -> None:
+    """Write a selection with a single sorted list with h5py's fancy indexing, by batches of runs of elements."""
+    list_axis = selection.get_vector_runs()[0]
+    _, box_count, _ = selection.get_bounding_box()
+    before, after = box_count[:list_axis], box_count[list_axis + 1 :]
+    values = np.broadcast_to(values, selection.out_shape).reshape(before + (-1,) + after)
+
+    for positions, batch_selection in _iter_run_batches(selection, values.dtype.itemsize):
+        batch = values[(slice(None),) * list_axis + (positions,)]
+        _write_by_indexers(dataset, batch.reshape(batch_selection.out_shape), batch_selection)
+
+
+def _read_permuted_vector(
+    dataset: Dataset[_DT] | DatasetWrapper[_DT],
+    selection: Selection,
+    loading_array: npt.NDArray[_DT],
+) -> None:
+    """
+    Read a selection with a single unsorted list (or with duplicate elements). The list is sorted and made unique, then
+    read by blocks of elements, each block being scattered straight into its final positions in the loading array.
+    Only one block needs to be held in memory, instead of a copy of the whole result.
+    """
+    if not loading_array.flags.c_contiguous:
+        buffer = np.empty(loading_array.shape, dtype=loading_array.dtype)
+        _read_permuted_vector(dataset, selection, buffer)
+        loading_array[...] = buffer
+        return
+
+    list_axis, elements = selection.get_vector()
+    unique_elements, inverse = np.unique(elements, return_inverse=True)
+    order = np.argsort(inverse, kind="stable")
+    sorted_inverse = inverse[order]
+
+    _, box_count, _ = selection.get_bounding_box()
+    before, after = box_count[:list_axis], box_count[list_axis + 1 :]
+    destination = loading_array.reshape(before + (len(elements),) + after)
+
+    # the block and its elements rearranged in list order are both held in memory
+    lane_size = int(np.prod(before + after)) * loading_array.dtype.itemsize
+    block_size = max(1, _OPTIONS["max_memory_usage"].get() // (2 * max(1, lane_size)))
+
+    for start in range(0, len(unique_elements), block_size):
+        block = unique_elements[start : start + block_size]
+        block_selection = selection.with_vector(block)
+        buffer = np.empty(block_selection.out_shape, dtype=loading_array.dtype)
+        read_from_dataset(dataset, block_selection, buffer)
+        buffer = buffer.reshape(before + (len(block),) + after)
+
+        first, last = np.searchsorted(sorted_inverse, (start, start + len(block)))
+        positions = order[first:last]
+        destination[(slice(None),) * list_axis + (positions,)] = buffer.take(inverse[positions] - start, axis=list_axis)
+
+
+def _write_permuted_vector(
+    dataset: Dataset[_DT] | DatasetWrapper[_DT],
+    values: npt.NDArray[_DT],
+    selection: Selection,
+) -> None:
+    """
+    Write a selection with a single unsorted or N-dimensional list (or with duplicate elements) in one sorted pass. The
+    list is flattened, sorted and made unique, keeping the last value for duplicate elements as in numpy, and values
+    are permuted to match.
+    Sorted elements are written by blocks, only one block of permuted values is held in memory.
+    """
+    list_axis, elements = selection.get_vector()
+    order = np.argsort(elements, kind="stable")
+    sorted_elements = elements[order]
+    is_last = np.append(sorted_elements[1:] != sorted_elements[:-1], True)
+    unique_elements, positions = sorted_elements[is_last], order[is_last]
+
+    _, box_count, _ = selection.get_bounding_box()
+    before, after = box_count[:list_axis], box_count[list_axis + 1 :]
+    values = np.broadcast_to(values, selection.out_shape).reshape(before + (len(elements),) + after)
+
+    lane_size = int(np.prod(before + after)) * values.dtype.itemsize
+    block_size = max(1, _OPTIONS["max_memory_usage"].get() // max(1, lane_size))
+
+    for start in range(0, len(unique_elements), block_size):
+        block = slice(start, start + block_size)
+        write_to_dataset(
+            dataset, values.take(positions[block], axis=list_axis), selection.with_vector(unique_elements[block])
+        )
+
+
+def _write_by_points(dataset: Dataset[_DT], values: npt.NDArray[_DT], selection: Selection) -> None:
+    flat_values = np.broadcast_to(values, selection.out_shape).reshape(-1)
+    position = 0
+
+    for coordinates in selection.iter_points(get_points_batch_size(len(selection.in_shape))):
+        dataset.write_points(flat_values[position : position + len(coordinates)], coordinates)
+        position += len(coordinates)
+
+
+def _tune_chunk_cache(dataset: Dataset[_DT] | DatasetWrapper[_DT], selection: Selection) -> None:
+    """With the "auto" `chunk_cache` option, grow the chunk cache of a chunked dataset to fit the selection's chunks."""
+    if _OPTIONS["chunk_cache"] != "auto" or dataset.chunks is None or dataset.name is None:
+        return
+
+    cache_size = get_chunk_cache_size(selection, dataset.dtype, dataset.chunks)
+
+    if cache_size > dataset.chunk_cache_size:
+        dataset.set_chunk_cache(cache_size)
 
 
 def read_from_dataset(
@@ -33,15 +371,45 @@ def read_from_dataset(
     if not loading_array.size:
         return
 
-    indexers = IterWithFinalReordering(selection.iter_indexers())
-    for dataset_idx, dataset_expand_idx, loading_array_idx in indexers:
-        # TODO : would be nice to be able to pass an array with random order in `dest_sel`
-        dataset.read_direct(
-            loading_array, source_sel=dataset_idx, dest_sel=loading_array_idx, expand_sel=dataset_expand_idx
-        )
+    _tune_chunk_cache(dataset, selection)
+
+    if selection.uses_single_vector and not selection.has_sorted_vector:
+        _read_permuted_vector(dataset, selection, loading_array)
+        return
+
+    if _supports_direct_io(dataset, loading_array):
+        assert isinstance(dataset, Dataset)
 
-    if indexers.final_reordering is not None:
-        loading_array[:] = loading_array[indexers.final_reordering]
+        if (
+            _OPTIONS["io_threads"] > 1
+            and not selection.is_list.any()
+            and read_direct_chunks(dataset, selection.get_bounding_box(), loading_array)
+        ):
+            return
+
+        plan = plan_read(selection, dataset.dtype, dataset.chunks, dataset.chunk_cache_size)
+
+        if plan.strategy == "points":
+            _fill_by_points(selection, loading_array, dataset.read_points)
+            return
+
+        if plan.strategy == "hyperslabs":
+            _read_hyperslabs_from_dataset(dataset, selection.get_hyperslabs()[0], loading_array)
+            return
+
+        if plan.strategy == "bounding_box":
+            _read_bounding_box_from_dataset(dataset, selection, loading_array)
+            return
+
+        if plan.strategy == "chunk_gather":
+            _gather_by_chunks(dataset, selection, loading_array)
+            return
+
+        if plan.strategy == "indexers" and selection.uses_single_vector:
+            _read_runs_by_batches(dataset, selection, loading_array)
+            return
+
+    _read_by_indexers(dataset, selection, loading_array)
 
 
 def read_one_from_dataset(
@@ -64,5 +432,31 @@ def write_to_dataset(
     if values.size == np.prod(selection_shape) and values.shape != selection_shape:
         values = values.reshape(selection_shape)
 
-    for dataset_idx, _, array_idx in selection.iter_indexers(can_reorder=False):
-        dataset.write_direct(values, source_sel=array_idx, dest_sel=dataset_idx)
+    _tune_chunk_cache(dataset, selection)
+
+    if selection.uses_single_list and not (selection.uses_single_vector and selection.has_sorted_vector):
+        # N-dimensional lists are also written as flat vectors
+        _write_permuted_vector(dataset, values, selection)
+        return
+
+    if _supports_direct_io(dataset, values):
+        assert isinstance(dataset, Dataset)
+        strategy = plan_write(selection, dataset.dtype, dataset.chunks, dataset.chunk_cache_size)
+
+        if strategy == "hyperslabs":
+            dataset.write_hyperslabs(np.broadcast_to(values, selection_shape), selection.get_hyperslabs()[0])
+            return
+
+        if strategy == "points":
+            _write_by_points(dataset, values, selection)
+            return
+
+        if strategy == "chunk_scatter":
+            _scatter_by_chunks(dataset, values, selection)
+            return
+
+        if strategy == "indexers" and selection.uses_single_vector:
+            _write_runs_by_batches(dataset, values, selection)
+            return
+
+    _write_by_indexers(dataset, values, selection)
@@ -0,0 +1,47 @@
+from __future__ import annotations
+
+from typing import Any, TypeVar, cast
+
+import numpy as np
+import numpy.typing as npt
+
+from ch5mpy.indexing import Selection
+from ch5mpy.objects import Dataset, DatasetWrapper
+
+_DT = TypeVar("_DT", bound=np.generic)
+
+# file drivers storing all raw data in one file on disk, at the offsets given by HDF5
+_MAPPABLE_DRIVERS = ("sec2", "stdio")
+
+
+def memory_map(dataset: Dataset[_DT] | DatasetWrapper[_DT]) -> np.memmap[Any, np.dtype[_DT]] | None:
+    """
+    Map (read-only) the raw data of a contiguous dataset of numbers in memory, to read it without going through HDF5.
+    Returns None for datasets that cannot be mapped : chunked (and thus compressed), stored in external files or not
+    allocated yet.
+    """
+    if not isinstance(dataset, Dataset) or dataset.dtype.kind not in "biufc":
+        return None
+
+    if dataset.chunks is not None or dataset.external is not None:  # type: ignore[attr-defined]
+        return None
+
+    if dataset.file.driver not in _MAPPABLE_DRIVERS:  # type: ignore[attr-defined]
+        return None
+
+    offset = dataset.id.get_offset()  # type: ignore[attr-defined]
+    if offset is None:
+        return None
+
+    return np.memmap(dataset.file.filename, dtype=dataset.dtype, mode="r", offset=offset, shape=dataset.shape)
+
+
+def read_mapped(memmap: np.memmap[Any, np.dtype[_DT]], selection: Selection) -> npt.NDArray[_DT] | None:
+    """
+    Get a read-only view on the elements of a memory-mapped dataset selected by integers and slices only, or None if
+    the selection uses lists (which cannot be viewed without a copy).
+    """
+    if selection.is_list.any():
+        return None
+
+    return cast(npt.NDArray[_DT], np.asarray(memmap[selection.get_indexers()]).reshape(selection.out_shape))
@@ -0,0 +1,137 @@
+from __future__ import annotations
+
+from typing import Any
+
+import numpy as np
+import numpy.typing as npt
+
+
+class QuantileSketch:
+    """
+    Mergeable KLL sketch for estimating quantiles of a stream of values in a single pass.
+
+    Values are stored in a hierarchy of compactors : when the compactor at level h grows larger than its capacity, it
+    is sorted and every other value is promoted to level h+1 (where each value counts as 2^(h+1) values of the stream).
+    With high probability, the rank error of an estimated quantile is of the order of n / k for a stream of n values.
+
+    Args:
+        k: capacity of the top compactor, larger values lead to more accurate estimates and a larger memory footprint.
+        seed: seed for the random generator used when compacting values.
+    """
+
+    # region magic methods
+    def __init__(self, k: int = 256, seed: int | None = None):
+        if k < 2:
+            raise ValueError(f"Sketch capacity must be at least 2, got {k}.")
+
+        self._k = k
+        self._levels: list[npt.NDArray[Any]] = []
+        self._n = 0
+        self._has_nan = False
+        self._min: Any = None
+        self._max: Any = None
+        self._rng = np.random.default_rng(seed)
+
+    def __repr__(self) -> str:
+        return f"QuantileSketch(k={self._k}, n={self._n}, stored={sum(len(lvl) for lvl in self._levels)})"
+
+    # endregion
+
+    # region attributes
+    @property
+    def n(self) -> int:
+        """Number of (non NaN) values seen by this sketch."""
+        return self._n
+
+    @property
+    def has_nan(self) -> bool:
+        return self._has_nan
+
+    # endregion
+
+    # region methods
+    def _capacity(self, level: int) -> int:
+        depth = len(self._levels) - level - 1
+        return max(2, int(np.ceil(self._k * (2 / 3) ** depth)))
+
+    def _push(self, level: int, values: npt.NDArray[Any]) -> None:
+        while len(self._levels) <= level:
+            self._levels.append(np.empty(0, dtype=values.dtype))
+
+        self._levels[level] = np.concatenate((self._levels[level], values))
+
+    def _compress(self) -> None:
+        level = 0
+
+        while level < len(self._levels):
+            values = self._levels[level]
+
+            if len(values) > self._capacity(level):
+                values = np.sort(values)
+                even = len(values) - len(values) % 2
+
+                self._push(level + 1, values[self._rng.integers(2) : even : 2])
+                self._levels[level] = values[even:]
+
+            level += 1
+
+    def _update_extrema(self, vmin: Any, vmax: Any) -> None:
+        self._min = vmin if self._min is None else min(self._min, vmin)
+        self._max = vmax if self._max is None else max(self._max, vmax)
+
+    def update(self, values: npt.ArrayLike) -> None:
+        """Add values to the sketch."""
+        array = np.asarray(values).ravel()
+
+        if array.dtype.kind in "fc":
+            is_nan = np.isnan(array)
+
+            if is_nan.any():
+                self._has_nan = True
+                array = array[~is_nan]
+
+        if array.size:
+            self._update_extrema(array.min(), array.max())
+
+        self._n += array.size
+        self._push(0, array)
+        self._compress()
+
+    def merge(self, other: QuantileSketch) -> None:
+        """Merge another sketch into this one."""
+        for level, values in enumerate(other._levels):
+            self._push(level, values)
+
+        if other._n:
+            self._update_extrema(other._min, other._max)
+
+        self._n += other._n
+        self._has_nan |= other._has_nan
+        self._compress()
+
+    def quantile(self, q: npt.ArrayLike) -> npt.NDArray[np.float64]:
+        """Estimate quantiles (with linear interpolation between closest ranks) of the values seen so far."""
+        q = np.asarray(q, dtype=np.float64)
+
+        if self._n == 0:
+            raise ValueError("Cannot compute quantiles of an empty sketch.")
+
+        if self._has_nan:
+            return np.full(q.shape, np.nan)
+
+        values = np.concatenate(self._levels)
+        weights = np.concatenate([np.full(len(lvl), 2**level) for level, lvl in enumerate(self._levels)])
+
+        order = np.argsort(values, kind="stable")
+        values, cumulative_weights = values[order].astype(np.float64), np.cumsum(weights[order])
+
+        virtual_rank = q * (self._n - 1)
+        last = len(values) - 1
+        below = values[np.minimum(np.searchsorted(cumulative_weights, np.floor(virtual_rank), side="right"), last)]
+        above = values[np.minimum(np.searchsorted(cumulative_weights, np.ceil(virtual_rank), side="right"), last)]
+
+        # extrema are tracked exactly
+        estimate = np.clip(below + (above - below) * (virtual_rank - np.floor(virtual_rank)), self._min, self._max)
+        return np.where(q == 0, self._min, np.where(q == 1, self._max, estimate))
+
+    # endregion
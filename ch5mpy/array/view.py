@@ -8,9 +8,10 @@ import numpy.typing as npt
 import ch5mpy
 import ch5mpy.indexing as ci
 from ch5mpy import Dataset
-from ch5mpy._typing import NP_FUNC, SELECTOR
+from ch5mpy._typing import HYPERSLAB, NP_FUNC, SELECTOR
 from ch5mpy.array.array import as_array
 from ch5mpy.array.io import read_from_dataset, read_one_from_dataset, write_to_dataset
+from ch5mpy.array.memmap import read_mapped
 from ch5mpy.objects import DatasetWrapper
 
 _T = TypeVar("_T", bound=np.generic, covariant=True)
@@ -20,29 +21,39 @@ class H5ArrayView(ch5mpy.H5Array[_T]):
     """A view on a H5Array."""
 
     # region magic methods
-    def __init__(self, dset: Dataset[_T] | DatasetWrapper[_T], sel: ci.Selection):
+    def __init__(
+        self,
+        dset: Dataset[_T] | DatasetWrapper[_T],
+        sel: ci.Selection,
+        memmap: np.memmap[Any, np.dtype[_T]] | None = None,
+    ):
         super().__init__(dset)
         self._selection = sel
+        self._mmap = memmap
 
     def __getitem__(self, index: SELECTOR | tuple[SELECTOR, ...]) -> _T | ch5mpy.H5Array[_T]:
         selection = ci.Selection.from_selector(index, self.shape)
 
         if selection.is_empty:
-            return H5ArrayView(dset=self._dset, sel=self._selection)
+            return H5ArrayView(dset=self._dset, sel=self._selection, memmap=self._mmap)
 
         selection = selection.cast_on(self._selection)
 
         if selection.is_empty:
-            return ch5mpy.H5Array(self._dset)
+            return ch5mpy.H5Array(self)
 
         if selection.out_shape == ():
+            if self._mmap is not None and not selection.is_list.any():
+                return cast(_T, self._mmap[selection.get_indexers()])
+
             return read_one_from_dataset(self._dset, selection, self.dtype)
 
-        return H5ArrayView(dset=self._dset, sel=selection)
+        return H5ArrayView(dset=self._dset, sel=selection, memmap=self._mmap)
 
     def __setitem__(self, index: SELECTOR | tuple[SELECTOR, ...], value: Any) -> None:
         selection = ci.Selection.from_selector(index, self.shape)
         write_to_dataset(self._dset, as_array(value, self.dtype), selection.cast_on(self._selection))
+        self._flush_mapped()
 
     def __len__(self) -> int:
         return self.shape[0]
@@ -54,21 +65,29 @@ class H5ArrayView(ch5mpy.H5Array[_T]):
         # special case : 0D array
         if self.shape == ():
             self._dset[:] = func(self._dset[:], value)
+            self._flush_mapped()
             return self
 
         # general case : 1D+ array
         for index, chunk in self.iter_chunks():
+            if not chunk.flags.writeable:
+                chunk = chunk.copy()
+
             func(chunk, value, out=chunk)
 
-            for dest_sel, _, source_sel in ci.Selection(index, self.shape).cast_on(self._selection).iter_indexers():
-                self._dset.write_direct(chunk, source_sel=source_sel, dest_sel=dest_sel)
+            write_to_dataset(self._dset, chunk, ci.Selection(index, self.shape).cast_on(self._selection))
 
+        self._flush_mapped()
         return self
 
     # endregion
 
     # region interface
     def __array__(self, dtype: npt.DTypeLike | None = None) -> npt.NDArray[Any]:
+        mapped = None if self._mmap is None else read_mapped(self._mmap, self._selection)
+        if mapped is not None:
+            return mapped if dtype is None else mapped.astype(dtype)
+
         loading_array = np.empty(
             self._selection.out_shape,
             dtype or self.dtype,
@@ -87,6 +106,16 @@ class H5ArrayView(ch5mpy.H5Array[_T]):
     # endregion
 
     # region methods
+    def _get_hyperslab(self, index: SELECTOR | tuple[SELECTOR, ...]) -> tuple[HYPERSLAB, tuple[int, ...]] | None:
+        # indices are relative to the view, they must go through the view's selection
+        return None
+
+    def _get_mapped_chunk(self, index: tuple[ci.FullSlice | ci.SingleIndex, ...]) -> npt.NDArray[_T] | None:
+        if self._mmap is None:
+            return None
+
+        return read_mapped(self._mmap, ci.Selection(index, self.shape).cast_on(self._selection))
+
     @overload
     def astype(self, dtype: npt.DTypeLike, copy: Literal[True], inplace: bool = ...) -> npt.NDArray[Any]: ...
     @overload
@@ -23,11 +23,12 @@ def _is_None(v: Any) -> bool:
 
 
 class AttributeManager:
-    """Manage attributes of a File, Group or Dataset."""
+    """Manage attributes of a File, Group or Dataset (attributes of objects read from read-only Files cannot be set)."""
 
     # region magic methods
-    def __init__(self, attrs: H5Attrs) -> None:
+    def __init__(self, attrs: H5Attrs, read_only: bool = False) -> None:
         self._attrs = attrs
+        self._read_only = read_only
 
     def __repr__(self) -> str:
         return f"AttributeManager{{{_SPACER.join([e[0] + ': ' + str(e[1]) for e in self.as_dict().items()])}}}"
@@ -44,6 +45,8 @@ class AttributeManager:
         return value
 
     def __setitem__(self, name: str, value: Any) -> Any:
+        self._check_write_intent()
+
         if value is None:
             self._attrs[name] = _NONE_VALUE
 
@@ -60,6 +63,7 @@ class AttributeManager:
                 self._attrs[name] = np.void(pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL))
 
     def __delitem__(self, name: str) -> None:
+        self._check_write_intent()
         del self._attrs[name]
 
     def __len__(self) -> int:
@@ -77,6 +81,10 @@ class AttributeManager:
     # endregion
 
     # region methods
+    def _check_write_intent(self) -> None:
+        if self._read_only:
+            raise OSError("Cannot write attributes : the file was opened read-only.")
+
     def get(self, name: str, default: Any = None) -> Any:
         return self._attrs.get(name, default)
 
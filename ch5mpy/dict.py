@@ -9,9 +9,9 @@ from typing import Any, ItemsView, Iterator, TypeVar, Union, ValuesView, cast
 import numpy as np
 from h5py._hl.base import ItemsViewHDF5
 
-from ch5mpy.array import H5Array
+from ch5mpy.io.fingerprint import can_fingerprint
 from ch5mpy.names import H5Mode
-from ch5mpy.objects import AsStrWrapper, Dataset, File, Group, H5Object
+from ch5mpy.objects import Dataset, File, Group, H5Object, open_file
 from ch5mpy.options import _OPTIONS
 from ch5mpy.types import SupportsH5ReadWrite
 
@@ -22,19 +22,6 @@ _T = TypeVar("_T", bound=SupportsH5ReadWrite)
 _NO_OBJECT = object()
 
 
-def _get_in_memory(value: Any) -> Any:
-    if isinstance(value, H5Dict):
-        return value.copy()
-
-    elif isinstance(value, (Dataset, AsStrWrapper)):
-        return value[()]
-
-    elif isinstance(value, (H5Object, H5Array)):
-        return value.copy()
-
-    return value
-
-
 def _is_group(obj: Group | Dataset[Any]) -> bool:
     h5_type = obj.attrs.get("__h5_type__", "<UNKNOWN>")
     return isinstance(obj, Group) and h5_type not in ("object", "list")
@@ -130,6 +117,11 @@ class H5DictItemsView(ItemsView[str, _T]):
     # endregion
 
 
+def _is_similar_dataset(obj: Any, value: Any) -> bool:
+    """Whether a value can be copied to a stored chunked dataset, which only writes the chunks that changed."""
+    return isinstance(obj, Dataset) and isinstance(value, np.ndarray) and can_fingerprint(obj, value)
+
+
 def _diff(a: Any, b: Any) -> bool:
     if a is _NO_OBJECT:
         return True
@@ -175,6 +167,11 @@ class H5Dict(H5Object, MutableMapping[str, _T]):
         key: str,
         value: Any,
     ) -> None:
+        """
+        Store a value, which is not written if equal to the stored one. Arrays copied to chunked datasets of the same
+        shape and type only write the chunks that changed (see the `trust_fingerprints` option to find them without
+        reading the dataset, in files only modified with ch5mpy).
+        """
         value_is_empty_dict = isinstance(value, dict) and value == {}
 
         if isinstance(value, (dict, H5Dict)) and key in self._file.keys() and isinstance(sub_dict := self[key], H5Dict):
@@ -185,7 +182,11 @@ class H5Dict(H5Object, MutableMapping[str, _T]):
             for sub_key, sub_value in value.items():
                 sub_dict[sub_key] = sub_value
 
-        elif value_is_empty_dict or _diff(self.get(key, _NO_OBJECT), value):
+        elif (
+            value_is_empty_dict
+            or _is_similar_dataset(self._file.get(key), value)
+            or _diff(self.get(key, _NO_OBJECT), value)
+        ):
             io.write_object(value, self, key, overwrite=True)
 
     def __delitem__(self, key: str) -> None:
@@ -255,7 +256,7 @@ class H5Dict(H5Object, MutableMapping[str, _T]):
         name: str | None = None,
         mode: H5Mode = H5Mode.READ,
     ) -> H5Dict[Any]:
-        file = File(Path(path).expanduser(), mode=mode) if isinstance(path, (str, Path)) else path
+        file = open_file(Path(path).expanduser(), mode=mode) if isinstance(path, (str, Path)) else path
 
         if name is not None:
             file = file[name]
@@ -284,10 +285,13 @@ class H5Dict(H5Object, MutableMapping[str, _T]):
     def rename(self, name: str, new_name: str) -> None:
         self._file.move(name, new_name)
 
-    def copy(self) -> dict[str, Any]:
+    def copy(self, lazy: bool = False) -> dict[str, Any]:
         """
-        Build an in-memory copy of this H5Dict object.
+        Build an in-memory copy of this H5Dict object (see `ch5mpy.load_object()`).
+
+        Args:
+            lazy: get LazyObjects instead of arrays and objects, which are only read on first access.
         """
-        return {k: _get_in_memory(v) for k, v in self.items()}
+        return io.load_object(self._file, lazy=lazy, h5_type="dict")  # type: ignore[no-any-return]
 
     # endregion
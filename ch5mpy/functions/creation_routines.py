@@ -8,6 +8,8 @@ import numpy as np
 import numpy.typing as npt
 
 import ch5mpy
+from ch5mpy.objects import open_file
+from ch5mpy.types import H5Filters
 
 
 class ArrayCreationFunc:
@@ -28,14 +30,25 @@ class ArrayCreationFunc:
         dtype: npt.DTypeLike = np.float64,
         chunks: bool | tuple[int, ...] = True,
         maxshape: int | tuple[int | None, ...] | None = None,
+        filters: H5Filters | None = None,
+        chunk_axis: int = 0,
     ) -> ch5mpy.H5Array[Any]:
         shape = shape if isinstance(shape, tuple) else (shape,)
 
         if not isinstance(loc, ch5mpy.Group):
-            loc = ch5mpy.File(loc, mode=ch5mpy.H5Mode.READ_WRITE_CREATE)
+            loc = open_file(loc, mode=ch5mpy.H5Mode.READ_WRITE_CREATE)
 
         dset = ch5mpy.store_dataset(
-            None, loc, name, shape=shape, dtype=dtype, chunks=chunks, maxshape=maxshape, fill_value=fill_value
+            None,
+            loc,
+            name,
+            shape=shape,
+            dtype=dtype,
+            chunks=chunks,
+            maxshape=maxshape,
+            fill_value=fill_value,
+            filters=filters,
+            chunk_axis=chunk_axis,
         )
 
         return ch5mpy.H5Array(dset)
@@ -47,8 +60,19 @@ class ArrayCreationFunc:
         dtype: npt.DTypeLike = np.float64,
         chunks: bool | tuple[int, ...] = True,
         maxshape: int | tuple[int | None, ...] | None = None,
+        filters: H5Filters | None = None,
+        chunk_axis: int = 0,
     ) -> partial[ch5mpy.H5Array[Any]]:
-        return partial(self.__call__, shape=shape, fill_value=fill_value, dtype=dtype, chunks=chunks, maxshape=maxshape)
+        return partial(
+            self.__call__,
+            shape=shape,
+            fill_value=fill_value,
+            dtype=dtype,
+            chunks=chunks,
+            maxshape=maxshape,
+            filters=filters,
+            chunk_axis=chunk_axis,
+        )
 
     # endregion
 
@@ -68,9 +92,19 @@ class ArrayCreationFuncWithFill(ArrayCreationFunc):
         dtype: npt.DTypeLike = np.float64,
         chunks: bool | tuple[int, ...] = True,
         maxshape: int | tuple[int | None, ...] | None = None,
+        filters: H5Filters | None = None,
+        chunk_axis: int = 0,
     ) -> ch5mpy.H5Array[Any]:
         return super().__call__(
-            name=name, loc=loc, shape=shape, fill_value=self._fill_value, dtype=dtype, chunks=chunks, maxshape=maxshape
+            name=name,
+            loc=loc,
+            shape=shape,
+            fill_value=self._fill_value,
+            dtype=dtype,
+            chunks=chunks,
+            maxshape=maxshape,
+            filters=filters,
+            chunk_axis=chunk_axis,
         )
 
     # endregion
@@ -82,8 +116,18 @@ class ArrayCreationFuncWithFill(ArrayCreationFunc):
         dtype: npt.DTypeLike = np.float64,
         chunks: bool | tuple[int, ...] = True,
         maxshape: int | tuple[int | None, ...] | None = None,
+        filters: H5Filters | None = None,
+        chunk_axis: int = 0,
     ) -> partial[ch5mpy.H5Array[Any]]:
-        return partial(self.__call__, shape=shape, dtype=dtype, chunks=chunks, maxshape=maxshape)
+        return partial(
+            self.__call__,
+            shape=shape,
+            dtype=dtype,
+            chunks=chunks,
+            maxshape=maxshape,
+            filters=filters,
+            chunk_axis=chunk_axis,
+        )
 
     # endregion
 
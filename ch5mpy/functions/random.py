@@ -10,6 +10,7 @@ import numpy.typing as npt
 import ch5mpy
 from ch5mpy.functions.creation_routines import ArrayCreationFunc
 from ch5mpy.indexing import map_slice
+from ch5mpy.types import H5Filters
 
 
 class ArrayCreationFuncRandom(ArrayCreationFunc):
@@ -26,8 +27,20 @@ class ArrayCreationFuncRandom(ArrayCreationFunc):
         dtype: npt.DTypeLike = np.float64,
         chunks: bool | tuple[int, ...] = True,
         maxshape: int | tuple[int | None, ...] | None = None,
+        filters: H5Filters | None = None,
+        chunk_axis: int = 0,
     ) -> ch5mpy.H5Array[Any]:
-        arr = super().__call__(dims, None, name, loc, dtype=dtype, chunks=chunks, maxshape=maxshape)
+        arr = super().__call__(
+            dims,
+            None,
+            name,
+            loc,
+            dtype=dtype,
+            chunks=chunks,
+            maxshape=maxshape,
+            filters=filters,
+            chunk_axis=chunk_axis,
+        )
 
         for index, chunk in arr.iter_chunks():
             chunk = self._random_func(*chunk.shape)
@@ -49,8 +62,12 @@ class ArrayCreationFuncRandom(ArrayCreationFunc):
         dtype: npt.DTypeLike = np.float64,
         chunks: bool | tuple[int, ...] = True,
         maxshape: int | tuple[int | None, ...] | None = None,
+        filters: H5Filters | None = None,
+        chunk_axis: int = 0,
     ) -> partial[ch5mpy.H5Array[Any]]:
-        return partial(self.__call__, *dims, dtype=dtype, chunks=chunks, maxshape=maxshape)
+        return partial(
+            self.__call__, *dims, dtype=dtype, chunks=chunks, maxshape=maxshape, filters=filters, chunk_axis=chunk_axis
+        )
 
     # endregion
 
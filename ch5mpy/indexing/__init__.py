@@ -1,7 +1,8 @@
 from typing import Union
 
-from ch5mpy.indexing.base import Indexer, as_indexer, boolean_array_as_indexer
+from ch5mpy.indexing.base import Indexer, as_hyperslab, as_indexer, boolean_array_as_indexer
 from ch5mpy.indexing.list import ListIndex
+from ch5mpy.indexing.mask import MaskIndex
 from ch5mpy.indexing.selection import Selection, get_indexer
 from ch5mpy.indexing.single import SingleIndex
 from ch5mpy.indexing.slice import FullSlice, map_slice
@@ -17,9 +18,11 @@ __all__ = [
     "map_slice",
     "FullSlice",
     "ListIndex",
+    "MaskIndex",
     "SingleIndex",
     "NewAxis",
     "NewAxisType",
     "as_indexer",
+    "as_hyperslab",
     "EmptyList",
 ]
@@ -1,14 +1,18 @@
 from __future__ import annotations
 
 from abc import ABC, abstractmethod
-from typing import Any, SupportsIndex, overload
+from typing import TYPE_CHECKING, Any, SupportsIndex, overload
 
 import numpy as np
 import numpy.typing as npt
 
 import ch5mpy.indexing as ci
+from ch5mpy._typing import HYPERSLAB, SELECTOR
 from ch5mpy.indexing.utils import positive_slice_index
 
+if TYPE_CHECKING:
+    from ch5mpy import H5Array
+
 
 class Indexer(ABC):
     # region magic methods
@@ -48,13 +52,13 @@ class Indexer(ABC):
 
 
 def boolean_array_as_indexer(
-    mask: npt.NDArray[np.bool_], shape: tuple[int, ...]
-) -> tuple[ci.FullSlice | ci.ListIndex, ...]:
+    mask: npt.NDArray[np.bool_] | H5Array[np.bool_], shape: tuple[int, ...]
+) -> tuple[ci.FullSlice | ci.ListIndex | ci.EmptyList, ...]:
     assert mask.shape == shape
 
-    if mask.ndim == 1 and np.all(mask):
-        assert len(mask) == shape[0]
-        return (ci.FullSlice.whole_axis(len(mask)),)
+    if mask.ndim == 1:
+        # store 1D masks as runs of True values instead of (possibly huge) arrays of indices
+        return (ci.MaskIndex.from_mask(mask),)
 
     return tuple(ci.ListIndex(e, max=s) for e, s in zip(np.where(mask), shape))
 
@@ -109,3 +113,59 @@ def as_indexer(
         return ci.SingleIndex(int(obj), max=max)
 
     raise TypeError(f"Cannot convert {obj} to indexer.")
+
+
+def as_hyperslab(
+    index: SELECTOR | tuple[SELECTOR, ...], shape: tuple[int, ...]
+) -> tuple[HYPERSLAB, tuple[int, ...]] | None:
+    """
+    Convert a selector made only of integers and slices with step 1 to a single hyperslab, without building a
+    Selection. Also returns the shape of selected elements (axes indexed by integers are dropped).
+    Returns None for any other selector or if no element is selected.
+
+    Raises:
+        IndexError: if an integer is out of bounds.
+    """
+    if not isinstance(index, tuple):
+        index = (index,)
+
+    if not len(shape) or len(index) > len(shape):
+        return None
+
+    start: list[int] = []
+    count: list[int] = []
+    out_shape: list[int] = []
+
+    for i, axis_size in zip(index, shape):
+        if isinstance(i, slice):
+            if i.step not in (None, 1):
+                return None
+
+            first, last, _ = i.indices(axis_size)
+            if last <= first:
+                return None
+
+            start.append(first)
+            count.append(last - first)
+            out_shape.append(last - first)
+
+        elif isinstance(i, (int, np.integer)) and not isinstance(i, (bool, np.bool_)):
+            position = positive_slice_index(int(i), axis_size)
+            if not 0 <= position < axis_size:
+                raise IndexError(f"Selection {i} is out of bounds for axis with size {axis_size}.")
+
+            start.append(position)
+            count.append(1)
+
+        else:
+            return None
+
+    for axis_size in shape[len(index) :]:
+        if axis_size == 0:
+            return None
+
+        start.append(0)
+        count.append(axis_size)
+        out_shape.append(axis_size)
+
+    return (tuple(start), tuple(count), (1,) * len(shape)), tuple(out_shape)
@@ -6,6 +6,7 @@ import numpy as np
 import numpy.typing as npt
 
 from ch5mpy.indexing.base import Indexer, as_indexer
+from ch5mpy.indexing.utils import get_runs
 
 
 class ListIndex(Indexer):
@@ -72,6 +73,15 @@ class ListIndex(Indexer):
     def is_whole_axis(self) -> bool:
         return np.array_equal(self._elements, np.arange(self._max))
 
+    @property
+    def bounds(self) -> tuple[int, int]:
+        """Smallest and largest elements."""
+        return int(self._elements.min()), int(self._elements.max())
+
+    @property
+    def is_sorted_unique(self) -> bool:
+        return bool(np.all(np.diff(self._elements.flatten()) > 0))
+
     # endregion
 
     # region methods
@@ -89,6 +99,20 @@ class ListIndex(Indexer):
     def as_numpy_index(self) -> npt.NDArray[np.int_]:
         return self.__array__()
 
+    def as_runs(self) -> tuple[npt.NDArray[np.int_], npt.NDArray[np.int_], npt.NDArray[np.intp] | None]:
+        """
+        Get the sorted, unique elements as runs of consecutive elements (start and length of each run) and the
+        positions of the (flattened) elements among the unique elements, or None if elements are already sorted and
+        unique.
+        """
+        elements = self._elements.flatten()
+        unique_elements, inverse = np.unique(elements, return_inverse=True)
+
+        if len(unique_elements) == len(elements) and np.array_equal(unique_elements, elements):
+            return *get_runs(unique_elements), None
+
+        return *get_runs(unique_elements), inverse
+
     def squeeze(self) -> ListIndex:
         if self.size <= 1:
             return self
@@ -0,0 +1,185 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any
+
+import numpy as np
+import numpy.typing as npt
+
+from ch5mpy.indexing.base import Indexer
+from ch5mpy.indexing.list import ListIndex
+from ch5mpy.indexing.slice import FullSlice
+from ch5mpy.indexing.special import EmptyList
+from ch5mpy.indexing.utils import runs_to_elements
+
+if TYPE_CHECKING:
+    from ch5mpy import H5Array
+
+
+def _get_true_runs(mask: npt.NDArray[np.bool_], offset: int = 0) -> tuple[npt.NDArray[np.int64], npt.NDArray[np.int64]]:
+    """Get the start and length of runs of consecutive True values in a 1D boolean mask."""
+    edges = np.diff(np.concatenate(([False], mask, [False])).astype(np.int8))
+    starts = np.flatnonzero(edges == 1)
+    return starts + offset, np.flatnonzero(edges == -1) - starts
+
+
+class MaskIndex(ListIndex):
+    """
+    Elements selected by a 1D boolean mask, stored as runs of consecutive True values (start and length of each run)
+    instead of as an array of integer indices. Elements are only computed if an operation requires them.
+    """
+
+    # region magic methods
+    def __init__(self, starts: npt.NDArray[np.int_], lengths: npt.NDArray[np.int_], max: int):
+        if not len(starts):
+            raise ValueError("Cannot build empty MaskIndex, use EmptyList instead.")
+
+        self._starts = np.asarray(starts, dtype=np.int64)
+        self._lengths = np.asarray(lengths, dtype=np.int64)
+        self._max = max
+        self._cached_elements: npt.NDArray[np.int_] | None = None
+
+        if self._starts[0] < 0 or self._starts[-1] + self._lengths[-1] > max:
+            raise IndexError(f"Mask is out of bounds for axis with size {max}.")
+
+    def __repr__(self) -> str:
+        return f"MaskIndex({len(self._starts)} runs, size={self.size} | {self._max})"
+
+    def __len__(self) -> int:
+        return self.size
+
+    def __eq__(self, other: Any) -> bool:
+        if isinstance(other, MaskIndex):
+            return np.array_equal(self._starts, other._starts) and np.array_equal(self._lengths, other._lengths)
+
+        return super().__eq__(other)
+
+    def __getitem__(self, item: Indexer | tuple[Indexer, ...]) -> Indexer:
+        if not isinstance(item, tuple):
+            item = (item,)
+
+        if not len(item):
+            return self
+
+        if len(item) == 1 and isinstance(item[0], FullSlice) and item[0].step == 1:
+            return self._take_range(item[0].start, item[0].start + len(item[0]))
+
+        return super().__getitem__(item)
+
+    # endregion
+
+    # region attributes
+    @property
+    def _elements(self) -> npt.NDArray[np.int_]:  # type: ignore[override]
+        if self._cached_elements is None:
+            self._cached_elements = runs_to_elements(self._starts, self._lengths)
+
+        return self._cached_elements
+
+    @property
+    def ndim(self) -> int:
+        return 1
+
+    @property
+    def shape(self) -> tuple[int, ...]:
+        return (self.size,)
+
+    @property
+    def size(self) -> int:
+        return int(np.sum(self._lengths))
+
+    @property
+    def is_whole_axis(self) -> bool:
+        return len(self._starts) == 1 and self._starts[0] == 0 and self._lengths[0] == self._max
+
+    @property
+    def bounds(self) -> tuple[int, int]:
+        return int(self._starts[0]), int(self._starts[-1] + self._lengths[-1] - 1)
+
+    @property
+    def is_sorted_unique(self) -> bool:
+        return True
+
+    # endregion
+
+    # region methods
+    @classmethod
+    def from_mask(cls, mask: npt.NDArray[np.bool_] | H5Array[np.bool_]) -> MaskIndex | FullSlice | EmptyList:
+        """
+        Build an indexer from a 1D boolean mask. H5Array masks are read chunk by chunk, without loading the whole mask
+        in memory.
+        """
+        import ch5mpy
+
+        if isinstance(mask, ch5mpy.H5Array):
+            all_starts: list[npt.NDArray[np.int64]] = []
+            all_lengths: list[npt.NDArray[np.int64]] = []
+
+            for index, chunk in mask.iter_chunks():
+                offset = index[0].start if len(index) and isinstance(index[0], FullSlice) else 0
+                starts, lengths = _get_true_runs(np.atleast_1d(chunk), offset=offset)
+
+                # merge runs crossing chunk boundaries
+                if len(starts) and len(all_starts) and all_starts[-1][-1] + all_lengths[-1][-1] == starts[0]:
+                    all_lengths[-1][-1] += lengths[0]
+                    starts, lengths = starts[1:], lengths[1:]
+
+                if len(starts):
+                    all_starts.append(starts)
+                    all_lengths.append(lengths)
+
+            starts = np.concatenate(all_starts) if len(all_starts) else np.empty(0, dtype=np.int64)
+            lengths = np.concatenate(all_lengths) if len(all_lengths) else np.empty(0, dtype=np.int64)
+
+        else:
+            starts, lengths = _get_true_runs(mask)
+
+        if not len(starts):
+            return EmptyList(max=len(mask))
+
+        if len(starts) == 1 and starts[0] == 0 and lengths[0] == len(mask):
+            return FullSlice.whole_axis(len(mask))
+
+        return MaskIndex(starts, lengths, max=len(mask))
+
+    def _take_range(self, first: int, last: int) -> MaskIndex:
+        """Get the elements at positions [first, last) among this mask's elements."""
+        ends = np.cumsum(self._lengths)
+        begins = ends - self._lengths
+        keep = (ends > first) & (begins < last)
+
+        return MaskIndex(
+            self._starts[keep] + np.maximum(first - begins[keep], 0),
+            np.minimum(ends[keep], last) - np.maximum(begins[keep], first),
+            max=self._max,
+        )
+
+    def shift(self, offset: int, max: int) -> MaskIndex:
+        """Get the same mask, with all elements shifted by an offset, for an axis of size `max`."""
+        return MaskIndex(self._starts + offset, self._lengths, max=max)
+
+    def try_as_slice(self) -> FullSlice | None:
+        if len(self._starts) == 1:
+            return FullSlice(int(self._starts[0]), int(self._starts[0] + self._lengths[0]), 1, max=self._max)
+
+        return None
+
+    def as_array(self, sorted: bool = False, flattened: bool = False) -> npt.NDArray[np.int_]:
+        # elements are always sorted and 1D
+        return self._elements
+
+    def as_runs(self) -> tuple[npt.NDArray[np.int_], npt.NDArray[np.int_], npt.NDArray[np.intp] | None]:
+        return self._starts, self._lengths, None
+
+    def squeeze(self) -> MaskIndex:
+        return self
+
+    def flatten(self) -> MaskIndex:
+        return self
+
+    def expand_to_dim(self, n: int) -> ListIndex:
+        if n == 1:
+            return self
+
+        return super().expand_to_dim(n)
+
+    # endregion
@@ -5,6 +5,7 @@ import numpy as np
 
 from ch5mpy.indexing.base import Indexer
 from ch5mpy.indexing.list import ListIndex
+from ch5mpy.indexing.mask import MaskIndex
 from ch5mpy.indexing.single import SingleIndex
 from ch5mpy.indexing.slice import FullSlice
 from ch5mpy.indexing.special import EmptyList, NewAxis
@@ -24,6 +25,9 @@ class Vector:
 
     # region methods
     def try_as_slice(self) -> FullSlice | None:
+        if isinstance(self._index, MaskIndex):
+            return self._index.try_as_slice()
+
         array = self._index.as_array(flattened=True)
         array[array < 0] += self._index.max
 
@@ -0,0 +1,245 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Literal
+
+import numpy as np
+import numpy.typing as npt
+
+from ch5mpy._typing import HYPERSLAB
+from ch5mpy.options import _OPTIONS
+
+if TYPE_CHECKING:
+    from ch5mpy.indexing.selection import Selection
+
+READ_STRATEGY = Literal["direct", "indexers", "hyperslabs", "points", "bounding_box", "chunk_gather"]
+WRITE_STRATEGY = Literal["direct", "indexers", "hyperslabs", "points", "chunk_scatter"]
+
+# Contiguous datasets are modelled as chunked in blocks of (at most) this size along the last axis, to account for the
+# cost of seeking to non-contiguous elements.
+_CONTIGUOUS_BLOCK_SIZE = 64 * 1024
+
+# HDF5 unions of hyperslabs are built one hyperslab at a time, which gets quadratically slower with the number of
+# hyperslabs : above this number, h5py's fancy indexing (which builds the selection in compiled code) is faster
+MAX_HYPERSLABS = 1024
+
+# default size of HDF5's chunk cache (1 MiB)
+_DEFAULT_CHUNK_CACHE_SIZE = 1024 * 1024
+
+# Estimated overheads, expressed as a number of bytes that could be read instead :
+#   - for each chunk decoded (index lookup, filter pipeline, cache management)
+#   - for each block in an HDF5 selection, depending on how the selection is built (for chunk gathers, one block is
+#     one read call)
+_CHUNK_COST = 16 * 1024
+_BLOCK_COSTS: dict[READ_STRATEGY, int] = {
+    "direct": 0,
+    "indexers": 256,
+    "hyperslabs": 512,
+    "points": 64,
+    "bounding_box": 0,
+    "chunk_gather": 8 * 1024,
+}
+
+_DESCRIPTIONS: dict[READ_STRATEGY, str] = {
+    "direct": "read the selection with h5py's indexing",
+    "indexers": "read the sorted, unique list with h5py's fancy indexing, then reorder in memory",
+    "hyperslabs": "read runs of consecutive list elements as one union of hyperslabs, then reorder in memory",
+    "points": "read elements by batches of coordinates with HDF5 point selections",
+    "bounding_box": "read the bounding box with one hyperslab, then gather elements in memory",
+    "chunk_gather": "group elements by HDF5 chunk, read each chunk once and extract all its elements",
+}
+
+
+@dataclass(frozen=True)
+class ReadPlan:
+    """Estimated cost of reading a Selection from a dataset with a given strategy."""
+
+    strategy: READ_STRATEGY
+    nb_calls: int
+    nb_blocks: int
+    nb_chunks: int
+    nb_bytes: int
+
+    # region magic methods
+    def __str__(self) -> str:
+        return (
+            f"{self.strategy}: {_DESCRIPTIONS[self.strategy]}\n"
+            f"    {self.nb_calls} read call(s) selecting {self.nb_blocks} block(s), "
+            f"~{self.nb_bytes} bytes read from {self.nb_chunks} chunk(s)"
+        )
+
+    # endregion
+
+    # region attributes
+    @property
+    def cost(self) -> int:
+        return self.nb_bytes + _CHUNK_COST * self.nb_chunks + _BLOCK_COSTS[self.strategy] * self.nb_blocks
+
+    # endregion
+
+
+def get_points_batch_size(ndim: int) -> int:
+    """Number of elements to read at once with a point selection, within the memory budget."""
+    # coordinates, flat positions and read values take ~ (2 * ndim + 2) * 8 bytes per element
+    return max(1, _OPTIONS["max_memory_usage"].get() // ((2 * ndim + 2) * 8))
+
+
+def _get_chunk_shape(shape: tuple[int, ...], itemsize: int, chunks: tuple[int, ...] | None) -> tuple[int, ...]:
+    if chunks is not None:
+        return chunks
+
+    if not len(shape):
+        return ()
+
+    return (1,) * (len(shape) - 1) + (max(1, min(shape[-1], _CONTIGUOUS_BLOCK_SIZE // itemsize)),)
+
+
+def _nb_chunks_spanned(start: int, count: int, stride: int, chunk: int) -> int:
+    """Number of chunks touched along one axis by a (start, count, stride) hyperslab."""
+    if count == 0:
+        return 0
+
+    if stride >= chunk:
+        return count
+
+    return (start + (count - 1) * stride) // chunk - start // chunk + 1
+
+
+def _nb_chunks_in_box(box: HYPERSLAB, chunk_shape: tuple[int, ...]) -> int:
+    return int(
+        np.prod([_nb_chunks_spanned(s, c, st, chunk) for s, c, st, chunk in zip(*box, chunk_shape)], dtype=np.int64)
+    )
+
+
+def _nb_chunks_in_runs(starts: npt.NDArray[np.int_], counts: npt.NDArray[np.int_], chunk: int) -> int:
+    """Number of chunks touched along one axis by sorted, non-overlapping runs of consecutive elements."""
+    first_chunks = starts // chunk
+    last_chunks = (starts + counts - 1) // chunk
+
+    # do not count twice chunks shared with a previous run
+    previous_last_chunks = np.concatenate(([-1], last_chunks[:-1]))
+    return int(np.sum(last_chunks - np.maximum(first_chunks, previous_last_chunks + 1) + 1))
+
+
+def _nb_chunks_touched(selection: Selection, chunk_shape: tuple[int, ...], box: HYPERSLAB) -> int:
+    """Number of chunks holding at least one element of a selection (estimated for multiple lists)."""
+    if selection.uses_single_vector:
+        list_axis, starts, counts, _ = selection.get_vector_runs()
+
+        start, count, stride = (part[:list_axis] + part[list_axis + 1 :] for part in box)
+        return _nb_chunks_in_runs(starts, counts, chunk_shape[list_axis]) * _nb_chunks_in_box(
+            (start, count, stride), chunk_shape[:list_axis] + chunk_shape[list_axis + 1 :]
+        )
+
+    if selection.uses_long_indexing:
+        return min(int(np.prod(selection.out_shape, dtype=np.int64)), _nb_chunks_in_box(box, chunk_shape))
+
+    return _nb_chunks_in_box(box, chunk_shape)
+
+
+def get_read_plans(
+    selection: Selection,
+    dtype: npt.DTypeLike,
+    chunks: tuple[int, ...] | None = None,
+    cache_size: int = _DEFAULT_CHUNK_CACHE_SIZE,
+) -> list[ReadPlan]:
+    """
+    Estimate the cost of each strategy available for reading a selection, from the dataset's chunk layout, the size of
+    its chunk cache and the memory budget. Plans are sorted from cheapest to most expensive.
+    """
+    itemsize = np.dtype(dtype).itemsize
+    chunk_shape = _get_chunk_shape(selection.in_shape, itemsize, chunks)
+    chunk_bytes = int(np.prod(chunk_shape, dtype=np.int64)) * itemsize
+    nb_elements = int(np.prod(selection.out_shape, dtype=np.int64))
+
+    box = selection.get_bounding_box()
+    nb_chunks = _nb_chunks_touched(selection, chunk_shape, box)
+
+    if not selection.uses_long_indexing and not selection.uses_single_vector:
+        return [ReadPlan("direct", 1, 1, nb_chunks, nb_chunks * chunk_bytes)]
+
+    plans: list[ReadPlan] = []
+    box_chunks = _nb_chunks_in_box(box, chunk_shape)
+
+    if selection.uses_single_vector:
+        _, starts, counts, _ = selection.get_vector_runs()
+        nb_unique = int(np.sum(counts))
+
+        plans.append(ReadPlan("indexers", 1, nb_unique, nb_chunks, nb_chunks * chunk_bytes))
+
+        if len(starts) <= MAX_HYPERSLABS:
+            plans.append(ReadPlan("hyperslabs", 1, len(starts), nb_chunks, nb_chunks * chunk_bytes))
+
+    else:
+        batch_size = get_points_batch_size(len(selection.in_shape))
+
+        # points are read in the selection's order : when touched chunks do not fit in the chunk cache, a chunk can be
+        # evicted and decoded again for each of its elements
+        nb_decoded = nb_chunks if nb_chunks * chunk_bytes <= cache_size else nb_elements
+        nb_calls = -(-nb_elements // batch_size)
+        plans.append(ReadPlan("points", nb_calls, nb_elements, nb_decoded, nb_decoded * chunk_bytes))
+
+    if chunks is not None:
+        plans.append(ReadPlan("chunk_gather", nb_chunks, nb_chunks, nb_chunks, nb_chunks * chunk_bytes))
+
+    if int(np.prod(box[1], dtype=np.int64)) * itemsize <= _OPTIONS["max_memory_usage"].get():
+        plans.append(ReadPlan("bounding_box", 1, 1, box_chunks, box_chunks * chunk_bytes))
+
+    return sorted(plans, key=lambda plan: plan.cost)
+
+
+def plan_read(
+    selection: Selection,
+    dtype: npt.DTypeLike,
+    chunks: tuple[int, ...] | None = None,
+    cache_size: int = _DEFAULT_CHUNK_CACHE_SIZE,
+) -> ReadPlan:
+    """Get the cheapest strategy for reading a selection."""
+    return get_read_plans(selection, dtype, chunks, cache_size)[0]
+
+
+def get_chunk_cache_size(selection: Selection, dtype: npt.DTypeLike, chunks: tuple[int, ...]) -> int:
+    """
+    Size of the chunk cache for reading or writing a selection without decoding any chunk twice : all chunks touched
+    by lists (elements may be read in any order), or chunks touched by slices (they can be touched again by the next
+    slices, as in `H5Array.iter_chunks()`). Sizes are rounded up to a power of 2 (at least HDF5's default size) and
+    limited by the memory budget.
+    """
+    chunk_bytes = int(np.prod(chunks, dtype=np.int64)) * np.dtype(dtype).itemsize
+    nb_chunks = _nb_chunks_touched(selection, chunks, selection.get_bounding_box())
+    cache_size = max(_DEFAULT_CHUNK_CACHE_SIZE, nb_chunks * chunk_bytes)
+
+    return min(1 << (cache_size - 1).bit_length(), _OPTIONS["max_memory_usage"].get())
+
+
+def plan_write(
+    selection: Selection,
+    dtype: npt.DTypeLike,
+    chunks: tuple[int, ...] | None = None,
+    cache_size: int = _DEFAULT_CHUNK_CACHE_SIZE,
+) -> WRITE_STRATEGY:
+    """
+    Choose a strategy for writing a selection. Single lists must be sorted and unique (see
+    `array.io._write_permuted_vector()`), they are written as one union of hyperslabs when they form few runs of
+    consecutive elements or with h5py's fancy indexing otherwise. Multiple lists are written by batches of points, or
+    chunk by chunk when points would thrash the chunk cache.
+    """
+    if selection.uses_single_vector:
+        _, starts, counts, _ = selection.get_vector_runs()
+
+        # coalescing lists into runs only pays off when it significantly reduces the number of blocks to select
+        if len(starts) <= MAX_HYPERSLABS and len(starts) * 2 <= int(np.sum(counts)):
+            return "hyperslabs"
+
+        return "indexers"
+
+    if selection.uses_long_indexing:
+        # same costs as for reading : each chunk is read and written back, either once or once per element
+        for plan in get_read_plans(selection, dtype, chunks, cache_size):
+            if plan.strategy == "points":
+                return "points"
+
+            if plan.strategy == "chunk_gather":
+                return "chunk_scatter"
+
+    return "direct"
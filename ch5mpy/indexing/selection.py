@@ -1,20 +1,24 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
+from functools import lru_cache
 from itertools import chain, dropwhile, repeat, takewhile
-from typing import Any, Generator, Iterable, Iterator, overload
+from typing import Any, Callable, Generator, Iterable, Iterator, overload
 
 import numpy as np
 import numpy.typing as npt
 
-from ch5mpy._typing import SELECTOR
+import ch5mpy
+from ch5mpy._typing import HYPERSLAB, SELECTOR
 from ch5mpy.indexing.base import Indexer, as_indexer, boolean_array_as_indexer
 from ch5mpy.indexing.list import ListIndex
+from ch5mpy.indexing.mask import MaskIndex
 from ch5mpy.indexing.optimization import get_valid_indices
+from ch5mpy.indexing.planner import get_read_plans
 from ch5mpy.indexing.single import SingleIndex
 from ch5mpy.indexing.slice import FullSlice
 from ch5mpy.indexing.special import PLACEHOLDER, EmptyList, NewAxis, NewAxisType, PlaceHolderType
-from ch5mpy.indexing.utils import takewhile_inclusive
+from ch5mpy.indexing.utils import positive_slice_index, takewhile_inclusive
 
 
 @dataclass
@@ -85,6 +89,10 @@ def _as_indexers(indices: tuple[SELECTOR, ...], shape: tuple[int, ...]) -> Gener
             yield NewAxis
             continue
 
+        elif isinstance(index, ch5mpy.H5Array) and index.dtype == np.bool_ and index.ndim == 1:
+            yield from boolean_array_as_indexer(index, (next(shape_it),))
+            continue
+
         elif isinstance(index, (np.ndarray, list)):
             index = np.array(index)
 
@@ -100,13 +108,63 @@ def _as_indexers(indices: tuple[SELECTOR, ...], shape: tuple[int, ...]) -> Gener
         yield as_indexer(index, next(shape_it))  # type: ignore[arg-type]
 
 
+def _index_mask(indices: tuple[Indexer, ...], predicate: Callable[[Indexer], bool]) -> npt.NDArray[np.bool_]:
+    mask = np.fromiter((predicate(i) for i in indices), dtype=bool, count=len(indices))
+    # masks are shared between all users of a Selection, make sure they cannot be modified
+    mask.flags.writeable = False
+    return mask
+
+
+def _selector_signature(indices: tuple[SELECTOR, ...]) -> tuple[int | tuple[Any, ...] | None, ...] | None:
+    """
+    Get a hashable signature for selectors made only of integers, slices and new axes, or None if the selectors cannot
+    be hashed (e.g. lists or arrays).
+    """
+    signature: list[int | tuple[Any, ...] | None] = []
+
+    for index in indices:
+        if index is None:
+            signature.append(None)
+
+        elif isinstance(index, (int, np.integer)) and not isinstance(index, (bool, np.bool_)):
+            signature.append(int(index))
+
+        elif isinstance(index, slice):
+            signature.append((index.start, index.stop, index.step))
+
+        else:
+            return None
+
+    return tuple(signature)
+
+
+@lru_cache(maxsize=1024)
+def _selection_from_signature(signature: tuple[int | tuple[Any, ...] | None, ...], shape: tuple[int, ...]) -> Selection:
+    indices = tuple(slice(*index) if isinstance(index, tuple) else index for index in signature)
+    return Selection(_as_indexers(indices, shape), shape=shape)
+
+
 class Selection:
-    __slots__ = "_indices", "_array_shape"
+    __slots__ = (
+        "_indices",
+        "_array_shape",
+        "_is_newaxis",
+        "_is_single",
+        "_is_list",
+        "_is_slice",
+        "_out_shape",
+        "_out_shape_squeezed",
+    )
 
     # region magic methods
     def __init__(self, indices: Iterable[Indexer] | None, shape: tuple[int, ...], optimize: bool = True):
+        self._array_shape = shape
+        self._out_shape: tuple[int, ...] | None = None
+        self._out_shape_squeezed: tuple[int, ...] | None = None
+
         if indices is None:
             self._indices: tuple[Indexer, ...] = ()
+            self._set_index_kinds()
             return
 
         indices = tuple(indices)
@@ -122,8 +180,7 @@ class Selection:
             tuple(chain(_indices, () if first_list is None else (first_list.expand_to_dim(largest_dim),), it_indices)),
             optimize=optimize,
         )
-
-        self._array_shape = shape
+        self._set_index_kinds()
 
     def __repr__(self) -> str:
         return f"Selection{self._indices}\n" f"         {self.in_shape} --> {self.out_shape}"
@@ -181,19 +238,39 @@ class Selection:
 
     @property
     def is_newaxis(self) -> npt.NDArray[np.bool_]:
-        return np.array([x is NewAxis for x in self._indices], dtype=bool)
+        return self._is_newaxis
 
     @property
     def is_single(self) -> npt.NDArray[np.bool_]:
-        return np.array([isinstance(x, SingleIndex) for x in self._indices], dtype=bool)
+        return self._is_single
 
     @property
     def is_list(self) -> npt.NDArray[np.bool_]:
-        return np.array([isinstance(x, (ListIndex, EmptyList)) for x in self._indices], dtype=bool)
+        return self._is_list
 
     @property
     def is_slice(self) -> npt.NDArray[np.bool_]:
-        return np.array([isinstance(x, FullSlice) for x in self._indices], dtype=bool)
+        return self._is_slice
+
+    @property
+    def uses_long_indexing(self) -> bool:
+        """Does this selection contain multiple lists (selected elements must then be read one by one) ?"""
+        return sum(isinstance(x, ListIndex) for x in self._indices) > 1
+
+    @property
+    def uses_single_list(self) -> bool:
+        """Does this selection contain exactly one list (of any shape) ?"""
+        return sum(isinstance(x, ListIndex) for x in self._indices) == 1
+
+    @property
+    def uses_single_vector(self) -> bool:
+        """Does this selection contain exactly one list, with at most one dimension of length > 1 ?"""
+        return self.uses_single_list and sum(s > 1 for s in self._get_vector_index()[1].shape) <= 1
+
+    @property
+    def has_sorted_vector(self) -> bool:
+        """For selections with a single list, are the list's elements sorted and unique ?"""
+        return self._get_vector_index()[1].is_sorted_unique
 
     @property
     def in_shape(self) -> tuple[int, ...]:
@@ -201,24 +278,33 @@ class Selection:
 
     @property
     def out_shape(self) -> tuple[int, ...]:
-        if np.prod(self._array_shape) == 0:
-            return _compute_shape_empty_dset(self._indices, self._array_shape, new_axes=True)
+        if self._out_shape is None:
+            if 0 in self._array_shape:
+                self._out_shape = _compute_shape_empty_dset(self._indices, self._array_shape, new_axes=True)
 
-        len_end_shape = len(self._indices) - sum(self.is_newaxis)
-        return self._min_shape(new_axes=True) + self._array_shape[len_end_shape:]
+            else:
+                len_end_shape = len(self._indices) - int(self._is_newaxis.sum())
+                self._out_shape = self._min_shape(new_axes=True) + self._array_shape[len_end_shape:]
+
+        return self._out_shape
 
     @property
     def out_shape_squeezed(self) -> tuple[int, ...]:
-        if np.prod(self.in_shape) == 0:
-            shape = _compute_shape_empty_dset(self._indices, self._array_shape, new_axes=False)
+        if self._out_shape_squeezed is None:
+            if 0 in self._array_shape:
+                shape = _compute_shape_empty_dset(self._indices, self._array_shape, new_axes=False)
 
-        else:
-            len_end_shape = len(self._indices) - sum(self.is_newaxis)
-            shape = self._min_shape(new_axes=False) + self._array_shape[len_end_shape:]
+            else:
+                len_end_shape = len(self._indices) - int(self._is_newaxis.sum())
+                shape = self._min_shape(new_axes=False) + self._array_shape[len_end_shape:]
 
-        return tuple(
-            s for s, is_list in zip(shape, chain(self.is_list | self.is_single, repeat(False))) if s != 1 or not is_list
-        )
+            self._out_shape_squeezed = tuple(
+                s
+                for s, is_list in zip(shape, chain(self._is_list | self._is_single, repeat(False)))
+                if s != 1 or not is_list
+            )
+
+        return self._out_shape_squeezed
 
     # endregion
 
@@ -228,8 +314,19 @@ class Selection:
         if not isinstance(indices, tuple):
             indices = (indices,)
 
+        # selections are immutable : selections built from simple (hashable) selectors can be reused
+        signature = _selector_signature(indices)
+        if signature is not None:
+            return _selection_from_signature(signature, shape)
+
         return Selection(_as_indexers(indices, shape), shape=shape)
 
+    def _set_index_kinds(self) -> None:
+        self._is_newaxis = _index_mask(self._indices, lambda x: x is NewAxis)
+        self._is_single = _index_mask(self._indices, lambda x: isinstance(x, SingleIndex))
+        self._is_list = _index_mask(self._indices, lambda x: isinstance(x, (ListIndex, EmptyList)))
+        self._is_slice = _index_mask(self._indices, lambda x: isinstance(x, FullSlice))
+
     def get_indexers(
         self,
         sorted: bool = False,
@@ -251,20 +348,28 @@ class Selection:
 
         return tuple(get_indexer(i, sorted=sorted, enforce_1d=enforce_1d, for_h5=False) for i in self._indices)
 
-    def _min_shape(self, new_axes: bool) -> tuple[int, ...]:
-        last_slice_position = np.argwhere(self.is_slice)[-1, 0] if any(self.is_slice) else np.inf
-        first_list_position = np.argmax(self.is_list) if any(self.is_list) else -1
+    def _get_lists_axis(self) -> int:
+        """
+        Get the position of the lists' dimensions among the dimensions selected by slices and lists. A single list stays
+        in place, multiple lists go first unless they all come after the last slice.
+        """
+        list_positions = np.flatnonzero(self._is_list)
 
-        slice_indices_shape = tuple(len(s) for s in self._indices if isinstance(s, FullSlice))
-        list_indices_shape = np.broadcast_shapes(
-            *(lst.shape for lst in self._indices if isinstance(lst, (ListIndex, EmptyList)) and lst.ndim > 0)
-        )
+        if len(list_positions) == 1:
+            return int(self._is_slice[: list_positions[0]].sum())
 
-        if first_list_position < last_slice_position:
-            min_shape = list_indices_shape + slice_indices_shape
+        if len(list_positions) and self._is_slice.any() and list_positions[0] < np.flatnonzero(self._is_slice)[-1]:
+            return 0
 
-        else:
-            min_shape = slice_indices_shape + list_indices_shape
+        return int(self._is_slice.sum())
+
+    def _min_shape(self, new_axes: bool) -> tuple[int, ...]:
+        slice_indices_shape = tuple(len(s) for s in self._indices if isinstance(s, FullSlice))
+        list_shapes = [lst.shape for lst in self._indices if isinstance(lst, (ListIndex, EmptyList)) and lst.ndim > 0]
+        list_indices_shape = list_shapes[0] if len(list_shapes) == 1 else np.broadcast_shapes(*list_shapes)
+
+        lists_axis = self._get_lists_axis()
+        min_shape = slice_indices_shape[:lists_axis] + list_indices_shape + slice_indices_shape[lists_axis:]
 
         if not new_axes:
             return min_shape
@@ -356,6 +461,39 @@ class Selection:
 
         return before + middle + after
 
+    def _get_loading_grid(self, list_: ListIndex) -> tuple[int | npt.NDArray[np.int_], ...]:
+        """
+        Get indices (as open grids) into the loading array for reading a N-dimensional list as a flat vector : the
+        list's dimensions are indexed together by the (flattened) positions of its elements.
+        """
+        trailing_shape = self._array_shape[len(self._indices) - int(self._is_newaxis.sum()) :]
+        grid_sizes = [
+            list_.size if i is list_ else len(i)
+            for i in self._indices
+            if isinstance(i, FullSlice) or i is list_
+        ] + list(trailing_shape)
+
+        def grid(values: npt.NDArray[np.int_], axis: int) -> npt.NDArray[np.int_]:
+            return values.reshape((1,) * axis + (-1,) + (1,) * (len(grid_sizes) - axis - 1))
+
+        loading_grid: list[int | npt.NDArray[np.int_]] = []
+        grid_axis = 0
+
+        for index in chain(self._indices, (None for _ in trailing_shape)):
+            if index is NewAxis:
+                loading_grid.append(0)
+
+            elif index is list_:
+                positions = np.unravel_index(np.arange(list_.size), list_.shape)
+                loading_grid.extend(grid(p, grid_axis) for p in positions)
+                grid_axis += 1
+
+            elif not isinstance(index, SingleIndex):
+                loading_grid.append(grid(np.arange(grid_sizes[grid_axis]), grid_axis))
+                grid_axis += 1
+
+        return tuple(loading_grid)
+
     def _get_loading_sel_iter(self, it: Iterator[int], list_indices: list[int]) -> Generator[int | slice, None, None]:
         yield from (0 for _ in takewhile(lambda i: i is NewAxis, self._indices))
 
@@ -377,12 +515,187 @@ class Selection:
                 else:
                     yield slice(None)
 
+    def iter_points(self, batch_size: int) -> Generator[npt.NDArray[np.intp], None, None]:
+        """
+        Iterate over the coordinates of selected elements in the array, in the order of the selection's output and by
+        batches of at most `batch_size` elements. Each batch is a (nb_elements, ndim) array.
+        """
+        indices = [i for i in self._indices if not isinstance(i, NewAxisType)]
+        trailing_shape = self._array_shape[len(indices) :]
+
+        lists = np.broadcast_arrays(*(i.as_array() for i in indices if isinstance(i, ListIndex)))
+        lists_shape = lists[0].shape if len(lists) else ()
+        slices_shape = tuple(len(i) for i in indices if isinstance(i, FullSlice))
+
+        # same axes ordering as in `_min_shape()`
+        lists_axis = self._get_lists_axis()
+        lists_axes = slice(lists_axis, lists_axis + len(lists_shape))
+        grid_shape = slices_shape[:lists_axis] + lists_shape + slices_shape[lists_axis:] + trailing_shape
+        nb_points = int(np.prod(grid_shape))
+
+        for start in range(0, nb_points, batch_size):
+            grid = np.unravel_index(np.arange(start, min(start + batch_size, nb_points)), grid_shape)
+            list_position = grid[lists_axes]
+            coordinates = np.empty((len(grid[0]), len(self._array_shape)), dtype=np.intp)
+
+            lists_it, slice_index = iter(lists), 0
+            for dim, index in enumerate(indices):
+                if isinstance(index, SingleIndex):
+                    coordinates[:, dim] = positive_slice_index(int(index.as_numpy_index()), index.max)
+
+                elif isinstance(index, FullSlice):
+                    slice_axis = slice_index if slice_index < lists_axis else slice_index + len(lists_shape)
+                    coordinates[:, dim] = index.start + index.step * grid[slice_axis]
+                    slice_index += 1
+
+                else:
+                    coordinates[:, dim] = next(lists_it)[list_position]
+
+            for dim in range(len(trailing_shape)):
+                coordinates[:, len(indices) + dim] = grid[len(grid) - len(trailing_shape) + dim]
+
+            yield coordinates
+
+    def _get_vector_index(self) -> tuple[int, ListIndex]:
+        indices = [i for i in self._indices if not isinstance(i, NewAxisType)]
+        list_axis = next(axis for axis, i in enumerate(indices) if isinstance(i, ListIndex))
+        list_ = indices[list_axis]
+        assert isinstance(list_, ListIndex)
+
+        return list_axis, list_
+
+    def get_vector(self) -> tuple[int, npt.NDArray[np.int_]]:
+        """For selections with a single list, get the axis indexed by the list and its (flattened) elements."""
+        list_axis, list_ = self._get_vector_index()
+        return list_axis, list_.as_array(flattened=True)
+
+    def get_vector_runs(
+        self,
+    ) -> tuple[int, npt.NDArray[np.int_], npt.NDArray[np.int_], npt.NDArray[np.intp] | None]:
+        """
+        For selections with a single list, get the axis indexed by the list, its sorted unique elements as runs of
+        consecutive elements (start and length of each run) and the positions of the list's elements among the unique
+        elements (or None if the list is already sorted and unique).
+        """
+        list_axis, list_ = self._get_vector_index()
+        return list_axis, *list_.as_runs()
+
+    def with_vector(self, elements: npt.NDArray[np.int_]) -> Selection:
+        """For selections with a single list, get the same selection where the list is replaced by other elements."""
+        return Selection(
+            (ListIndex(elements, max=i.max) if isinstance(i, ListIndex) else i for i in self._indices),
+            shape=self._array_shape,
+        )
+
+    def with_runs(self, starts: npt.NDArray[np.int_], lengths: npt.NDArray[np.int_]) -> Selection:
+        """
+        For selections with a single list, get the same selection where the list is replaced by the elements of sorted,
+        non-overlapping runs of consecutive elements (which are not computed).
+        """
+        return Selection(
+            (MaskIndex(starts, lengths, max=i.max) if isinstance(i, ListIndex) else i for i in self._indices),
+            shape=self._array_shape,
+        )
+
+    def get_hyperslabs(self) -> tuple[list[HYPERSLAB], tuple[int, ...], int, npt.NDArray[np.intp] | None]:
+        """
+        For selections with a single list, get the union of contiguous blocks (hyperslabs, as (start, count, stride)
+        tuples) covering the selected elements. The list is sorted and made unique, then decomposed into runs of
+        consecutive indices so that each run is one hyperslab.
+
+        Returns:
+            The hyperslabs, the shape of the data they select (in C order), the axis of the list in that shape and the
+            positions along that axis of the list's elements (or None if the list was already sorted and unique).
+        """
+        indices = [i for i in self._indices if not isinstance(i, NewAxisType)]
+        list_axis, run_starts, run_lengths, inverse = self.get_vector_runs()
+        nb_unique = int(np.sum(run_lengths))
+
+        start, count, stride = [], [], []
+        for index in indices:
+            if isinstance(index, SingleIndex):
+                start.append(positive_slice_index(int(index.as_numpy_index()), index.max))
+                count.append(1)
+                stride.append(1)
+
+            elif isinstance(index, FullSlice):
+                start.append(index.start)
+                count.append(len(index))
+                stride.append(index.step)
+
+            else:
+                start.append(0)
+                count.append(nb_unique)
+                stride.append(1)
+
+        start += [0 for _ in self._array_shape[len(indices) :]]
+        count += list(self._array_shape[len(indices) :])
+        stride += [1 for _ in self._array_shape[len(indices) :]]
+
+        hyperslabs = []
+        for run_start, run_length in zip(run_starts, run_lengths):
+            start[list_axis], count[list_axis] = int(run_start), int(run_length)
+            hyperslabs.append((tuple(start), tuple(count), tuple(stride)))
+
+        count[list_axis] = nb_unique
+        return hyperslabs, tuple(count), list_axis, inverse
+
+    def get_bounding_box(self) -> HYPERSLAB:
+        """
+        Get the smallest hyperslab (as a (start, count, stride) tuple) containing all selected elements. Lists are
+        covered by the range between their smallest and largest element.
+        """
+        start, count, stride = [], [], []
+
+        for index in (i for i in self._indices if not isinstance(i, NewAxisType)):
+            if isinstance(index, SingleIndex):
+                start.append(positive_slice_index(int(index.as_numpy_index()), index.max))
+                count.append(1)
+                stride.append(1)
+
+            elif isinstance(index, FullSlice):
+                start.append(index.start)
+                count.append(len(index))
+                stride.append(index.step)
+
+            elif isinstance(index, ListIndex):
+                first, last = index.bounds
+                start.append(first)
+                count.append(last - first + 1)
+                stride.append(1)
+
+            else:
+                start.append(0)
+                count.append(0)
+                stride.append(1)
+
+        nb_indexed = len(start)
+        return (
+            tuple(start) + (0,) * (len(self._array_shape) - nb_indexed),
+            tuple(count) + self._array_shape[nb_indexed:],
+            tuple(stride) + (1,) * (len(self._array_shape) - nb_indexed),
+        )
+
+    def explain(self, dtype: npt.DTypeLike, chunks: tuple[int, ...] | None = None) -> str:
+        """
+        Describe how this selection would be read from a dataset with a given dtype and chunk shape (None for a
+        contiguous dataset) : the chosen strategy, the planned read calls and the estimated number of bytes read.
+        Other strategies that were considered are listed from cheapest to most expensive.
+        """
+        chosen, *others = get_read_plans(self, dtype, chunks)
+        description = f"{self}\nplanned read : {chosen}"
+
+        if len(others):
+            description += "\nalternatives :\n" + "\n".join(f"  - {plan}" for plan in others)
+
+        return description
+
     def iter_indexers(
         self, can_reorder: bool = True
     ) -> Generator[
         tuple[
             tuple[int | npt.NDArray[np.int_] | slice | None, ...],
-            slice | npt.NDArray[np.int_],
+            slice | npt.NDArray[np.int_] | tuple[slice | npt.NDArray[np.int_], ...],
             tuple[int | npt.NDArray[np.int_] | slice, ...],
         ],
         None,
@@ -403,14 +716,20 @@ class Selection:
             list_ = self._indices[list_indices[0]]
             assert isinstance(list_, ListIndex)
 
-            unique_list, inverse = np.unique(list_, return_inverse=True)
+            if list_.ndim == 1 and list_.is_sorted_unique:
+                # e.g. masks : do not sort (nor compute) the elements
+                already_sorted = already_unique = True
+
+            else:
+                unique_list, inverse = np.unique(list_, return_inverse=True)
 
-            already_sorted = np.array_equal(list_.as_array(sorted=True), list_.as_array())
-            already_unique = len(unique_list) == len(list_)
+                already_sorted = np.array_equal(list_.as_array(sorted=True), list_.as_array())
+                already_unique = len(unique_list) == len(list_)
 
             if can_reorder or already_sorted:
                 if list_.ndim == 1:
-                    indices = self.get_indexers(sorted=True, enforce_1d=True)
+                    indices = self.get_indexers(sorted=True, enforce_1d=True, for_h5=True)
+                    list_position = list_indices[0] - int(np.sum(self.is_newaxis[: list_indices[0]]))
 
                     if already_unique:
                         yield (
@@ -420,7 +739,7 @@ class Selection:
                         )
 
                     else:
-                        indices = indices[: list_indices[0]] + (unique_list,) + indices[list_indices[0] + 1 :]
+                        indices = indices[:list_position] + (unique_list,) + indices[list_position + 1 :]
                         yield (
                             indices,
                             inverse,
@@ -433,21 +752,24 @@ class Selection:
                     extra_after = len(tuple(takewhile(lambda x: x, list_.shape[extra_before + 1 :][::-1])))
 
                     yield (
-                        self.get_indexers(sorted=True, enforce_1d=True),
+                        self.get_indexers(sorted=True, enforce_1d=True, for_h5=True),
                         slice(None),
                         self._get_loading_sel(extra_before, extra_after),
                     )
 
                 else:
-                    raise NotImplementedError
-                    # for idx, list_e in enumerate(list_.as_array(sorted=True)):
-                    #     dataset_sel = tuple(
-                    #         list_e if i == list_indices[0] else get_indexer(e, for_h5=True)
-                    #         for i, e in enumerate(self._indices)
-                    #     )
-                    #     loading_sel = tuple(0 for s in self.out_shape if s == 1) + (idx,)
-
-                    #     yield dataset_sel, loading_sel
+                    # N-dimensional list : its sorted unique elements are read at once, then expanded along the list's
+                    # axis and scattered to the list's positions in the loading array
+                    indices = self.get_indexers(sorted=True, enforce_1d=True, for_h5=True)
+                    list_position = list_indices[0] - int(np.sum(self.is_newaxis[: list_indices[0]]))
+                    block_axis = sum(isinstance(i, FullSlice) for i in self._indices[: list_indices[0]])
+
+                    yield (
+                        indices[:list_position] + (unique_list,) + indices[list_position + 1 :],
+                        (slice(None),) * block_axis + (inverse,),
+                        self._get_loading_grid(list_),
+                    )
+                    already_sorted = True
 
                 if not already_sorted:
                     sel_it = chain(self.get_indexers(for_h5=True), repeat(slice(None)))
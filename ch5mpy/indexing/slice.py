@@ -79,6 +79,11 @@ class FullSlice(Indexer):
         if item is NewAxis:
             raise RuntimeError
 
+        from ch5mpy.indexing.mask import MaskIndex
+
+        if isinstance(item, MaskIndex) and self._step == 1:
+            return item.shift(self._start, max=self._max)
+
         return as_indexer(np.array(self)[item.as_numpy_index()], max=self._max)
 
     def __array__(self, dtype: npt.DTypeLike | None = None) -> npt.NDArray[Any]:
@@ -1,5 +1,8 @@
 from typing import Any, Callable, Generator, Iterable
 
+import numpy as np
+import numpy.typing as npt
+
 
 def takewhile_inclusive(predicate: Callable[[Any], bool], it: Iterable[Any]) -> Generator[Any, None, None]:
     while True:
@@ -12,3 +15,35 @@ def takewhile_inclusive(predicate: Callable[[Any], bool], it: Iterable[Any]) ->
 
 def positive_slice_index(value: int, max: int) -> int:
     return value if value >= 0 else max + value
+
+
+def get_runs(array: npt.NDArray[np.int_]) -> tuple[npt.NDArray[np.int_], npt.NDArray[np.int_]]:
+    """
+    Run-length decomposition of a sorted array of unique indices into contiguous blocks. Returns the start and the
+    length of each block, e.g. [0, 1, 2, 5, 6, 9] gives starts [0, 5, 9] and lengths [3, 2, 1].
+    """
+    if not len(array):
+        return np.empty(0, dtype=array.dtype), np.empty(0, dtype=array.dtype)
+
+    run_starts = np.flatnonzero(np.concatenate(([True], np.diff(array) != 1)))
+    return array[run_starts], np.diff(np.append(run_starts, len(array)))
+
+
+def runs_to_elements(starts: npt.NDArray[np.int_], lengths: npt.NDArray[np.int_]) -> npt.NDArray[np.int_]:
+    """Inverse of `get_runs()` : get all elements from the start and length of runs of consecutive elements."""
+    run_offsets = np.concatenate(([0], np.cumsum(lengths)[:-1]))
+    elements: npt.NDArray[np.int_] = np.arange(int(np.sum(lengths)), dtype=np.int64) + np.repeat(
+        starts - run_offsets, lengths
+    )
+    return elements
+
+
+def runs_to_mask(
+    starts: npt.NDArray[np.int_], lengths: npt.NDArray[np.int_], offset: int, size: int
+) -> npt.NDArray[np.bool_]:
+    """Get a boolean mask of `size` elements, starting at `offset`, which is True for elements inside runs."""
+    boundaries = np.zeros(size + 1, dtype=np.int64)
+    np.add.at(boundaries, np.clip(starts - offset, 0, size), 1)
+    np.add.at(boundaries, np.clip(starts + lengths - offset, 0, size), -1)
+    mask: npt.NDArray[np.bool_] = np.cumsum(boundaries[:-1]) > 0
+    return mask
@@ -1,3 +1,4 @@
+from ch5mpy.io.load import LazyObject, load_object
 from ch5mpy.io.read import read_object
 from ch5mpy.io.write import (
     store_dataset,
@@ -8,6 +9,8 @@ from ch5mpy.io.write import (
 )
 
 __all__ = [
+    "LazyObject",
+    "load_object",
     "read_object",
     "store_dataset",
     "write_dataset",
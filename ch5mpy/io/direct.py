@@ -0,0 +1,199 @@
+from __future__ import annotations
+
+import zlib
+from concurrent.futures import ThreadPoolExecutor
+from itertools import product
+from typing import Any, Iterator
+
+import numpy as np
+import numpy.typing as npt
+from h5py.h5z import FILTER_DEFLATE, FILTER_SHUFFLE  # type: ignore[import-untyped]
+
+from ch5mpy._typing import HYPERSLAB
+from ch5mpy.objects import Dataset, DatasetWrapper
+from ch5mpy.options import _OPTIONS
+
+
+def get_python_filters(dataset: Dataset[Any] | DatasetWrapper[Any]) -> tuple[bool, int] | None:
+    """
+    Get the (shuffle, gzip level) filters of a chunked dataset of numbers compressed with gzip, which can be applied
+    in Python. Returns None for datasets without compression or with other filters.
+    """
+    if not isinstance(dataset, Dataset) or dataset.chunks is None or dataset.dtype.kind not in "biufc":
+        return None
+
+    plist = dataset.id.get_create_plist()  # type: ignore[attr-defined]
+    shuffle, level = False, None
+
+    for i in range(plist.get_nfilters()):
+        code, _, values, _ = plist.get_filter(i)
+
+        if code == FILTER_SHUFFLE and level is None:
+            shuffle = True
+
+        elif code == FILTER_DEFLATE and level is None:
+            level = values[0]
+
+        else:
+            return None
+
+    return None if level is None else (shuffle, level)
+
+
+def encode_chunk(chunk: npt.NDArray[Any], shuffle: bool, level: int) -> bytes:
+    """Apply HDF5's shuffle and deflate filters to the data of a whole chunk."""
+    data = np.ascontiguousarray(chunk)
+
+    if shuffle and data.itemsize > 1:
+        # group the bytes of elements by position : all first bytes, then all second bytes, ...
+        data = np.ascontiguousarray(data.view(np.uint8).reshape(-1, data.itemsize).T)
+
+    return zlib.compress(data.data, level)
+
+
+def decode_chunk(
+    data: bytes, filter_mask: int, shuffle: bool, dtype: np.dtype[Any], chunks: tuple[int, ...]
+) -> npt.NDArray[Any]:
+    """Undo HDF5's shuffle and deflate filters (except those skipped, as marked in `filter_mask`) on a raw chunk."""
+    if not filter_mask & (1 << shuffle):
+        data = zlib.decompress(data)
+
+    raw = np.frombuffer(data, dtype=np.uint8)
+
+    if shuffle and not filter_mask & 1 and dtype.itemsize > 1:
+        raw = np.ascontiguousarray(raw.reshape(dtype.itemsize, -1).T)
+
+    return raw.view(dtype).reshape(chunks)
+
+
+def _whole_chunks_range(start: int, stop: int, chunk: int, size: int) -> tuple[int, int]:
+    """Get the range of indices in [start, stop) covered by whole chunks, the last chunk of an axis may be partial."""
+    low = -(-start // chunk) * chunk
+    high = size if stop == size else stop // chunk * chunk
+    return low, max(low, high)
+
+
+def _partial_chunks_boxes(
+    start: tuple[int, ...], stop: tuple[int, ...], whole: list[tuple[int, int]]
+) -> Iterator[tuple[slice, ...]]:
+    """Split the part of the box [start, stop) outside of whole chunks into boxes."""
+    for axis in range(len(start)):
+        inner = tuple(slice(low, high) for low, high in whole[:axis])
+        outer = tuple(slice(s, e) for s, e in zip(start[axis + 1 :], stop[axis + 1 :]))
+
+        for s, e in ((start[axis], whole[axis][0]), (whole[axis][1], stop[axis])):
+            if s < e:
+                yield inner + (slice(s, e),) + outer
+
+
+def write_direct_chunks(
+    dataset: Dataset[Any] | DatasetWrapper[Any], values: npt.NDArray[Any], hyperslab: HYPERSLAB, shape: tuple[int, ...]
+) -> bool:
+    """
+    Write values, broadcast to `shape`, to a single hyperslab of a gzip-compressed dataset : whole chunks are compressed
+    on `io_threads` threads and written directly to the file, the rest goes through HDF5's filter pipeline.
+    Returns False, without writing anything, when chunks cannot be compressed in Python or when no chunk is whole.
+    """
+    if _OPTIONS["io_threads"] == 1:
+        return False
+
+    filters = get_python_filters(dataset)
+    start, count, stride = hyperslab
+
+    if filters is None or any(s != 1 for s in stride):
+        return False
+
+    assert isinstance(dataset, Dataset) and dataset.chunks is not None
+    chunks = dataset.chunks
+    stop = tuple(s + c for s, c in zip(start, count))
+    whole = [_whole_chunks_range(*bounds) for bounds in zip(start, stop, chunks, dataset.shape)]
+
+    if any(low == high for low, high in whole):
+        return False
+
+    if values.size == np.prod(shape) and values.shape != shape:
+        values = values.reshape(shape)
+
+    # values in the dataset's type and byte order, with one dimension per axis of the dataset
+    block = np.broadcast_to(np.asarray(values, dtype=dataset.dtype), shape).reshape(count)
+    dataset.discard_fingerprint()
+
+    for box in _partial_chunks_boxes(start, stop, whole):
+        local = tuple(slice(b.start - s, b.stop - s) for b, s in zip(box, start))
+        dataset.write_direct(np.ascontiguousarray(block[local]), dest_sel=box)
+
+    def encode(offset: tuple[int, ...]) -> bytes:
+        chunk = block[tuple(slice(o - s, min(o + c, e) - s) for o, s, c, e in zip(offset, start, chunks, stop))]
+
+        if chunk.shape != chunks:
+            # chunks at the end of axes are stored whole, padded as HDF5 does (the padding appears when expanding)
+            padded = np.full(chunks, dataset.fillvalue, dtype=dataset.dtype)  # type: ignore[attr-defined]
+            padded[tuple(slice(0, n) for n in chunk.shape)] = chunk
+            chunk = padded
+
+        return encode_chunk(chunk, *filters)
+
+    offsets = list(product(*(range(low, high, c) for (low, high), c in zip(whole, chunks))))
+
+    with ThreadPoolExecutor(_OPTIONS["io_threads"]) as executor:
+        for offset, data in zip(offsets, executor.map(encode, offsets)):
+            dataset.id.write_direct_chunk(offset, data)  # type: ignore[attr-defined]
+
+    return True
+
+
+def read_direct_chunks(
+    dataset: Dataset[Any] | DatasetWrapper[Any], hyperslab: HYPERSLAB, dest: npt.NDArray[Any]
+) -> bool:
+    """
+    Read a single hyperslab of a gzip-compressed dataset into `dest` (of the same size) : raw chunks are read directly
+    from the file and decompressed on `io_threads` threads.
+    Returns False, without reading anything, when chunks cannot be decompressed in Python or when the hyperslab is
+    within a single chunk (which is better left to HDF5 and its chunk cache).
+    """
+    if _OPTIONS["io_threads"] == 1:
+        return False
+
+    filters = get_python_filters(dataset)
+    start, count, stride = hyperslab
+
+    if filters is None or any(s != 1 for s in stride) or not np.prod(count):
+        return False
+
+    assert isinstance(dataset, Dataset) and dataset.chunks is not None
+    chunks = dataset.chunks
+    stop = tuple(s + c for s, c in zip(start, count))
+    offsets = list(product(*(range(s // c * c, e, c) for s, e, c in zip(start, stop, chunks))))
+
+    if len(offsets) == 1:
+        return False
+
+    shuffle, _ = filters
+    dtype = dataset.dtype
+    contiguous = dest.flags.c_contiguous
+    block = dest.reshape(count) if contiguous else np.empty(count, dtype=dest.dtype)
+
+    def decode(offset: tuple[int, ...]) -> npt.NDArray[Any]:
+        try:
+            filter_mask, data = dataset.id.read_direct_chunk(offset)  # type: ignore[attr-defined]
+
+        except RuntimeError:
+            # chunk not allocated
+            return np.full(chunks, dataset.fillvalue, dtype=dtype)  # type: ignore[attr-defined]
+
+        return decode_chunk(data, filter_mask, shuffle, dtype, chunks)
+
+    with ThreadPoolExecutor(_OPTIONS["io_threads"]) as executor:
+        # raw chunks are read one at a time while others are decompressed
+        for offset, chunk in zip(offsets, executor.map(decode, offsets)):
+            low = tuple(max(o, s) for o, s in zip(offset, start))
+            high = tuple(min(o + c, e) for o, c, e in zip(offset, chunks, stop))
+
+            block[tuple(slice(lo - s, hi - s) for lo, hi, s in zip(low, high, start))] = chunk[
+                tuple(slice(lo - o, hi - o) for lo, hi, o in zip(low, high, offset))
+            ]
+
+    if not contiguous:
+        dest[...] = block.reshape(dest.shape)
+
+    return True
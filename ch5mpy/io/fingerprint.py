@@ -0,0 +1,118 @@
+from __future__ import annotations
+
+import hashlib
+from concurrent.futures import ThreadPoolExecutor
+from itertools import product
+from typing import Any, Iterator
+
+import h5py
+import numpy as np
+import numpy.typing as npt
+
+from ch5mpy.objects import Dataset
+from ch5mpy.objects.dataset import FINGERPRINT
+from ch5mpy.options import _OPTIONS
+
+_DIGEST_SIZE = 16
+# HDF5 stores attributes of up to 64KiB in object headers
+_MAX_NODES = 4000
+
+
+def can_fingerprint(dataset: Dataset[Any], values: npt.NDArray[Any]) -> bool:
+    """Whether a fingerprint of `values` can describe the content of `dataset`."""
+    return (
+        dataset.chunks is not None
+        and values.dtype.kind in "biufc"
+        and values.dtype == dataset.dtype
+        and values.shape == dataset.shape
+    )
+
+
+def _chunk_boxes(shape: tuple[int, ...], chunks: tuple[int, ...]) -> Iterator[tuple[slice, ...]]:
+    """Iterate over the chunks of a dataset, in C order."""
+    for offset in product(*(range(0, s, c) for s, c in zip(shape, chunks))):
+        yield tuple(slice(o, min(o + c, s)) for o, c, s in zip(offset, chunks, shape))
+
+
+def _hash(data: Any) -> bytes:
+    return hashlib.blake2b(data, digest_size=_DIGEST_SIZE).digest()
+
+
+def _nodes_level(nb_chunks: int) -> int:
+    """Level of the hash tree which is stored : each node at level k covers 2**k consecutive chunks."""
+    level = 0
+
+    while -(-nb_chunks // 2**level) > _MAX_NODES:
+        level += 1
+
+    return level
+
+
+def compute_fingerprint(values: npt.NDArray[Any], chunks: tuple[int, ...]) -> npt.NDArray[np.uint8]:
+    """
+    Build the hash tree of an array stored with a given chunk shape : chunks are hashed (on `io_threads` threads), then
+    pairs of hashes are hashed until at most a few thousand nodes remain. Returns the nodes, one row of bytes per node.
+    """
+
+    def encode(box: tuple[slice, ...]) -> bytes:
+        return _hash(np.ascontiguousarray(values[box]).data)
+
+    boxes = list(_chunk_boxes(values.shape, chunks))
+
+    if _OPTIONS["io_threads"] > 1:
+        with ThreadPoolExecutor(_OPTIONS["io_threads"]) as executor:
+            nodes = list(executor.map(encode, boxes))
+
+    else:
+        nodes = [encode(box) for box in boxes]
+
+    for _ in range(_nodes_level(len(nodes))):
+        nodes = [_hash(b"".join(nodes[i : i + 2])) for i in range(0, len(nodes), 2)]
+
+    return np.frombuffer(b"".join(nodes), dtype=np.uint8).reshape(-1, _DIGEST_SIZE)
+
+
+def get_fingerprint(dataset: Dataset[Any]) -> npt.NDArray[np.uint8] | None:
+    """Get the fingerprint stored with a dataset, if its content was not modified since it was computed."""
+    with h5py._objects.phil:  # type: ignore[attr-defined]
+        if not h5py.h5a.exists(dataset.id, FINGERPRINT.encode()):  # type: ignore[attr-defined]
+            return None
+
+    return np.asarray(dataset.attrs.get(FINGERPRINT), dtype=np.uint8)
+
+
+def set_fingerprint(dataset: Dataset[Any], fingerprint: npt.NDArray[np.uint8]) -> None:
+    dataset.attrs[FINGERPRINT] = fingerprint
+
+
+def changed_chunks(
+    dataset: Dataset[Any], values: npt.NDArray[Any], fingerprint: npt.NDArray[np.uint8] | None
+) -> list[tuple[slice, ...]]:
+    """
+    Find the chunks of `dataset` whose content differs from `values` (of the same shape and type as the dataset).
+    Given the fingerprint of `values` and with a fingerprint stored in the dataset, fingerprints are compared and
+    nothing is read (a fingerprint is not discarded by writes that bypass ch5mpy). Otherwise, chunks are read and
+    compared one by one.
+    """
+    assert dataset.chunks is not None
+    boxes = list(_chunk_boxes(values.shape, dataset.chunks))
+    stored = None if fingerprint is None else get_fingerprint(dataset)
+
+    if fingerprint is not None and stored is not None and stored.shape == fingerprint.shape:
+        span = 2 ** _nodes_level(len(boxes))
+        changed = np.flatnonzero((stored != fingerprint).any(axis=1))
+        return [box for node in changed for box in boxes[node * span : (node + 1) * span]]
+
+    buffer = np.empty(np.prod(dataset.chunks), dtype=dataset.dtype)
+    changed_boxes = []
+
+    for box in boxes:
+        count = tuple(b.stop - b.start for b in box)
+        chunk = buffer[: np.prod(count)]
+        dataset.read_hyperslabs(chunk, [(tuple(b.start for b in box), count, (1,) * len(box))])
+
+        # bytes are compared, as hashes are
+        if chunk.tobytes() != np.ascontiguousarray(values[box]).tobytes():
+            changed_boxes.append(box)
+
+    return changed_boxes
@@ -0,0 +1,144 @@
+from __future__ import annotations
+
+from typing import Any, Iterator, Literal, MutableMapping, MutableSequence, Union
+
+import numpy as np
+import numpy.typing as npt
+
+import ch5mpy
+from ch5mpy.io.read import read_object
+from ch5mpy.objects import Dataset, Group, H5Object
+from ch5mpy.options import _OPTIONS
+
+_CONTAINER = Union[MutableMapping[str, Any], MutableSequence[Any]]
+_NOT_LOADED = object()
+
+
+def _read_in_memory(data: Dataset[Any] | Group) -> Any:
+    """Read an object from a .h5 file, as in-memory objects."""
+    if isinstance(data, Dataset) and data.ndim and data.dtype.kind in "biufc":
+        # as read by H5Arrays, without wrapping the dataset first
+        return data[()]
+
+    value = read_object(data, error=_OPTIONS["error_mode"])
+
+    if isinstance(value, (ch5mpy.H5Array, H5Object)):
+        return value.copy()
+
+    return value
+
+
+class LazyObject:
+    """Proxy to an object in a .h5 file, which is read in memory on first access."""
+
+    # region magic methods
+    def __init__(self, data: Dataset[Any] | Group):
+        self._data = data
+        self._value: Any = _NOT_LOADED
+
+    def __repr__(self) -> str:
+        if not self.is_loaded:
+            return f"LazyObject({self._data.name})"
+
+        return f"LazyObject({self._value!r})"
+
+    def __getattr__(self, attr: str) -> Any:
+        if attr in ("_data", "_value"):
+            raise AttributeError(attr)
+
+        return getattr(self.get(), attr)
+
+    def __getitem__(self, item: Any) -> Any:
+        return self.get()[item]
+
+    def __len__(self) -> int:
+        return len(self.get())
+
+    def __iter__(self) -> Iterator[Any]:
+        return iter(self.get())
+
+    def __eq__(self, other: object) -> Any:
+        return self.get() == other
+
+    def __array__(self, dtype: npt.DTypeLike | None = None, copy: bool | None = None) -> npt.NDArray[Any]:
+        return np.asarray(self.get(), dtype=dtype)
+
+    # endregion
+
+    # region predicates
+    @property
+    def is_loaded(self) -> bool:
+        return self._value is not _NOT_LOADED
+
+    # endregion
+
+    # region methods
+    def get(self) -> Any:
+        """Get the object, reading it from the file the first time."""
+        if self._value is _NOT_LOADED:
+            self._value = _read_in_memory(self._data)
+
+        return self._value
+
+    # endregion
+
+
+def _plan(
+    data: Dataset[Any] | Group,
+    container: _CONTAINER,
+    key: Any,
+    reads: list[tuple[_CONTAINER, Any, Any]],
+    h5_type: str | None = None,
+) -> None:
+    """
+    Build the in-memory structure of an object in `container[key]`, recording datasets and objects of custom classes
+    (which are read by their class) in `reads`, to be read later.
+    """
+    if isinstance(data, Dataset):
+        reads.append((container, key, data))
+        return
+
+    if h5_type is None:
+        h5_type = data.attrs.get("__h5_type__", "<UNKNOWN>")
+
+    if h5_type == "object":
+        reads.append((container, key, data))
+
+    elif h5_type == "list":
+        container[key] = [None] * len(data)
+
+        for index in range(len(data)):
+            _plan(data[str(index)], container[key], index, reads)
+
+    else:
+        container[key] = {}
+
+        for name in data.keys():
+            _plan(data[name], container[key], name, reads)
+
+
+def load_object(
+    data: Dataset[Any] | Group, lazy: bool = False, h5_type: Literal["dict", "list"] | None = None
+) -> Any:
+    """
+    Read an object from a .h5 file in memory, with all datasets of nested dicts and lists.
+
+    Args:
+        data: a dataset or group to read.
+        lazy: get LazyObjects instead of datasets and objects, which are only read on first access.
+        h5_type: read a group as a dict or a list, whatever its type (by default, from its `__h5_type__` attribute).
+    """
+    root: dict[str, Any] = {}
+    reads: list[tuple[_CONTAINER, Any, Any]] = []
+    _plan(data, root, "", reads, h5_type)
+
+    if lazy:
+        for container, key, obj in reads:
+            container[key] = LazyObject(obj)
+
+        return root[""]
+
+    for container, key, obj in reads:
+        container[key] = _read_in_memory(obj)
+
+    return root[""]
@@ -2,7 +2,7 @@ from __future__ import annotations
 
 import pickle
 from numbers import Number
-from typing import TYPE_CHECKING, Any, Mapping
+from typing import TYPE_CHECKING, Any, Mapping, cast
 
 import numpy as np
 import numpy.typing as npt
@@ -11,14 +11,34 @@ from tqdm.auto import tqdm
 
 import ch5mpy.dict
 from ch5mpy.functions import AnonymousArrayCreationFunc
+from ch5mpy.io.direct import write_direct_chunks
+from ch5mpy.io.fingerprint import can_fingerprint, changed_chunks, compute_fingerprint, get_fingerprint, set_fingerprint
+from ch5mpy.names import H5Mode
 from ch5mpy.objects import Dataset, File, Group
-from ch5mpy.types import SupportsH5Write
+from ch5mpy.options import _OPTIONS
+from ch5mpy.types import H5Filters, SupportsH5Write
 from ch5mpy.utils import is_sequence
 
 if TYPE_CHECKING:
     from ch5mpy import H5Array
 
 
+def guess_chunks(shape: tuple[int, ...], itemsize: int, nbytes: int, axis: int = 0) -> tuple[int, ...]:
+    """
+    Get a chunk shape of about `nbytes` bytes for a dataset mostly accessed along `axis` (i.e. one index of `axis` at a
+    time) : chunks span as much as possible of the other axes, starting from the last one, and the remaining budget
+    is spent on `axis`. Empty axes (e.g. of datasets to expand) get the remaining budget too.
+    """
+    remaining = max(1, nbytes // max(1, itemsize))
+    chunks = [1] * len(shape)
+
+    for i in [i for i in reversed(range(len(shape))) if i != axis] + [axis]:
+        chunks[i] = max(1, remaining if shape[i] == 0 else min(shape[i], remaining))
+        remaining = max(1, remaining // chunks[i])
+
+    return tuple(chunks)
+
+
 def store_dataset(
     array: npt.NDArray[Any] | H5Array[Any] | None,
     loc: Group | File,
@@ -28,8 +48,24 @@ def store_dataset(
     chunks: bool | tuple[int, ...] = True,
     maxshape: int | tuple[int | None, ...] | None = None,
     fill_value: Any = None,
+    filters: H5Filters | None = None,
+    chunk_axis: int = 0,
 ) -> Dataset[Any]:
-    """Store a dataset."""
+    """
+    Store a dataset. With the `trust_fingerprints` option, chunked numeric datasets are stored with a fingerprint of
+    their content, so that copying an array to them later only writes the chunks whose fingerprint changed, without
+    reading them. Writes that bypass ch5mpy (e.g. with h5py) leave a stale fingerprint behind, only enable the option
+    for files that are only modified with ch5mpy.
+
+    Args:
+        chunks: shape of chunks, True to choose it from the `chunk_bytes` option and `chunk_axis`, False to store the
+            dataset contiguously.
+        filters: filters (e.g. compression) applied to the chunks, the `filters` option is used if None.
+        chunk_axis: axis along which the dataset will mostly be accessed, for choosing the shape of chunks.
+
+    Raises:
+        ValueError: if filters are given for a contiguous dataset.
+    """
     if not loc.file.id.valid:
         raise OSError("Cannot write data to closed file.")
 
@@ -56,13 +92,15 @@ def store_dataset(
     elif shape is None:
         raise ValueError("At least one of `array` or `shape` must be provided.")
 
-    if chunks:
+    # scalar datasets cannot be chunked
+    if chunks and len(shape):
         if chunks is True:  # literally `True`, not a tuple
-            # FIXME : causes huge lag
-            # parsed_chunks = (get_size(ch5mpy.H5Array.MAX_MEM_USAGE),) + (1,) * (len(shape) - 1)
-            pass
+            parsed_chunks: tuple[int, ...] | None = guess_chunks(
+                shape, np.dtype(dtype).itemsize, _OPTIONS["chunk_bytes"].get(), chunk_axis
+            )
 
-        parsed_chunks = chunks
+        else:
+            parsed_chunks = cast(tuple[int, ...], chunks)
 
         if maxshape is None:
             maxshape = (None,) * len(shape)
@@ -70,20 +108,67 @@ def store_dataset(
     else:
         parsed_chunks = None
 
+    if filters is None:
+        filters = _OPTIONS["filters"] if parsed_chunks is not None else H5Filters()
+
+    elif parsed_chunks is None and filters:
+        raise ValueError("Filters can only be applied to chunked datasets.")
+
+    # write chunks compressed in parallel after creating the dataset, if possible
+    direct = (
+        _OPTIONS["io_threads"] > 1
+        and isinstance(array, np.ndarray)
+        and array.dtype.kind in "biufc"
+        and parsed_chunks is not None
+        and filters.get("compression") == "gzip"
+    )
+
     dset = loc.create_dataset(
         name,
-        data=array,
+        data=None if direct else array,
         shape=shape,
         dtype=dtype,
         chunks=parsed_chunks,
         maxshape=maxshape,
         fillvalue=fill_value,
+        **filters,
     )
     dset.attrs["dtype"] = str_dtype
 
+    if direct:
+        array = cast(npt.NDArray[Any], array)
+        hyperslab = ((0,) * len(shape), shape, (1,) * len(shape))
+
+        if not write_direct_chunks(dset, array, hyperslab, shape):
+            dset.write_direct(array)
+
+    if _OPTIONS["trust_fingerprints"] and isinstance(array, np.ndarray) and can_fingerprint(dset, array):
+        set_fingerprint(dset, compute_fingerprint(array, cast(tuple[int, ...], dset.chunks)))
+
     return dset
 
 
+def _update_dataset(dataset: Dataset[Any], array: Any) -> None:
+    """Copy an array to a dataset of the same shape and type, only writing the chunks that changed."""
+    if not isinstance(array, np.ndarray) or not can_fingerprint(dataset, array):
+        dataset[()] = array
+        return
+
+    trusted = _OPTIONS["trust_fingerprints"]
+    fingerprint = compute_fingerprint(array, cast(tuple[int, ...], dataset.chunks)) if trusted else None
+
+    for box in changed_chunks(dataset, array, fingerprint):
+        dataset.write_direct(np.ascontiguousarray(array[box]), dest_sel=box)
+
+    # the fingerprint is stored once known to describe the dataset, unless the file is opened read-only
+    if (
+        fingerprint is not None
+        and dataset.file.mode != H5Mode.READ
+        and not np.array_equal(get_fingerprint(dataset), fingerprint)  # type: ignore[arg-type]
+    ):
+        set_fingerprint(dataset, fingerprint)
+
+
 def _has_dataset_attributes(obj: Any) -> bool:
     return hasattr(obj, "shape") and hasattr(obj, "dtype")
 
@@ -95,14 +180,16 @@ def write_dataset(
     *,
     chunks: bool | tuple[int, ...] = True,
     maxshape: tuple[int, ...] | None = None,
+    filters: H5Filters | None = None,
+    chunk_axis: int = 0,
 ) -> None:
-    """Write an array-like object to a H5 dataset."""
+    """Write an array-like object to a H5 dataset (see `store_dataset()` for the chunks and filters)."""
     if isinstance(loc, ch5mpy.dict.H5Dict):
         loc = loc.file
 
     if isinstance(obj, Mapping):
         group = loc.create_group(name, track_order=True)
-        write_datasets(group, **obj)
+        write_datasets(group, chunks=chunks, maxshape=maxshape, filters=filters, chunk_axis=chunk_axis, **obj)
         return
 
     # cast to np.array if needed (to get shape and dtype)
@@ -123,13 +210,13 @@ def write_dataset(
 
         if loc[name].shape == array.shape and loc[name].dtype == array.dtype:
             # a similar array already exists > simply copy the data
-            loc[name][()] = array
+            _update_dataset(loc[name], array)
             return
 
         # a different array was stored, delete it before storing the new array
         del loc[name]
 
-    store_dataset(array, loc, name, chunks=chunks, maxshape=maxshape)
+    store_dataset(array, loc, name, chunks=chunks, maxshape=maxshape, filters=filters, chunk_axis=chunk_axis)
 
 
 def write_datasets(
@@ -137,11 +224,13 @@ def write_datasets(
     *,
     chunks: bool | tuple[int, ...] = True,
     maxshape: tuple[int, ...] | None = None,
+    filters: H5Filters | None = None,
+    chunk_axis: int = 0,
     **kwargs: Any,
 ) -> None:
     """Write multiple array-like objects to H5 datasets."""
     for name, obj in kwargs.items():
-        write_dataset(obj, loc, name, chunks=chunks, maxshape=maxshape)
+        write_dataset(obj, loc, name, chunks=chunks, maxshape=maxshape, filters=filters, chunk_axis=chunk_axis)
 
 
 def write_object(
@@ -153,8 +242,10 @@ def write_object(
     maxshape: tuple[int, ...] | None = None,
     overwrite: bool = False,
     progress: tqdm[Any] | None = None,
+    filters: H5Filters | None = None,
+    chunk_axis: int = 0,
 ) -> None:
-    """Write any object to a H5 file."""
+    """Write any object to a H5 file (see `store_dataset()` for the chunks and filters of datasets)."""
     if isinstance(loc, ch5mpy.dict.H5Dict):
         loc = loc.file
 
@@ -169,10 +260,18 @@ def write_object(
 
     elif isinstance(obj, Mapping):
         group = loc.create_group(name, overwrite=overwrite, track_order=True) if name else loc
-        write_objects(group, **obj, chunks=chunks, maxshape=maxshape, progress=progress)
+        write_objects(
+            group,
+            **obj,
+            chunks=chunks,
+            maxshape=maxshape,
+            progress=progress,
+            filters=filters,
+            chunk_axis=chunk_axis,
+        )
 
     elif is_sequence(obj):
-        write_dataset(obj, loc, name, chunks=chunks, maxshape=maxshape)
+        write_dataset(obj, loc, name, chunks=chunks, maxshape=maxshape, filters=filters, chunk_axis=chunk_axis)
 
     else:
         name = name or "/"
@@ -198,6 +297,8 @@ def write_objects(
     maxshape: tuple[int, ...] | None = None,
     overwrite: bool = False,
     progress: tqdm[Any] | None = None,
+    filters: H5Filters | None = None,
+    chunk_axis: int = 0,
     **kwargs: SupportsH5Write,
 ) -> None:
     """Write multiple objects of any type to a H5 file."""
@@ -210,4 +311,6 @@ def write_objects(
             maxshape=maxshape,
             overwrite=overwrite,
             progress=progress,
+            filters=filters,
+            chunk_axis=chunk_axis,
         )
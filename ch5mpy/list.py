@@ -6,9 +6,9 @@ from typing import Any, Generic, Iterable, Iterator, TypeVar, cast
 
 from ch5mpy.dict import H5Dict
 from ch5mpy.functions.types import AnonymousArrayCreationFunc
-from ch5mpy.io import read_object, write_object, write_objects
+from ch5mpy.io import load_object, read_object, write_object, write_objects
 from ch5mpy.names import H5Mode
-from ch5mpy.objects import File, Group, H5Object
+from ch5mpy.objects import File, Group, H5Object, open_file
 from ch5mpy.types import SupportsH5ReadWrite
 
 _T = TypeVar("_T", bound=SupportsH5ReadWrite)
@@ -91,7 +91,7 @@ class H5List(H5Object, Generic[_T]):
     @classmethod
     def read(cls, path: str | Path | File | Group, name: str = "", mode: H5Mode = H5Mode.READ) -> H5List[Any]:
         if isinstance(path, (str, Path)):
-            path = File(path, mode=mode)
+            path = open_file(path, mode=mode)
 
         src = path[name]
 
@@ -136,6 +136,8 @@ class H5List(H5Object, Generic[_T]):
             maxshape=None,
             overwrite=False,
             progress=None,
+            filters=None,
+            chunk_axis=0,
             **dict(map(lambda x: (str(x[0]), x[1]), enumerate(lst))),
         )
 
@@ -146,8 +148,14 @@ class H5List(H5Object, Generic[_T]):
     # endregion
 
     # region methods
-    def copy(self) -> Any:
-        return [e for e in self]
+    def copy(self, lazy: bool = False) -> list[Any]:
+        """
+        Build an in-memory copy of this H5List object (see `ch5mpy.load_object()`).
+
+        Args:
+            lazy: get LazyObjects instead of arrays and objects, which are only read on first access.
+        """
+        return load_object(self._file, lazy=lazy, h5_type="list")  # type: ignore[no-any-return]
 
     def to_dict(self) -> H5Dict[_T]:
         return H5Dict(self._file)
@@ -155,4 +163,8 @@ class H5List(H5Object, Generic[_T]):
     def append(self, value: Any) -> None:
         write_object(value, self._file, str(len(self)), chunks=True)
 
+        if self._file.file.swmr_mode:  # type: ignore[attr-defined]
+            # make the new element visible to SWMR readers
+            self._file.file.flush()
+
     # endregion
@@ -1,5 +1,16 @@
 from ch5mpy.objects.dataset import AsStrWrapper, Dataset, DatasetWrapper
 from ch5mpy.objects.group import File, Group
 from ch5mpy.objects.object import H5Object
+from ch5mpy.objects.pool import FilePool, file_pool, open_file
 
-__all__ = ["Group", "File", "Dataset", "AsStrWrapper", "DatasetWrapper", "H5Object"]
+__all__ = [
+    "Group",
+    "File",
+    "Dataset",
+    "AsStrWrapper",
+    "DatasetWrapper",
+    "H5Object",
+    "FilePool",
+    "file_pool",
+    "open_file",
+]
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import math
 from abc import ABC, abstractmethod
 from typing import Any, Collection, Generic, Literal, TypeVar, cast
 
@@ -10,9 +11,10 @@ from h5py.h5t import check_string_dtype
 from numpy._typing import _ArrayLikeInt_co
 
 import ch5mpy
-from ch5mpy._typing import SELECTOR
+from ch5mpy._typing import HYPERSLAB, SELECTOR
 from ch5mpy.attributes import AttributeManager
 from ch5mpy.objects.pickle import PickleableH5Object
+from ch5mpy.types import H5Filters
 
 _T = TypeVar("_T", bound=np.generic)
 _WT = TypeVar("_WT", bound=np.generic, covariant=True)
@@ -25,6 +27,21 @@ ERROR_METHOD = Literal[
     "replace",
     "xmlcharrefreplace",
 ]
+# attribute holding a hash tree of a dataset's content (see `ch5mpy.io.fingerprint`), discarded when data is written
+FINGERPRINT = "__h5_fingerprint__"
+
+
+def get_chunk_cache_slots(nb_chunks: int) -> int:
+    """
+    Number of slots in the hash table of a chunk cache holding `nb_chunks` chunks : HDF5 recommends about 100 times
+    the number of chunks, preferably a prime number (521 by default).
+    """
+    nb_slots = max(521, 100 * nb_chunks) | 1
+
+    while any(nb_slots % d == 0 for d in range(3, math.isqrt(nb_slots) + 1, 2)):
+        nb_slots += 2
+
+    return nb_slots
 
 
 class DatasetWrapper(ABC, Generic[_WT]):
@@ -81,7 +98,7 @@ class DatasetWrapper(ABC, Generic[_WT]):
         dest: npt.NDArray[Any],
         source_sel: tuple[int | slice | Collection[int], ...] | None = None,
         dest_sel: tuple[int | slice | Collection[int], ...] | None = None,
-        expand_sel: _ArrayLikeInt_co | slice = slice(None),
+        expand_sel: _ArrayLikeInt_co | slice | tuple[slice | _ArrayLikeInt_co, ...] = slice(None),
     ) -> None:
         source_sel = () if source_sel is None else source_sel
         dest_sel = () if dest_sel is None else dest_sel
@@ -206,6 +223,7 @@ class Dataset(PickleableH5Object, h5py.Dataset, Generic[_T]):
         return super().__getitem__(arg, new_dtype)  # type: ignore[no-any-return]
 
     def __setitem__(self, arg: SELECTOR | tuple[SELECTOR, ...], val: Any) -> None:
+        self.discard_fingerprint()
         super().__setitem__(arg, val)
 
     # endregion
@@ -213,8 +231,16 @@ class Dataset(PickleableH5Object, h5py.Dataset, Generic[_T]):
     # region attributes
     @property
     def file(self) -> ch5mpy.File:
-        with h5py._objects.phil:  # type: ignore[attr-defined]
-            return ch5mpy.File(self.id)
+        # the File this object was read from, or a File on the same handle built once
+        cached: ch5mpy.File | None = getattr(self, "_file_cache", None) or getattr(self, "file_info", None)
+
+        if cached is None or not cached.id.valid:
+            with h5py._objects.phil:  # type: ignore[attr-defined]
+                cached = ch5mpy.File(self.id)
+
+        self._file_cache = cached
+
+        return cached
 
     @property
     def attributes(self) -> AttributeManager:
@@ -226,7 +252,39 @@ class Dataset(PickleableH5Object, h5py.Dataset, Generic[_T]):
 
     @property
     def attrs(self) -> AttributeManager:  # type: ignore[override]
-        return AttributeManager(super().attrs)
+        # cached with the id it was built for (the id is replaced by `set_chunk_cache()`)
+        cached: tuple[Any, AttributeManager] | None = getattr(self, "_attrs_cache", None)
+
+        if cached is None or cached[0] is not self.id:
+            cached = self._attrs_cache = (self.id, AttributeManager(super().attrs, read_only=self._opened_read_only))
+
+        return cached[1]
+
+    @property
+    def chunk_cache_size(self) -> int:
+        """Size (in bytes) of this dataset's raw data chunk cache."""
+        return int(self.id.get_access_plist().get_chunk_cache()[1])  # type: ignore[attr-defined]
+
+    @property
+    def filters(self) -> H5Filters:
+        """Filters applied to the chunks of this dataset."""
+        dset: Any = self  # filter properties are not in h5py's stubs
+        filters = H5Filters()
+
+        if dset.compression is not None:
+            filters["compression"] = dset.compression
+            filters["compression_opts"] = dset.compression_opts
+
+        if dset.shuffle:
+            filters["shuffle"] = True
+
+        if dset.scaleoffset is not None:
+            filters["scaleoffset"] = dset.scaleoffset
+
+        if dset.fletcher32:
+            filters["fletcher32"] = True
+
+        return filters
 
     # endregion
 
@@ -258,7 +316,7 @@ class Dataset(PickleableH5Object, h5py.Dataset, Generic[_T]):
         dest: npt.NDArray[Any],
         source_sel: tuple[int | slice | Collection[int], ...] | None = None,
         dest_sel: tuple[int | slice | Collection[int], ...] | None = None,
-        expand_sel: _ArrayLikeInt_co | slice = slice(None),
+        expand_sel: _ArrayLikeInt_co | slice | tuple[slice | _ArrayLikeInt_co, ...] = slice(None),
     ) -> None:
         # FIXME: find better way (here we have to load data to RAM before writing to dest)
         source_sel = () if source_sel is None else source_sel
@@ -269,6 +327,99 @@ class Dataset(PickleableH5Object, h5py.Dataset, Generic[_T]):
         else:
             dest[dest_sel] = np.atleast_1d(self[source_sel])[expand_sel]
 
+    def read_points(self, dest: npt.NDArray[Any], coordinates: npt.NDArray[np.intp]) -> None:
+        """
+        Read elements at given coordinates (a (nb_elements, ndim) array) in a single HDF5 element selection.
+        `dest` must be a C-contiguous array with one element per coordinate.
+        """
+        if not len(coordinates):
+            return
+
+        file_space = self.id.get_space()  # type: ignore[attr-defined]
+        file_space.select_elements(coordinates)
+        self.id.read(h5py.h5s.create_simple((len(coordinates),)), file_space, dest)  # type: ignore[attr-defined]
+
+    def write_points(self, source: npt.NDArray[Any], coordinates: npt.NDArray[np.intp]) -> None:
+        """
+        Write elements at given coordinates (a (nb_elements, ndim) array) in a single HDF5 element selection.
+        `source` must have one element per coordinate. Elements are written in order : for duplicate coordinates, the
+        last value is written.
+        """
+        if not len(coordinates):
+            return
+
+        self.discard_fingerprint()
+        file_space = self.id.get_space()  # type: ignore[attr-defined]
+        file_space.select_elements(coordinates)
+        memory_space = h5py.h5s.create_simple((len(coordinates),))  # type: ignore[attr-defined]
+        self.id.write(memory_space, file_space, np.ascontiguousarray(source))  # type: ignore[attr-defined]
+
+    def _select_hyperslabs(self, hyperslabs: list[HYPERSLAB]) -> tuple[Any, Any]:
+        file_space = self.id.get_space()  # type: ignore[attr-defined]
+        file_space.select_none()
+
+        nb_elements = 0
+        for start, count, stride in hyperslabs:
+            file_space.select_hyperslab(start, count, stride, op=h5py.h5s.SELECT_OR)  # type: ignore[attr-defined]
+            nb_elements += math.prod(count)
+
+        return h5py.h5s.create_simple((nb_elements,)), file_space  # type: ignore[attr-defined]
+
+    def read_hyperslabs(self, dest: npt.NDArray[Any], hyperslabs: list[HYPERSLAB]) -> None:
+        """
+        Read the union of hyperslabs (given as (start, count, stride) tuples) in a single HDF5 selection.
+        Elements are read in C order, `dest` must be a C-contiguous array with one element per selected element.
+        """
+        if not len(hyperslabs):
+            return
+
+        memory_space, file_space = self._select_hyperslabs(hyperslabs)
+        self.id.read(memory_space, file_space, dest)  # type: ignore[attr-defined]
+
+    def write_hyperslabs(self, source: npt.NDArray[Any], hyperslabs: list[HYPERSLAB]) -> None:
+        """
+        Write to the union of hyperslabs (given as (start, count, stride) tuples) in a single HDF5 selection.
+        Elements are written in C order, `source` must have one element per selected element.
+        """
+        if not len(hyperslabs):
+            return
+
+        self.discard_fingerprint()
+        memory_space, file_space = self._select_hyperslabs(hyperslabs)
+        self.id.write(memory_space, file_space, np.ascontiguousarray(source))  # type: ignore[attr-defined]
+
+    def set_chunk_cache(self, nbytes: int, nslots: int | None = None, w0: float | None = None) -> None:
+        """
+        Resize this dataset's raw data chunk cache. HDF5 only reads cache settings when a dataset is opened and shares
+        the cache between all handles on a dataset : this dataset is closed and re-opened in place, the new settings
+        only apply if no other handle on the dataset is open.
+
+        Args:
+            nbytes: size of the cache, in bytes.
+            nslots: number of slots in the cache's hash table (by default, enough for the number of chunks in cache).
+            w0: preemption policy, between 0 and 1 (by default, the current policy).
+
+        Raises:
+            ValueError: for anonymous datasets, which cannot be re-opened.
+        """
+        if self.name is None:
+            raise ValueError("Cannot set the chunk cache of an anonymous dataset.")
+
+        current_w0 = self.id.get_access_plist().get_chunk_cache()[2]  # type: ignore[attr-defined]
+
+        if nslots is None:
+            chunk_bytes = math.prod(self.chunks or (1,)) * self.dtype.itemsize
+            nslots = get_chunk_cache_slots(nbytes // chunk_bytes)
+
+        dapl = h5py.h5p.create(h5py.h5p.DATASET_ACCESS)  # type: ignore[attr-defined]
+        dapl.set_chunk_cache(nslots, nbytes, current_w0 if w0 is None else w0)
+
+        file_id, name = h5py.h5i.get_file_id(self.id), self.name.encode()  # type: ignore[attr-defined]
+        self.id._close()  # type: ignore[attr-defined]
+
+        dataset_id = h5py.h5d.open(file_id, name, dapl=dapl)  # type: ignore[attr-defined]
+        h5py.Dataset.__init__(self, dataset_id, readonly=self._readonly)  # type: ignore[attr-defined]
+
     def write_direct(
         self,
         source: npt.NDArray[Any],
@@ -279,6 +430,24 @@ class Dataset(PickleableH5Object, h5py.Dataset, Generic[_T]):
             # ensure 'C' memory layout
             source = source.copy()
 
+        self.discard_fingerprint()
         super().write_direct(source, source_sel=source_sel, dest_sel=dest_sel)
 
+    def resize(self, size: Any, axis: Any = None) -> None:
+        self.discard_fingerprint()
+        super().resize(size, axis=axis)
+
+    def discard_fingerprint(self) -> None:
+        """
+        Remove the fingerprint of this dataset's content, before its content is modified.
+
+        Raises:
+            OSError: if the dataset was read from a File opened read-only.
+        """
+        self._check_write_intent()
+
+        with h5py._objects.phil:  # type: ignore[attr-defined]
+            if h5py.h5a.exists(self.id, FINGERPRINT.encode()):  # type: ignore[attr-defined]
+                h5py.h5a.delete(self.id, FINGERPRINT.encode())  # type: ignore[attr-defined]
+
     # endregion
@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+import weakref
+from os import PathLike
 from typing import Any, Collection, Literal, cast
 
 import h5py
@@ -7,15 +9,23 @@ import numpy.typing as npt
 from h5py._hl.base import ItemsViewHDF5, ValuesViewHDF5
 
 from ch5mpy.attributes import AttributeManager
+from ch5mpy.memory_size import MemorySize
 from ch5mpy.names import H5Mode
-from ch5mpy.objects.dataset import Dataset
+from ch5mpy.objects.dataset import Dataset, get_chunk_cache_slots
 from ch5mpy.objects.pickle import PickleableH5Object
+from ch5mpy.options import _OPTIONS
+
+# chunk size assumed for sizing the hash table of chunk caches set for whole files
+_FILE_CHUNK_SIZE = 64 * 1024
 
 
 def _h5py_wrap_type(obj: Any) -> Any:
     """Produce our objects instead of h5py default objects"""
-    if isinstance(obj, h5py.Dataset):
-        return Dataset(obj.id)
+    if isinstance(obj, (Group, Dataset)):
+        return obj
+    elif isinstance(obj, h5py.Dataset):
+        # keep h5py's read-only flag, which enables caching the shape and the fast reader
+        return Dataset(obj.id, readonly=obj._readonly)  # type: ignore[attr-defined]
     elif isinstance(obj, h5py.File):
         return File(obj.id)
     elif isinstance(obj, h5py.Group):
@@ -26,6 +36,18 @@ def _h5py_wrap_type(obj: Any) -> Any:
         return obj  # Just return, since we want to wrap h5py.Group.get too
 
 
+def _with_chunk_cache(args: tuple[Any, ...], kwargs: dict[str, Any]) -> dict[str, Any]:
+    """Add the chunk cache size set in options to the arguments for opening a file from a path."""
+    chunk_cache = _OPTIONS["chunk_cache"]
+    name = args[0] if len(args) else kwargs.get("name")
+
+    if not isinstance(chunk_cache, MemorySize) or not isinstance(name, (str, PathLike)) or "rdcc_nbytes" in kwargs:
+        return kwargs
+
+    nbytes = chunk_cache.get()
+    return {"rdcc_nbytes": nbytes, "rdcc_nslots": get_chunk_cache_slots(nbytes // _FILE_CHUNK_SIZE)} | kwargs
+
+
 class Group(PickleableH5Object, h5py.Group):
     """
     A subclass of h5py.Group that implements pickling, and to create new groups and datasets
@@ -34,19 +56,45 @@ class Group(PickleableH5Object, h5py.Group):
 
     # region magic methods
     def __getitem__(self, name: str | bytes) -> Any:  # type: ignore[override]
-        return self._wrap(h5py.Group.__getitem__(self, name))  # type: ignore[index]
+        if not isinstance(name, (str, bytes)):
+            return self._wrap(h5py.Group.__getitem__(self, name))  # type: ignore[index]
+
+        with h5py._objects.phil:  # type: ignore[attr-defined]
+            return self._wrap_id(h5py.h5o.open(self.id, self._e(name), lapl=self._lapl))  # type: ignore[attr-defined]
+
+    def __setitem__(self, name: str, obj: Any) -> None:
+        self._check_write_intent()
+        super().__setitem__(name, obj)
+
+    def __delitem__(self, name: str) -> None:
+        self._check_write_intent()
+        super().__delitem__(name)
 
     # endregion
 
     # region attributes
     @property
     def attrs(self) -> AttributeManager:  # type: ignore[override]
-        return AttributeManager(super().attrs)
+        # cached with the id it was built for
+        cached: tuple[Any, AttributeManager] | None = getattr(self, "_attrs_cache", None)
+
+        if cached is None or cached[0] is not self.id:
+            cached = self._attrs_cache = (self.id, AttributeManager(super().attrs, read_only=self._opened_read_only))
+
+        return cached[1]
 
     @property
     def file(self) -> File:
-        with h5py._objects.phil:  # type: ignore[attr-defined]
-            return File(self.id)
+        # the File this object was read from, or a File on the same handle built once
+        cached: File | None = getattr(self, "_file_cache", None) or getattr(self, "file_info", None)
+
+        if cached is None or not cached.id.valid:
+            with h5py._objects.phil:  # type: ignore[attr-defined]
+                cached = File(self.id)
+
+        self._file_cache = cached
+
+        return cached
 
     @property
     def parent(self) -> Group:
@@ -65,6 +113,40 @@ class Group(PickleableH5Object, h5py.Group):
 
         return obj
 
+    def _wrap_id(self, oid: Any) -> Any:
+        """Wrap an object opened in this group, reusing the wrapper created from the same File if it is still open."""
+        file_info: File | None = getattr(self, "file_info", None)
+
+        if file_info is not None and h5py.h5i.get_file_id(oid).fileno != file_info.id.fileno:  # type: ignore[attr-defined]
+            # reached through an external link : the object does not belong to this File
+            file_info = None
+
+        wrappers = None if file_info is None else file_info._wrappers
+
+        obj = None if wrappers is None else wrappers.get(oid)
+        if obj is not None and obj.id.valid:
+            return obj
+
+        otype = h5py.h5i.get_type(oid)  # type: ignore[attr-defined]
+
+        if otype == h5py.h5i.GROUP:  # type: ignore[attr-defined]
+            obj = Group(oid)
+
+        elif otype == h5py.h5i.DATASET:  # type: ignore[attr-defined]
+            # keep h5py's read-only flag, which enables caching the shape and the fast reader (only for handles without
+            # write intent : Files opened read-only from the pool of open files may share a handle with a writer)
+            intent = h5py.h5i.get_file_id(oid).get_intent()  # type: ignore[attr-defined]
+            obj = Dataset(oid, readonly=intent == h5py.h5f.ACC_RDONLY)  # type: ignore[attr-defined]
+
+        else:
+            return h5py.Datatype(oid)  # type: ignore[call-arg]  # Not supported for pickling yet
+
+        if wrappers is not None:
+            obj.file_info = file_info
+            wrappers[oid] = obj
+
+        return obj
+
     def get(self, name: str, default: Any = None, getclass: bool = False, getlink: bool = False) -> Any:
         """Retrieve an item or other information.
 
@@ -121,6 +203,7 @@ class Group(PickleableH5Object, h5py.Group):
         if overwrite and name in self.keys():
             del self[name]
 
+        self._check_write_intent()
         group = super().create_group(name, track_order=track_order)
         return cast(Group, self._wrap(group))
 
@@ -143,14 +226,32 @@ class Group(PickleableH5Object, h5py.Group):
             data: Provide data to initialize the dataset. If used, you can omit shape and dtype arguments.
             kwds: other arguments to pass to the dataset creation function.
         """
+        self._check_write_intent()
         group = super().create_dataset(name, shape=shape, dtype=dtype, data=data, **kwds)
         return cast(Dataset[Any], self._wrap(group))
 
+    def move(self, source: str, dest: str) -> None:
+        self._check_write_intent()
+        super().move(source, dest)
+
     # endregion
 
 
 class File(Group, h5py.File):
-    """A subclass of h5py.File that implements pickling."""
+    """
+    A subclass of h5py.File that implements pickling.
+    The raw data chunk cache of its datasets is set with h5py's `rdcc_nbytes`, `rdcc_nslots` and `rdcc_w0` arguments
+    or, for files opened from a path, from the `chunk_cache` option.
+
+    With `swmr=True`, the file is opened for single-writer/multiple-reader access : in 'r' mode as a reader which sees
+    data appended by the writer after `refresh()`-ing datasets, in 'r+' mode as the writer. Files created or opened in
+    'a' mode with `swmr=True` use the latest file format required by SWMR, writing starts with `start_swmr()`.
+    """
+
+    # groups and datasets read from this File, by HDF5 object (ids of a same object compare equal)
+    _wrappers: weakref.WeakValueDictionary[Any, Group | Dataset[Any]]
+    # opened read-only on a writable handle (see `ch5mpy.objects.pool.FilePool`) : writes are rejected
+    _read_only: bool = False
 
     # region magic methods
     def __init__(self, *args: Any, **kwargs: Any):
@@ -162,7 +263,20 @@ class File(Group, h5py.File):
         """Create a new File object with the h5 open function."""
         with h5py._objects.phil:  # type: ignore[attr-defined]
             self = super().__new__(cls)
-            h5py.File.__init__(self, *args, **kwargs)
+            self._wrappers = weakref.WeakValueDictionary()
+            kwargs = _with_chunk_cache(args, kwargs)
+            mode = args[1] if len(args) > 1 else kwargs.get("mode", H5Mode.READ)
+
+            if kwargs.get("swmr", False) and mode != H5Mode.READ:
+                # h5py only handles swmr for readers, writers need the latest file format
+                kwargs = {"libver": "latest"} | kwargs | {"swmr": False}
+                h5py.File.__init__(self, *args, **kwargs)
+
+                if mode == H5Mode.READ_WRITE:
+                    self.start_swmr()
+
+            else:
+                h5py.File.__init__(self, *args, **kwargs)
 
             return self
 
@@ -185,10 +299,34 @@ class File(Group, h5py.File):
     # region attributes
     @property
     def mode(self) -> Literal[H5Mode.READ, H5Mode.READ_WRITE]:  # type: ignore[override]
+        if self._read_only:
+            return H5Mode.READ
+
         return H5Mode(super().mode)  # type: ignore[return-value]
 
+    @property
+    def file(self) -> File:
+        return self
+
     @property
     def file_info(self) -> File:
         return self
 
     # endregion
+
+    # region methods
+    def start_swmr(self) -> None:
+        """
+        Start writing in single-writer/multiple-reader mode, once all groups and datasets to append to are created.
+
+        Raises:
+            OSError: if the file was not created with the latest file format (e.g. with `swmr=True`).
+        """
+        with h5py._objects.phil:  # type: ignore[attr-defined]
+            try:
+                self.id.start_swmr_write()
+
+            except RuntimeError as e:
+                raise OSError(f"Cannot start SWMR writing on '{self.filename}' : {e}.") from e
+
+    # endregion
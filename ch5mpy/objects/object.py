@@ -6,6 +6,7 @@ from typing import TYPE_CHECKING, Any, Literal
 
 from ch5mpy.names import H5Mode
 from ch5mpy.objects.group import File, Group
+from ch5mpy.objects.pool import file_pool
 
 if TYPE_CHECKING:
     from ch5mpy.attributes import AttributeManager
@@ -68,8 +69,9 @@ class H5Object(ABC):
 
     # region methods
     def close(self) -> None:
-        """Close the file this H5 object wraps."""
-        self._file.file.close()
+        """Close the file this H5 object wraps (files from the pool of open files are only released to the pool)."""
+        if not file_pool.release(self._file):
+            self._file.file.close()
 
     @abstractmethod
     def copy(self) -> Any:
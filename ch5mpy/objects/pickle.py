@@ -28,3 +28,12 @@ class PickleableH5Object(h5py.HLObject):
     def __getnewargs__(self) -> tuple[()]:
         """Override the h5py getnewargs to skip its error message"""
         return ()
+
+    @property
+    def _opened_read_only(self) -> bool:
+        """Was this object read from a File opened read-only on a writable handle shared by the pool of open files ?"""
+        return getattr(self.file, "_read_only", False)
+
+    def _check_write_intent(self) -> None:
+        if self._opened_read_only:
+            raise OSError(f"Cannot write to '{self.file.filename}' : it was opened read-only.")
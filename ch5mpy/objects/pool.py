@@ -0,0 +1,177 @@
+from __future__ import annotations
+
+import threading
+import weakref
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from itertools import count
+from pathlib import Path
+
+from ch5mpy.names import H5Mode
+from ch5mpy.objects.group import File, Group
+from ch5mpy.options import _OPTIONS
+
+
+@dataclass
+class _PooledFile:
+    file: File
+    writable: bool
+    holders: dict[int, weakref.finalize[[Path, int], File]] = field(default_factory=dict)
+
+
+class FilePool:
+    """
+    Process-wide LRU pool of open File handles, enabled with the `max_open_files` option.
+
+    HDF5 opens a file only once per process : handles are keyed by path, and a read-write handle also serves readers
+    through Files that report the 'r' mode and reject writes.
+    Each acquired File is a new wrapper around the shared handle, counted as a reference until it is garbage collected
+    (groups and datasets read from it keep it alive) or until `release()` is called. Handles without references are
+    kept open for later reads, the least recently used ones are closed when more than `max_open_files` are open.
+    """
+
+    # region magic methods
+    def __init__(self) -> None:
+        self._files: OrderedDict[Path, _PooledFile] = OrderedDict()
+        self._lock = threading.RLock()
+        self._tokens = count()
+
+    def __repr__(self) -> str:
+        return f"<FilePool with {len(self._files)} open file(s), {self.nb_references} reference(s)>"
+
+    def __len__(self) -> int:
+        return len(self._files)
+
+    def __contains__(self, path: str | Path) -> bool:
+        return Path(path).expanduser().resolve() in self._files
+
+    # endregion
+
+    # region attributes
+    @property
+    def nb_references(self) -> int:
+        return sum(len(pooled.holders) for pooled in self._files.values())
+
+    # endregion
+
+    # region methods
+    def _close(self, path: Path) -> None:
+        pooled = self._files.pop(path)
+
+        if pooled.file.id.valid:
+            pooled.file.close()
+
+    def _evict(self) -> None:
+        """Close least recently used handles without references, until at most `max_open_files` are open."""
+        for path in [path for path, pooled in self._files.items() if not pooled.holders]:
+            if len(self._files) <= _OPTIONS["max_open_files"]:
+                break
+
+            self._close(path)
+
+    def _release(self, path: Path, token: int) -> None:
+        with self._lock:
+            pooled = self._files.get(path)
+
+            if pooled is not None and pooled.holders.pop(token, None) is not None:
+                self._evict()
+
+    def _open(self, path: Path, mode: H5Mode) -> _PooledFile:
+        writable = H5Mode.has_write_intent(mode)
+        pooled = self._files.get(path)
+
+        if pooled is not None and not pooled.file.id.valid:
+            # the handle was closed outside the pool
+            del self._files[path]
+            pooled = None
+
+        if pooled is not None and (pooled.writable or not writable):
+            self._files.move_to_end(path)
+            return pooled
+
+        if pooled is not None:
+            if pooled.holders:
+                raise OSError(
+                    f"Cannot open '{path}' in '{mode.value}' mode : it is already open read-only by "
+                    f"{len(pooled.holders)} object(s)."
+                )
+
+            self._close(path)
+
+        pooled = _PooledFile(File(path, mode=mode), writable)
+        self._files[path] = pooled
+        return pooled
+
+    def acquire(self, path: str | Path, mode: H5Mode = H5Mode.READ) -> File:
+        """
+        Get a File on a shared handle, opening it if needed.
+
+        Raises:
+            OSError: if the file must be opened for writing but is already open read-only by other objects.
+        """
+        path = Path(path).expanduser().resolve()
+        mode = H5Mode(mode)
+
+        with self._lock:
+            pooled = self._open(path, mode)
+
+            file = File(pooled.file.id)
+            file._read_only = not H5Mode.has_write_intent(mode)
+            # pickle the wrapper with the file's path instead of its handle
+            file.init_args = (str(path), H5Mode.READ.value if file._read_only else H5Mode.READ_WRITE.value)
+
+            token = next(self._tokens)
+            pooled.holders[token] = weakref.finalize(file, self._release, path, token)
+
+            self._evict()
+
+        return file
+
+    def release(self, file: File | Group) -> bool:
+        """
+        Drop one reference to a pooled file, which stays open until it is evicted from the pool. Returns False if the
+        file is not pooled.
+        """
+        path = Path(file.file.filename).resolve()
+
+        with self._lock:
+            pooled = self._files.get(path)
+
+            if pooled is None or pooled.file.id != file.file.id:
+                return False
+
+            if pooled.holders:
+                _, finalizer = pooled.holders.popitem()
+                finalizer.detach()
+                self._evict()
+
+        return True
+
+    def clear(self, path: str | Path | None = None) -> None:
+        """Close all handles without references (or only the handle on `path`, if it has no references)."""
+        paths = self._files.keys() if path is None else (Path(path).expanduser().resolve(),)
+
+        with self._lock:
+            for p in [p for p in paths if p in self._files and not self._files[p].holders]:
+                self._close(p)
+
+    # endregion
+
+
+file_pool = FilePool()
+
+
+def open_file(path: str | Path, mode: H5Mode = H5Mode.READ) -> File:
+    """
+    Open a File, from the pool of open files when it is enabled (see the `max_open_files` option). Files opened to be
+    created or truncated are never pooled.
+    """
+    if mode in (H5Mode.WRITE, H5Mode.WRITE_TRUNCATE):
+        # HDF5 cannot truncate an open file
+        file_pool.clear(path)
+        return File(path, mode=mode)
+
+    if _OPTIONS["max_open_files"] == 0:
+        return File(path, mode=mode)
+
+    return file_pool.acquire(path, mode)
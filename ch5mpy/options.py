@@ -2,14 +2,30 @@ from contextlib import contextmanager
 from typing import Generator, Literal, TypedDict, cast
 
 from ch5mpy.memory_size import MemorySize, as_memorysize
+from ch5mpy.types import H5Filters
 
 
 class _OptionsDict(TypedDict):
     error_mode: Literal["raise", "ignore"]
     max_memory_usage: MemorySize
-
-
-_OPTIONS = _OptionsDict(error_mode="ignore", max_memory_usage=MemorySize(250, "M"))
+    max_open_files: int
+    chunk_cache: MemorySize | Literal["default", "auto"]
+    chunk_bytes: MemorySize
+    filters: H5Filters
+    io_threads: int
+    trust_fingerprints: bool
+
+
+_OPTIONS = _OptionsDict(
+    error_mode="ignore",
+    max_memory_usage=MemorySize(250, "M"),
+    max_open_files=0,
+    chunk_cache="default",
+    chunk_bytes=MemorySize(1, "M"),
+    filters=H5Filters(),
+    io_threads=1,
+    trust_fingerprints=False,
+)
 
 
 def _check_error_mode(error_mode: str) -> Literal["raise", "ignore"]:
@@ -18,20 +34,98 @@ def _check_error_mode(error_mode: str) -> Literal["raise", "ignore"]:
     return cast(Literal["raise", "ignore"], error_mode)
 
 
-def set_options(error_mode: Literal["raise", "ignore"] | None = None, max_memory: int | str | None = None) -> None:
+def _check_max_open_files(max_open_files: int) -> int:
+    if max_open_files < 0:
+        raise ValueError("'max_open_files' must be positive (or 0 to disable the pool of open files).")
+    return max_open_files
+
+
+def _check_io_threads(io_threads: int) -> int:
+    if io_threads < 1:
+        raise ValueError("'io_threads' must be at least 1.")
+    return io_threads
+
+
+def _check_chunk_cache(chunk_cache: int | str) -> MemorySize | Literal["default", "auto"]:
+    if chunk_cache in ("default", "auto"):
+        return cast(Literal["default", "auto"], chunk_cache)
+    return as_memorysize(chunk_cache)
+
+
+def set_options(
+    error_mode: Literal["raise", "ignore"] | None = None,
+    max_memory: int | str | None = None,
+    max_open_files: int | None = None,
+    chunk_cache: int | str | None = None,
+    chunk_bytes: int | str | None = None,
+    filters: H5Filters | None = None,
+    io_threads: int | None = None,
+    trust_fingerprints: bool | None = None,
+) -> None:
+    """
+    Set global options.
+
+    Args:
+        error_mode: raise or ignore errors when reading objects that cannot be read.
+        max_memory: memory budget for reading or writing data, as a number of bytes or a size like "250M".
+        max_open_files: number of files kept open by the pool of open files (0 disables the pool).
+        chunk_cache: size of the raw data chunk cache of each dataset in files opened from a path, "auto" to size it
+            from the chunks touched by each read or write (within the memory budget) or "default" for HDF5's default
+            (1 MiB).
+        chunk_bytes: target size of chunks when the shape of chunks of new datasets is chosen automatically.
+        filters: filters (e.g. compression) applied to new chunked datasets when none are given explicitly.
+        io_threads: number of threads compressing chunks of gzip datasets, which are then written directly to the file
+            (1 leaves compression to HDF5, on a single thread).
+        trust_fingerprints: store fingerprints of chunked datasets and compare them, instead of the stored chunks, to
+            find the chunks that changed when an array is copied to a dataset. Fingerprints are not updated by writes
+            that bypass ch5mpy (e.g. with h5py), only enable for files that are only modified with ch5mpy.
+    """
     if error_mode is not None:
         _OPTIONS["error_mode"] = _check_error_mode(error_mode)
 
     if max_memory is not None:
         _OPTIONS["max_memory_usage"] = as_memorysize(max_memory)
 
+    if max_open_files is not None:
+        _OPTIONS["max_open_files"] = _check_max_open_files(max_open_files)
+
+    if chunk_cache is not None:
+        _OPTIONS["chunk_cache"] = _check_chunk_cache(chunk_cache)
+
+    if chunk_bytes is not None:
+        _OPTIONS["chunk_bytes"] = as_memorysize(chunk_bytes)
+
+    if filters is not None:
+        _OPTIONS["filters"] = filters
+
+    if io_threads is not None:
+        _OPTIONS["io_threads"] = _check_io_threads(io_threads)
+
+    if trust_fingerprints is not None:
+        _OPTIONS["trust_fingerprints"] = trust_fingerprints
+
 
 @contextmanager
 def options(
-    error_mode: Literal["raise", "ignore"] | None = None, max_memory: int | str | None = None
+    error_mode: Literal["raise", "ignore"] | None = None,
+    max_memory: int | str | None = None,
+    max_open_files: int | None = None,
+    chunk_cache: int | str | None = None,
+    chunk_bytes: int | str | None = None,
+    filters: H5Filters | None = None,
+    io_threads: int | None = None,
+    trust_fingerprints: bool | None = None,
 ) -> Generator[None, None, None]:
+    """Set options temporarily, within a context (see `set_options()`)."""
     _current_options = _OptionsDict(
-        error_mode=_OPTIONS["error_mode"], max_memory_usage=_OPTIONS["max_memory_usage"].copy()
+        error_mode=_OPTIONS["error_mode"],
+        max_memory_usage=_OPTIONS["max_memory_usage"].copy(),
+        max_open_files=_OPTIONS["max_open_files"],
+        chunk_cache=_OPTIONS["chunk_cache"],
+        chunk_bytes=_OPTIONS["chunk_bytes"].copy(),
+        filters=_OPTIONS["filters"],
+        io_threads=_OPTIONS["io_threads"],
+        trust_fingerprints=_OPTIONS["trust_fingerprints"],
     )
 
     if error_mode is not None:
@@ -40,7 +134,31 @@ def options(
     if max_memory is not None:
         _OPTIONS["max_memory_usage"] = as_memorysize(max_memory)
 
+    if max_open_files is not None:
+        _OPTIONS["max_open_files"] = _check_max_open_files(max_open_files)
+
+    if chunk_cache is not None:
+        _OPTIONS["chunk_cache"] = _check_chunk_cache(chunk_cache)
+
+    if chunk_bytes is not None:
+        _OPTIONS["chunk_bytes"] = as_memorysize(chunk_bytes)
+
+    if filters is not None:
+        _OPTIONS["filters"] = filters
+
+    if io_threads is not None:
+        _OPTIONS["io_threads"] = _check_io_threads(io_threads)
+
+    if trust_fingerprints is not None:
+        _OPTIONS["trust_fingerprints"] = trust_fingerprints
+
     yield
 
     _OPTIONS["error_mode"] = _current_options["error_mode"]
     _OPTIONS["max_memory_usage"] = _current_options["max_memory_usage"]
+    _OPTIONS["max_open_files"] = _current_options["max_open_files"]
+    _OPTIONS["chunk_cache"] = _current_options["chunk_cache"]
+    _OPTIONS["chunk_bytes"] = _current_options["chunk_bytes"]
+    _OPTIONS["filters"] = _current_options["filters"]
+    _OPTIONS["io_threads"] = _current_options["io_threads"]
+    _OPTIONS["trust_fingerprints"] = _current_options["trust_fingerprints"]
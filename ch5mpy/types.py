@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Any, Protocol, runtime_checkable
+from typing import TYPE_CHECKING, Any, Literal, Protocol, TypedDict, runtime_checkable
 
 from typing_extensions import Self
 
@@ -8,6 +8,24 @@ if TYPE_CHECKING:
     from ch5mpy.dict import H5Dict
 
 
+class H5Filters(TypedDict, total=False):
+    """
+    Filters applied to the chunks of a dataset when writing it (see h5py's `create_dataset()`).
+
+    compression: "gzip", "lzf", "szip" or the id of a dynamically loaded filter.
+    compression_opts: compression settings (e.g. gzip level, from 0 to 9).
+    shuffle: shuffle the bytes of elements, which often improves compression.
+    scaleoffset: lossy compression of numbers (number of bits kept for integers, decimal digits for floats).
+    fletcher32: store a checksum for each chunk.
+    """
+
+    compression: Literal["gzip", "lzf", "szip"] | int | None
+    compression_opts: Any
+    shuffle: bool
+    scaleoffset: int | None
+    fletcher32: bool
+
+
 @runtime_checkable
 class SupportsH5Write(Protocol):
     def __h5_write__(self, values: H5Dict[Any]) -> None:
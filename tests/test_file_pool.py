@@ -0,0 +1,99 @@
+import gc
+from pathlib import Path
+from tempfile import TemporaryDirectory
+from typing import Generator
+
+import numpy as np
+import pytest
+
+import ch5mpy
+from ch5mpy import H5Array, H5Dict, H5Mode, file_pool
+
+
+@pytest.fixture
+def paths() -> Generator[list[Path], None, None]:
+    with TemporaryDirectory() as directory:
+        paths = [Path(directory) / f"file_{i}.h5" for i in range(3)]
+
+        for path in paths:
+            with ch5mpy.File(path, H5Mode.WRITE_TRUNCATE) as h5_file:
+                ch5mpy.write_object({"a": np.arange(5.0), "b": {"c": 1}}, h5_file, "")
+
+        with ch5mpy.options(max_open_files=2):
+            yield paths
+
+            gc.collect()
+            file_pool.clear()
+
+
+def test_should_share_open_files(paths: list[Path]) -> None:
+    arr_1 = H5Array.read(paths[0], "a")
+    arr_2 = H5Array.read(paths[0], "a")
+
+    assert arr_1.dset.file.id == arr_2.dset.file.id
+    assert len(file_pool) == 1
+    assert file_pool.nb_references == 2
+
+    del arr_1, arr_2
+    gc.collect()
+
+    assert paths[0] in file_pool
+    assert file_pool.nb_references == 0
+
+
+def test_should_close_least_recently_used_idle_files(paths: list[Path]) -> None:
+    h5_dict = H5Dict.read(paths[0])
+    H5Array.read(paths[1], "a")
+    H5Array.read(paths[2], "a")
+    gc.collect()
+
+    assert len(file_pool) == 2
+    assert paths[0] in file_pool and paths[2] in file_pool
+    assert h5_dict["b"]["c"] == 1
+
+
+def test_should_release_file_on_close(paths: list[Path]) -> None:
+    h5_dict = H5Dict.read(paths[0])
+    h5_dict.close()
+
+    assert file_pool.nb_references == 0
+    assert not h5_dict.is_closed
+
+
+def test_should_not_open_file_for_writing_while_read(paths: list[Path]) -> None:
+    h5_dict = H5Dict.read(paths[0])
+
+    with pytest.raises(OSError):
+        H5Dict.read(paths[0], mode=H5Mode.READ_WRITE)
+
+    del h5_dict
+    gc.collect()
+
+    writable = H5Dict.read(paths[0], mode=H5Mode.READ_WRITE)
+    writable["d"] = 2
+
+    assert H5Dict.read(paths[0])["d"] == 2
+    assert len(file_pool) == 1
+
+
+def test_should_not_write_with_reader_sharing_writable_file(paths: list[Path]) -> None:
+    writable = H5Dict.read(paths[0], mode=H5Mode.READ_WRITE)
+    h5_dict = H5Dict.read(paths[0])
+
+    assert h5_dict.file.id == writable.file.id
+    assert h5_dict.mode == H5Mode.READ
+    assert writable.mode == H5Mode.READ_WRITE
+
+    with pytest.raises(OSError):
+        h5_dict["d"] = 2
+
+    with pytest.raises(OSError):
+        h5_dict["a"][0] = -1
+
+    with pytest.raises(OSError):
+        h5_dict.attributes["x"] = 1
+
+    writable["a"][0] = -1
+
+    assert h5_dict["a"][0] == -1
+    assert "d" not in h5_dict.keys()
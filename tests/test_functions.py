@@ -722,3 +722,324 @@ def test_append(small_array):
     res = np.append(small_array, [-1, -2, -3])
     assert np.array_equal(res, [1, 2, 3, 4, 5, -1, -2, -3])
     assert np.array_equal(small_array, [1, 2, 3, 4, 5])
+
+
+@pytest.fixture
+def array_4d() -> Generator[H5Array, None, None]:
+    data = np.random.default_rng(0).normal(size=(2, 3, 4, 5))
+    data[data < 0.3] = 0
+
+    with File("h5_4d_array", H5Mode.WRITE_TRUNCATE) as h5_file:
+        write_object(data, h5_file, "data")
+
+    yield H5Array(File("h5_4d_array", H5Mode.READ_WRITE)["data"])
+
+    Path("h5_4d_array").unlink()
+
+
+@pytest.mark.parametrize("func", [np.cumsum, np.cumprod, np.nancumsum])
+def test_cumulative_4d(array_4d, func):
+    data = np.array(array_4d)
+
+    with ch5mpy.options(max_memory=str(2 * array_4d.dtype.itemsize)):
+        assert np.allclose(func(array_4d), func(data))
+
+
+def test_cumsum(small_large_array):
+    with ch5mpy.options(max_memory=str(7 * small_large_array.dtype.itemsize)):
+        assert np.array_equal(np.cumsum(small_large_array), np.cumsum(np.arange(60)))
+
+
+@pytest.mark.parametrize("axis", [0, 1, 2, -1])
+def test_cumsum_axis(small_large_array, axis):
+    with ch5mpy.options(max_memory=str(7 * small_large_array.dtype.itemsize)):
+        assert np.array_equal(
+            np.cumsum(small_large_array, axis=axis), np.cumsum(np.arange(60).reshape((3, 4, 5)), axis=axis)
+        )
+
+
+def test_cumsum_h5_output(small_large_array):
+    out = ch5mpy.zeros((3, 4, 5), name="cumsum", loc=small_large_array.file, dtype=np.int64)
+
+    with ch5mpy.options(max_memory=str(7 * small_large_array.dtype.itemsize)):
+        np.cumsum(small_large_array, axis=0, out=out)
+
+    assert np.array_equal(out, np.cumsum(np.arange(60).reshape((3, 4, 5)), axis=0))
+
+
+def test_cumprod(small_array):
+    with ch5mpy.options(max_memory=str(2 * small_array.dtype.itemsize)):
+        assert np.array_equal(np.cumprod(small_array), [1.0, 2.0, 6.0, 24.0, 120.0])
+
+
+def test_nancumsum(small_array):
+    small_array[1] = np.nan
+
+    with ch5mpy.options(max_memory=str(2 * small_array.dtype.itemsize)):
+        assert np.array_equal(np.nancumsum(small_array), [1.0, 1.0, 4.0, 8.0, 13.0])
+
+
+@pytest.mark.parametrize("method", ["linear", "lower", "higher", "midpoint", "nearest"])
+def test_quantile(array, method):
+    data = np.random.default_rng(0).integers(0, 30, size=(10, 10)).astype(np.float64)
+    array[:] = data
+
+    with ch5mpy.options(max_memory=str(7 * array.dtype.itemsize)):
+        assert np.allclose(
+            np.quantile(array, [0, 0.1, 0.33, 0.5, 0.9, 1], method=method),
+            np.quantile(data, [0, 0.1, 0.33, 0.5, 0.9, 1], method=method),
+        )
+
+
+@pytest.mark.parametrize("axis", [0, 1, 2, -1])
+def test_quantile_axis(small_large_array, axis):
+    data = np.arange(60).reshape((3, 4, 5))
+
+    with ch5mpy.options(max_memory=str(11 * small_large_array.dtype.itemsize)):
+        assert np.allclose(
+            np.quantile(small_large_array, [0.25, 0.5], axis=axis), np.quantile(data, [0.25, 0.5], axis=axis)
+        )
+
+
+def test_quantile_axis_large_lanes(small_large_array):
+    data = np.arange(60).reshape((3, 4, 5))
+
+    with ch5mpy.options(max_memory=str(2 * small_large_array.dtype.itemsize)):
+        assert np.allclose(
+            np.quantile(small_large_array, 0.3, axis=1, keepdims=True), np.quantile(data, 0.3, axis=1, keepdims=True)
+        )
+
+
+def test_quantile_nan(small_array):
+    small_array[2] = np.nan
+
+    with ch5mpy.options(max_memory=str(2 * small_array.dtype.itemsize)):
+        assert np.isnan(np.quantile(small_array, 0.5))
+
+
+def test_quantile_approximate(array):
+    with ch5mpy.options(max_memory=str(7 * array.dtype.itemsize)):
+        assert np.allclose(np.quantile(array, [0.1, 0.5], method="approximate"), [9.9, 49.5], atol=5)
+
+
+def test_quantile_approximate_should_be_exact_in_memory(group):
+    data = np.random.default_rng(0).normal(size=(20, 50))
+    write_object(data, group, "data")
+    array = H5Array(group["data"])
+
+    assert np.array_equal(np.quantile(array, [0.1, 0.5], method="approximate"), np.quantile(data, [0.1, 0.5]))
+    assert np.array_equal(
+        np.quantile(array, [0.1, 0.5], axis=1, method="approximate"), np.quantile(data, [0.1, 0.5], axis=1)
+    )
+
+
+@pytest.mark.parametrize("method", ["linear", "lower", "nearest"])
+def test_quantile_infinite(group, monkeypatch, method):
+    data = np.random.default_rng(0).normal(size=1000)
+    data[:30], data[-20:] = -np.inf, np.inf
+    write_object(data, group, "data")
+    array = H5Array(group["data"])
+
+    passes = []
+    iter_chunks = H5Array.iter_chunks
+    monkeypatch.setattr(H5Array, "iter_chunks", lambda self, *args: passes.append(1) or iter_chunks(self, *args))
+
+    with ch5mpy.options(max_memory=str(100 * array.dtype.itemsize)), np.errstate(invalid="ignore"):
+        assert np.array_equal(
+            np.quantile(array, [0, 0.02, 0.03, 0.5, 0.99, 1], method=method),
+            np.quantile(data, [0, 0.02, 0.03, 0.5, 0.99, 1], method=method),
+            equal_nan=True,
+        )
+
+    # infinite values do not slow down the search for values at finite ranks
+    assert len(passes) <= 3
+
+
+def test_percentile(array):
+    with ch5mpy.options(max_memory=str(7 * array.dtype.itemsize)):
+        assert np.allclose(np.percentile(array, [25, 75]), np.percentile(np.arange(100.0), [25, 75]))
+
+
+def test_median(array):
+    with ch5mpy.options(max_memory=str(7 * array.dtype.itemsize)):
+        assert np.median(array) == 49.5
+        assert np.array_equal(np.median(array, axis=0), np.median(np.arange(100.0).reshape((10, 10)), axis=0))
+
+
+def test_histogram(array):
+    with ch5mpy.options(max_memory=str(7 * array.dtype.itemsize)):
+        counts, edges = np.histogram(array, bins=7)
+
+    expected_counts, expected_edges = np.histogram(np.arange(100.0), bins=7)
+    assert np.array_equal(counts, expected_counts)
+    assert np.array_equal(edges, expected_edges)
+
+
+def test_histogram_weights_density(array):
+    weights = ch5mpy.H5Array(array.file["data"])
+
+    with ch5mpy.options(max_memory=str(7 * array.dtype.itemsize)):
+        counts, edges = np.histogram(array, bins=[0, 10, 50, 100], weights=weights, density=True)
+
+    expected_counts, _ = np.histogram(np.arange(100.0), bins=[0, 10, 50, 100], weights=np.arange(100.0), density=True)
+    assert np.allclose(counts, expected_counts)
+
+
+def test_histogram2d(array):
+    x = np.arange(100.0)
+    y = x[::-1] % 17
+
+    y_array = ch5mpy.zeros((100,), name="y", loc=array.file, dtype=np.float64)
+    y_array[:] = y
+    x_array = ch5mpy.zeros((100,), name="x", loc=array.file, dtype=np.float64)
+    x_array[:] = x
+
+    with ch5mpy.options(max_memory=str(7 * array.dtype.itemsize)):
+        counts, x_edges, y_edges = np.histogram2d(x_array, y_array, bins=(5, 4), weights=y_array)
+
+    expected_counts, expected_x_edges, expected_y_edges = np.histogram2d(x, y, bins=(5, 4), weights=y)
+    assert np.allclose(counts, expected_counts)
+    assert np.array_equal(x_edges, expected_x_edges)
+    assert np.array_equal(y_edges, expected_y_edges)
+
+
+@pytest.mark.parametrize("backed", [True, False])
+def test_histogram2d_int_weights(array, backed):
+    x = np.arange(100.0)
+    weights = np.arange(100) % 7
+
+    x_array = ch5mpy.zeros((100,), name="x", loc=array.file, dtype=np.float64)
+    x_array[:] = x
+    w_array = ch5mpy.zeros((100,), name="w", loc=array.file, dtype=np.int64)
+    w_array[:] = weights
+
+    with ch5mpy.options(max_memory=str(7 * array.dtype.itemsize)):
+        counts, *_ = np.histogram2d(x_array, x_array, bins=4, weights=w_array if backed else weights)
+
+    assert np.allclose(counts, np.histogram2d(x, x, bins=4, weights=weights)[0])
+
+
+def test_bincount(array):
+    x = np.array([1, 3, 1, 0, 7, 3, 3])
+    x_array = ch5mpy.zeros((7,), name="x", loc=array.file, dtype=np.int64)
+    x_array[:] = x
+
+    with ch5mpy.options(max_memory=str(2 * x_array.dtype.itemsize)):
+        assert np.array_equal(np.bincount(x_array, minlength=3), np.bincount(x, minlength=3))
+        assert np.array_equal(np.bincount(x_array, weights=np.arange(7.0)), np.bincount(x, weights=np.arange(7.0)))
+
+
+def test_argmax(array):
+    data = np.random.default_rng(0).integers(0, 30, size=(10, 10)).astype(np.float64)
+    array[:] = data
+
+    with ch5mpy.options(max_memory=str(7 * array.dtype.itemsize)):
+        assert np.argmax(array) == np.argmax(data)
+        assert np.argmin(array) == np.argmin(data)
+
+
+@pytest.mark.parametrize("axis", [0, 1, 2, -1])
+def test_argmax_axis(small_large_array, axis):
+    data = np.random.default_rng(0).integers(0, 10, size=(3, 4, 5))
+    small_large_array[:] = data
+
+    with ch5mpy.options(max_memory=str(7 * small_large_array.dtype.itemsize)):
+        assert np.array_equal(np.argmax(small_large_array, axis=axis), np.argmax(data, axis=axis))
+        assert np.array_equal(
+            np.argmin(small_large_array, axis=axis, keepdims=True), np.argmin(data, axis=axis, keepdims=True)
+        )
+
+
+def test_argmax_nan(array):
+    array[3, 4] = np.nan
+    array[8, 1] = np.nan
+
+    with ch5mpy.options(max_memory=str(7 * array.dtype.itemsize)):
+        assert np.argmax(array) == 34
+        assert np.array_equal(np.argmin(array, axis=0), np.argmin(np.array(array), axis=0))
+
+
+def test_count_nonzero(small_large_array):
+    data = np.arange(60).reshape((3, 4, 5)) % 3
+
+    with ch5mpy.options(max_memory=str(7 * small_large_array.dtype.itemsize)):
+        assert np.count_nonzero(small_large_array) == 59
+        small_large_array[:] = data
+        assert np.count_nonzero(small_large_array) == np.count_nonzero(data)
+        assert np.array_equal(np.count_nonzero(small_large_array, axis=1), np.count_nonzero(data, axis=1))
+
+
+def test_nonzero(small_large_array):
+    data = np.arange(60).reshape((3, 4, 5)) % 7 == 0
+    small_large_array[:] = data
+
+    with ch5mpy.options(max_memory=str(7 * small_large_array.dtype.itemsize)):
+        for result, expected in zip(np.nonzero(small_large_array), np.nonzero(data)):
+            assert np.array_equal(result, expected)
+
+        assert np.array_equal(np.argwhere(small_large_array), np.argwhere(data))
+        assert np.array_equal(np.flatnonzero(small_large_array), np.flatnonzero(data))
+
+
+def test_searching_4d(array_4d):
+    data = np.array(array_4d)
+
+    # zeros make ties for argmin, which are broken on the first element in C order
+    with ch5mpy.options(max_memory=str(2 * array_4d.dtype.itemsize)):
+        assert np.argmax(array_4d) == np.argmax(data)
+        assert np.argmin(array_4d) == np.argmin(data)
+        assert np.array_equal(np.flatnonzero(array_4d), np.flatnonzero(data))
+
+        for result, expected in zip(np.nonzero(array_4d), np.nonzero(data)):
+            assert np.array_equal(result, expected)
+
+
+def test_reduceat(array):
+    indices = [0, 13, 13, 40, 32, 99]
+    flat = ch5mpy.zeros((100,), name="flat", loc=array.file, dtype=np.float64)
+    flat[:] = np.arange(100.0)
+
+    with ch5mpy.options(max_memory=str(7 * array.dtype.itemsize)):
+        assert np.array_equal(np.add.reduceat(flat, indices), np.add.reduceat(np.arange(100.0), indices))
+        assert np.array_equal(np.maximum.reduceat(flat, indices), np.maximum.reduceat(np.arange(100.0), indices))
+
+
+@pytest.mark.parametrize("axis", [0, 1])
+def test_reduceat_axis(array, axis):
+    indices = [0, 3, 2, 7]
+
+    with ch5mpy.options(max_memory=str(7 * array.dtype.itemsize)):
+        assert np.array_equal(
+            np.add.reduceat(array, indices, axis=axis),
+            np.add.reduceat(np.arange(100.0).reshape((10, 10)), indices, axis=axis),
+        )
+
+
+@pytest.mark.parametrize("func", ["sum", "prod", "min", "max", "count", "mean"])
+def test_group_reduce(array, func):
+    values = np.arange(100.0)
+    keys = np.random.default_rng(0).integers(0, 8, size=100)
+    keys_array = ch5mpy.zeros((100,), name="keys", loc=array.file, dtype=np.int64)
+    keys_array[:] = keys
+    values_array = ch5mpy.zeros((100,), name="values", loc=array.file, dtype=np.float64)
+    values_array[:] = values
+
+    with ch5mpy.options(max_memory=str(7 * array.dtype.itemsize)):
+        unique_keys, result = ch5mpy.group_reduce(values_array, keys_array, func)
+
+    reduce = {"sum": np.sum, "prod": np.prod, "min": np.min, "max": np.max, "count": np.size, "mean": np.mean}[func]
+    assert np.array_equal(unique_keys, np.unique(keys))
+    assert np.allclose(result, [reduce(values[keys == k]) for k in np.unique(keys)])
+
+
+def test_group_reduce_spill(array):
+    values = np.arange(100.0)
+    keys = np.random.default_rng(0).permutation(100) % 40
+    keys_array = ch5mpy.zeros((100,), name="keys", loc=array.file, dtype=np.int64)
+    keys_array[:] = keys
+
+    with ch5mpy.options(max_memory=str(7 * array.dtype.itemsize)):
+        unique_keys, result = ch5mpy.group_reduce(values, keys_array, "mean")
+
+    assert np.array_equal(unique_keys, np.arange(40))
+    assert np.allclose(result, [values[keys == k].mean() for k in range(40)])
@@ -255,3 +255,11 @@ def test_3d_array():
         (SingleIndex(2, 3), SingleIndex(3, 4), FullSlice(0, 3, 1, 5)),
         (SingleIndex(2, 3), SingleIndex(3, 4), FullSlice(3, 5, 1, 5)),
     )
+
+
+def test_chunks_should_follow_c_order():
+    chunks = _get_chunk_indices(2, (2, 3, 4, 5))
+
+    starts = [tuple(int(s.as_numpy_index()) for s in chunk[:3]) + (chunk[3].start,) for chunk in chunks]
+
+    assert starts == [(i, j, k, m) for i in range(2) for j in range(3) for k in range(4) for m in range(0, 5, 2)]
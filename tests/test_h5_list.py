@@ -72,6 +72,14 @@ def test_list_should_convert_to_regular_list(h5_list):
     assert lst == [1.0, 2, C([1, 2, 3]), "4.", O_(5.0)]
 
 
+def test_list_lazy_copy_should_read_on_first_access(h5_list):
+    lst = h5_list.copy(lazy=True)
+
+    assert all(isinstance(e, ch.LazyObject) and not e.is_loaded for e in lst)
+    assert lst[3] == "4." and lst[3].is_loaded
+    assert not lst[2].is_loaded
+
+
 def test_list_get_negative_index(h5_list):
     assert h5_list[-2] == "4."
 
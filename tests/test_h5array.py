@@ -1,9 +1,14 @@
 from pathlib import Path
+from typing import Any
 
+import h5py
 import numpy as np
+import numpy.typing as npt
 import pytest
 
 import ch5mpy
+from ch5mpy.array.io import read_from_dataset
+from ch5mpy.indexing import FullSlice, Selection
 
 
 def test_should_get_shape(array):
@@ -496,3 +501,468 @@ def test_can_hash(small_array: ch5mpy.H5Array) -> None:
     small_array[0] = -1
     hash2 = hash(small_array)
     assert hash1 != hash2
+
+
+@pytest.mark.parametrize(
+    "selection",
+    [
+        ([0, 2], [1, 3]),
+        ([2, 0, 2], [3, 1, 3]),
+        ([0, 1], slice(None), [2, 3]),
+        (slice(None), [0, 1], [2, 3]),
+        (1, [3, 0], [2, 4]),
+        (-1, [3, 0], [2, 4]),
+        ([0, 2], -2, [1, 3]),
+        (slice(1, 3), [2, 0], [4, 1]),
+        ([[0], [2]], [1, 3]),
+        (None, [1, 0], [2, 2]),
+    ],
+)
+def test_long_indexing_should_read_points(small_large_array: ch5mpy.H5Array, selection: tuple[Any, ...]) -> None:
+    data = np.arange(3 * 4 * 5).reshape((3, 4, 5))
+
+    with ch5mpy.options(max_memory=str(3 * small_large_array.dtype.itemsize)):
+        assert np.array_equal(np.array(small_large_array[selection]), data[selection])
+
+
+@pytest.mark.parametrize(
+    "selection",
+    [
+        ([0, 1, 2, 3, 7, 8, 9],),
+        ([9, 8, 7, 0, 1, 2, 2, 3],),
+        (slice(None, None, 2), [0, 1, 2, 4, 5]),
+        ([1, 2, 3, 5], 4),
+        ([1, 2, 3, 5], -4),
+        (-4, [1, 2, 3, 4, 5, 6]),
+        (-4, [1, 5]),
+        (-4, np.arange(10) % 2 == 0),
+        (None, [0, 1, 2, 3, 7, 8, 9], slice(1, 4)),
+    ],
+)
+def test_coalesced_list_should_read_and_write(array: ch5mpy.H5Array, selection: tuple[Any, ...]) -> None:
+    data = np.arange(100.0).reshape((10, 10))
+    assert np.array_equal(np.array(array[selection]), data[selection])
+
+    values = -np.arange(data[selection].size).reshape(data[selection].shape)
+    array[selection] = values
+    data[selection] = values
+    assert np.array_equal(np.array(array), data)
+
+
+@pytest.mark.parametrize(
+    "selection",
+    [
+        ([9, 0, 4, 4, 7, 1],),
+        ([8, 2, 5], [1, 9, 3]),
+        ([0, 9, 9, 3], [2, 5, 5, 7]),
+        (-9, [1, 4, 8]),
+        (-9, np.arange(10) % 3 == 0),
+        ([5, 1, 8], -2),
+    ],
+)
+def test_chunked_array_should_gather_and_scatter_by_chunks(
+    chunked_array: ch5mpy.H5Array, selection: tuple[Any, ...]
+) -> None:
+    data = np.arange(100.0).reshape((10, 10))
+    assert np.array_equal(np.array(chunked_array[selection]), data[selection])
+
+    values = -np.arange(data[selection].size).reshape(data[selection].shape)
+    chunked_array[selection] = values
+    data[selection] = values
+    assert np.array_equal(np.array(chunked_array), data)
+
+
+@pytest.mark.parametrize(
+    "selection",
+    [
+        ([9, 0, 4, 4, 7, 1],),
+        (slice(None, None, 2), [8, 0, 3, 3]),
+        ([[5], [2], [2]],),
+        (None, [6, 1], slice(2, 5)),
+    ],
+)
+@pytest.mark.parametrize("max_memory", [None, "80"])
+def test_unsorted_list_should_read_by_blocks(
+    array: ch5mpy.H5Array, selection: tuple[Any, ...], max_memory: str | None
+) -> None:
+    data = np.arange(100.0).reshape((10, 10))
+
+    with ch5mpy.options(max_memory=max_memory):
+        assert np.array_equal(np.array(array[selection]), data[selection])
+        assert np.array_equal(np.array(array.astype(str)[selection]), data.astype(str)[selection])
+
+
+@pytest.mark.parametrize(
+    "mask",
+    [
+        np.array([True, True, False, False, True, True, True, False, False, True]),
+        np.array([False] * 10),
+        np.array([True] * 10),
+    ],
+)
+def test_boolean_mask_should_read_and_write(
+    chunked_array: ch5mpy.H5Array, mask: npt.NDArray[np.bool_]
+) -> None:
+    data = np.arange(100.0).reshape((10, 10))
+    assert np.array_equal(np.array(chunked_array[mask]), data[mask])
+    assert np.array_equal(np.array(chunked_array[:, mask]), data[:, mask])
+
+    values = -np.arange(data[:, mask].size).reshape(data[:, mask].shape)
+    chunked_array[:, mask] = values
+    data[:, mask] = values
+    assert np.array_equal(np.array(chunked_array), data)
+
+
+def test_dense_mask_should_read_and_write_by_batches(tmp_path: Path) -> None:
+    data = np.arange(5000 * 4, dtype=np.float64).reshape(5000, 4)
+    mask = np.random.default_rng(0).random(5000) < 0.5
+
+    with ch5mpy.File(tmp_path / "mask.h5", mode=ch5mpy.H5Mode.WRITE_TRUNCATE) as file:
+        ch5mpy.write_object(data, file, "data", chunks=False)
+        array = ch5mpy.H5Array(file["data"])
+        selection = Selection.from_selector((mask,), array.shape)
+        (index,) = (i for i in selection if not isinstance(i, FullSlice))
+
+        with ch5mpy.options(max_memory="4K"):
+            loading_array = np.empty(selection.out_shape)
+            read_from_dataset(array.dset, selection, loading_array)
+
+            assert np.array_equal(loading_array, data[mask])
+            assert np.array_equal(np.array(array[:, 1][mask]), data[mask, 1])
+
+            array[mask] = -data[mask]
+            data[mask] = -data[mask]
+            assert np.array_equal(np.array(array.dset[()]), data)
+
+        # the mask's elements are only computed batch by batch
+        assert index._cached_elements is None
+
+
+def test_boolean_mask_should_index_views(chunked_array: ch5mpy.H5Array) -> None:
+    mask = np.array([True, True, False, False, True, True, True, False, False, True])
+    data = np.arange(100.0).reshape((10, 10))
+
+    assert np.array_equal(np.array(chunked_array[mask][1:4]), data[mask][1:4])
+    assert np.array_equal(np.array(chunked_array[2:][mask[2:]]), data[2:][mask[2:]])
+    assert np.array_equal(np.array(chunked_array[mask][:, mask]), data[mask][:, mask])
+
+
+def test_h5_boolean_mask_should_index(chunked_array: ch5mpy.H5Array) -> None:
+    mask = np.array([False, True, True, True, False, False, True, True, False, True])
+    ch5mpy.write_object(mask, chunked_array.dset.file, "mask", chunks=(3,))
+    h5_mask = ch5mpy.H5Array(chunked_array.dset.file["mask"])
+
+    data = np.arange(100.0).reshape((10, 10))
+    assert np.array_equal(np.array(chunked_array[h5_mask]), data[mask])
+    assert np.array_equal(np.array(chunked_array[:, h5_mask]), data[:, mask])
+
+
+def test_at_should_read_eagerly(array: ch5mpy.H5Array) -> None:
+    data = np.arange(100.0).reshape((10, 10))
+
+    assert array.at[2, -3] == data[2, -3]
+    assert type(array.at[1:3, 4]) is np.ndarray
+    assert np.array_equal(array.at[1:3, 4], data[1:3, 4])
+    assert np.array_equal(array.at[[5, 1]], data[[5, 1]])
+    assert np.array_equal(array[2:5].at[1], data[2:5][1])
+
+
+def test_at_should_write(array: ch5mpy.H5Array) -> None:
+    data = np.arange(100.0).reshape((10, 10))
+
+    array.at[3, 4] = -1
+    array.at[5:7] = -2
+    array.at[:, 0] = -np.arange(10)
+    data[3, 4] = -1
+    data[5:7] = -2
+    data[:, 0] = -np.arange(10)
+
+    assert np.array_equal(np.array(array), data)
+
+
+def test_iat_should_access_single_elements(array: ch5mpy.H5Array) -> None:
+    array.iat[9, 9] = -1
+
+    assert array.iat[9, 9] == -1
+    assert array.iat[0, 1] == 1
+
+    with pytest.raises(IndexError):
+        array.iat[0]
+
+    with pytest.raises(IndexError):
+        array.iat[10, 0]
+
+
+def test_at_should_read_str_array(str_array: ch5mpy.H5Array) -> None:
+    assert np.array_equal(str_array.at[1:3], np.array(str_array)[1:3])
+
+
+@pytest.mark.parametrize(
+    "selection",
+    [
+        ([9, 0, 4, 4, 7, 1],),
+        (slice(None), [8, 0, 3, 3]),
+        (2, [9, 1, 1]),
+        ([0, 9, 9, 3], [2, 5, 5, 7]),
+    ],
+)
+@pytest.mark.parametrize("max_memory", [None, "80"])
+@pytest.mark.parametrize("scalar", [False, True])
+def test_unsorted_list_should_write_last_value_for_duplicates(
+    array: ch5mpy.H5Array, selection: tuple[Any, ...], max_memory: str | None, scalar: bool
+) -> None:
+    data = np.arange(100.0).reshape((10, 10))
+    values = -1.0 if scalar else -np.arange(data[selection].size).reshape(data[selection].shape) - 1
+
+    with ch5mpy.options(max_memory=max_memory):
+        array[selection] = values
+
+    data[selection] = values
+    assert np.array_equal(np.array(array), data)
+
+
+@pytest.mark.parametrize(
+    "selection",
+    [
+        (np.array([[4, 1], [2, 2], [0, 3]]),),
+        (slice(None), np.array([[4, 1], [2, 2], [0, 3]])),
+        (2, np.array([[4, 1], [2, 2], [0, 3]])),
+        (None, np.array([[4, 1], [2, 2], [0, 3]])),
+    ],
+)
+@pytest.mark.parametrize("fixture", ["array", "chunked_array"])
+def test_nd_list_should_read_and_write(
+    request: pytest.FixtureRequest, selection: tuple[Any, ...], fixture: str
+) -> None:
+    arr = request.getfixturevalue(fixture)
+    data = np.arange(100.0).reshape((10, 10))
+    assert np.array_equal(np.array(arr[selection]), data[selection])
+
+    values = -np.arange(data[selection].size).reshape(data[selection].shape) - 1
+    arr[selection] = values
+    data[selection] = values
+    assert np.array_equal(np.array(arr), data)
+
+
+def test_list_between_slices_should_stay_in_place(h5_dict: ch5mpy.H5Dict) -> None:
+    arr = h5_dict["f"]
+    data = np.zeros((10, 10, 10))
+    arr[1:4, [3, 1], 2:6] = np.arange(24).reshape((3, 2, 4))
+    data[1:4, [3, 1], 2:6] = np.arange(24).reshape((3, 2, 4))
+
+    assert arr[1:4, [3, 1], 2:6].shape == (3, 2, 4)
+    assert np.array_equal(np.array(arr[1:4, [3, 1], 2:6]), data[1:4, [3, 1], 2:6])
+    assert np.array_equal(np.array(arr), data)
+
+
+def test_inplace_on_unsorted_list_view(array: ch5mpy.H5Array) -> None:
+    data = np.arange(100.0).reshape((10, 10))
+    view = array[:, [3, 1]]
+    view += 1000
+    data[:, [3, 1]] += 1000
+
+    assert np.array_equal(np.array(array), data)
+
+
+def _write_contiguous(array: ch5mpy.H5Array) -> ch5mpy.H5Array:
+    ch5mpy.write_object(np.arange(100.0).reshape((10, 10)), array.dset.file, "contiguous", chunks=False)
+    return ch5mpy.H5Array(array.dset.file["contiguous"], mmap=True)
+
+
+def test_mmap_should_read_contiguous_array_without_copy(array: ch5mpy.H5Array) -> None:
+    data = np.arange(100.0).reshape((10, 10))
+    mapped = _write_contiguous(array)
+
+    assert mapped.is_mapped
+    assert not np.asarray(mapped).flags.writeable
+    assert not np.asarray(mapped[2:5, 1]).flags.writeable
+    assert mapped[3, -1] == data[3, -1]
+    assert mapped[2:5][1, 4] == data[2:5][1, 4]
+    assert np.array_equal(np.asarray(mapped[2:8:2, 1]), data[2:8:2, 1])
+    assert np.array_equal(np.array(mapped[[7, 1], 2:4]), data[[7, 1], 2:4])
+    assert np.array_equal(mapped.at[1:3], data[1:3])
+
+    with ch5mpy.options(max_memory="160"):
+        for index, chunk in mapped[1:].iter_chunks():
+            assert not chunk.flags.writeable
+            assert np.array_equal(chunk, data[1:][ch5mpy.indexing.map_slice(index)])
+
+
+def test_mmap_should_see_writes(array: ch5mpy.H5Array) -> None:
+    data = np.arange(100.0).reshape((10, 10))
+    mapped = _write_contiguous(array)
+
+    assert mapped.is_mapped
+
+    mapped[2, 3] = -1
+    mapped[:, [5, 1]] = -2
+    mapped[4:6] += 100
+    view = mapped[7:]
+    view -= 1
+    data[2, 3] = -1
+    data[:, [5, 1]] = -2
+    data[4:6] += 100
+    data[7:] -= 1
+
+    assert np.array_equal(np.asarray(mapped), data)
+
+
+def test_mmap_should_fall_back_for_chunked_array(chunked_array: ch5mpy.H5Array) -> None:
+    mapped = ch5mpy.H5Array(chunked_array, mmap=True)
+
+    assert not mapped.is_mapped
+    assert np.array_equal(np.array(mapped[1:3]), np.arange(100.0).reshape((10, 10))[1:3])
+
+
+def test_should_set_chunk_cache(chunked_array: ch5mpy.H5Array) -> None:
+    chunked_array.dset.set_chunk_cache(16 * 1024 * 1024)
+
+    assert chunked_array.dset.chunk_cache_size == 16 * 1024 * 1024
+    assert np.array_equal(np.array(chunked_array[[7, 1]]), np.arange(100.0).reshape((10, 10))[[7, 1]])
+
+
+def test_should_open_file_with_chunk_cache_option(chunked_array: ch5mpy.H5Array) -> None:
+    # HDF5 opens a file once per process, with the settings of the first open
+    filename = chunked_array.filename
+    chunked_array.close()
+
+    with ch5mpy.options(chunk_cache="16M"):
+        arr = ch5mpy.H5Array.read(filename, "data")
+
+    assert arr.dset.chunk_cache_size == 16 * 1024 * 1024
+
+
+def test_should_tune_chunk_cache(chunked_array: ch5mpy.H5Array) -> None:
+    ch5mpy.write_object(np.zeros((3000, 3000)), chunked_array.dset.file, "large", chunks=(100, 100))
+    arr = ch5mpy.H5Array(chunked_array.dset.file["large"])
+
+    with ch5mpy.options(chunk_cache="auto", max_memory="64M"):
+        # 4 columns of 30 chunks of 80kB
+        np.array(arr[:, [5, 1050, 2050, 2950]])
+        assert arr.dset.chunk_cache_size == 16 * 1024 * 1024
+
+        np.array(arr[::10, ::10])
+        assert arr.dset.chunk_cache_size == 64 * 1024 * 1024
+
+
+@pytest.fixture
+def swmr_array(tmp_path: Path) -> Any:
+    file = ch5mpy.File(tmp_path / "swmr.h5", mode=ch5mpy.H5Mode.WRITE_TRUNCATE, swmr=True)
+    ch5mpy.write_object(np.zeros((0, 3)), file, "data", chunks=(4, 3), maxshape=(None, 3))
+    file.start_swmr()
+
+    yield ch5mpy.H5Array(file["data"])
+
+    file.close()
+
+
+def test_swmr_reader_should_see_appended_rows(swmr_array: ch5mpy.H5Array) -> None:
+    reader = ch5mpy.H5Array.read(ch5mpy.File(swmr_array.filename, mode=ch5mpy.H5Mode.READ, swmr=True), "data")
+
+    swmr_array.append(np.ones((5, 3)))
+    swmr_array.append([2, 2, 2])
+    reader.refresh()
+
+    assert swmr_array.dset.file.swmr_mode and reader.dset.file.swmr_mode
+    assert reader.shape == (6, 3)
+    assert np.array_equal(reader[5], [2, 2, 2])
+
+
+def test_iter_chunks_should_follow_appended_rows(swmr_array: ch5mpy.H5Array) -> None:
+    reader = ch5mpy.H5Array.read(ch5mpy.File(swmr_array.filename, mode=ch5mpy.H5Mode.READ, swmr=True), "data")
+    swmr_array.append(np.ones((2, 3)))
+
+    chunks = iter(reader.iter_chunks(follow=True, poll_interval=0.01, timeout=0.1))
+    index, chunk = next(chunks)
+    assert index[0] == ch5mpy.indexing.FullSlice(0, 2, 1, 2)
+    assert np.array_equal(chunk, np.ones((2, 3)))
+
+    swmr_array.append(np.full((3, 3), 2))
+    index, chunk = next(chunks)
+    assert index[0] == ch5mpy.indexing.FullSlice(2, 5, 1, 5)
+    assert np.array_equal(chunk, np.full((3, 3), 2))
+
+    assert next(chunks, None) is None
+
+
+def test_should_not_start_swmr_on_old_file_format(chunked_array: ch5mpy.H5Array) -> None:
+    with pytest.raises(OSError):
+        chunked_array.dset.file.start_swmr()
+
+
+@pytest.fixture
+def gzip_array(tmp_path: Path) -> Any:
+    file = ch5mpy.File(tmp_path / "gzip.h5", mode=ch5mpy.H5Mode.WRITE_TRUNCATE)
+    data = np.arange(100 * 30, dtype=np.float64).reshape(100, 30)
+
+    with ch5mpy.options(io_threads=4):
+        ch5mpy.write_object(
+            data, file, "data", chunks=(16, 8), filters={"compression": "gzip", "compression_opts": 4, "shuffle": True}
+        )
+
+    yield ch5mpy.H5Array(file["data"])
+
+    file.close()
+
+
+def test_store_dataset_should_compress_chunks_in_parallel(gzip_array: ch5mpy.H5Array) -> None:
+    filename = gzip_array.filename
+    gzip_array.close()
+
+    with h5py.File(filename, "r") as file:
+        assert file["data"].compression == "gzip"
+        assert np.array_equal(file["data"][()], np.arange(100 * 30).reshape(100, 30))
+
+
+def test_should_write_chunks_compressed_in_parallel(gzip_array: ch5mpy.H5Array) -> None:
+    expected = np.arange(100 * 30, dtype=np.float64).reshape(100, 30)
+    expected[5:90, 3:] = -1
+    expected[50] = np.arange(30)
+
+    with ch5mpy.options(io_threads=4):
+        gzip_array[5:90, 3:] = -1
+        gzip_array[50] = np.arange(30)
+
+    assert np.array_equal(np.array(gzip_array.dset[()]), expected)
+
+
+def test_chunks_compressed_in_parallel_should_be_padded_with_fill_value(tmp_path: Path) -> None:
+    with ch5mpy.File(tmp_path / "gzip.h5", mode=ch5mpy.H5Mode.WRITE_TRUNCATE) as file:
+        gzip = {"compression": "gzip"}
+        arr = ch5mpy.full((10,), 7, "full", file, chunks=(4,), filters=gzip)
+
+        with ch5mpy.options(io_threads=2):
+            arr[:] = np.arange(10)
+            ch5mpy.store_dataset(np.arange(10.0), file, "stored", chunks=(4,), fill_value=7, filters=gzip)
+
+        stored = ch5mpy.H5Array(file["stored"])
+
+        for array in (arr, stored):
+            array.expand(2)
+            assert np.array_equal(array, [0, 1, 2, 3, 4, 5, 6, 7, 8, 9, 7, 7])
+
+
+def test_inplace_should_write_chunks_compressed_in_parallel(gzip_array: ch5mpy.H5Array) -> None:
+    with ch5mpy.options(io_threads=4, max_memory="4K"):
+        gzip_array += 1
+
+    assert np.array_equal(np.array(gzip_array.dset[()]), np.arange(100 * 30).reshape(100, 30) + 1)
+
+
+def test_should_read_chunks_decompressed_in_parallel(gzip_array: ch5mpy.H5Array) -> None:
+    expected = np.arange(100 * 30, dtype=np.float64).reshape(100, 30)
+
+    with ch5mpy.options(io_threads=4, max_memory="4K"):
+        assert np.array_equal(np.array(gzip_array), expected)
+        assert np.array_equal(gzip_array[3:70, 5:29], expected[3:70, 5:29])
+        assert np.array_equal(gzip_array.at[10:50, 1], expected[10:50, 1])
+        assert np.array_equal(np.concatenate([chunk.copy() for _, chunk in gzip_array.iter_chunks()]), expected)
+
+
+def test_should_read_unallocated_and_unflushed_chunks_in_parallel(tmp_path: Path) -> None:
+    with ch5mpy.File(tmp_path / "gzip.h5", mode=ch5mpy.H5Mode.WRITE_TRUNCATE) as file:
+        arr = ch5mpy.zeros((100, 30), "data", file, chunks=(16, 8), filters={"compression": "gzip"})
+        arr[20:30, 3] = 1
+
+        with ch5mpy.options(io_threads=4):
+            assert np.array_equal(np.array(arr[:, 3]), np.repeat([0, 1, 0], [20, 10, 70]))
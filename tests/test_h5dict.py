@@ -1,9 +1,10 @@
 from __future__ import annotations
 
+import h5py
 import numpy as np
 import pytest
 
-from ch5mpy import H5Array, H5Dict
+from ch5mpy import File, H5Array, H5Dict, H5Mode, LazyObject
 
 
 def test_h5_dict_creation(h5_dict):
@@ -129,6 +130,54 @@ def test_h5_dict_can_close_file(h5_dict):
         _ = h5_dict["a"]
 
 
+def test_h5_dict_should_reuse_wrappers_of_open_objects(h5_dict):
+    group = h5_dict.file
+
+    assert group["c"] is group["c"]
+    assert group["c"]["e"] is group["c"]["e"]
+    assert group["c"].file is group["c"].file
+    assert group["c"]["e"].attrs is group["c"]["e"].attrs
+
+
+def test_h5_dict_should_not_attach_linking_file_to_external_objects(h5_dict, tmp_path):
+    with File(tmp_path / "external.h5", H5Mode.WRITE_TRUNCATE) as h5_file:
+        h5_file.create_dataset("x", data=np.arange(3))
+
+    h5_dict.file["ext"] = h5py.ExternalLink(str(tmp_path / "external.h5"), "/x")
+    external = h5_dict.file["ext"]
+
+    assert external.file.filename == str(tmp_path / "external.h5")
+    assert np.array_equal(h5_dict["ext"], [0, 1, 2])
+    assert external not in h5_dict.file.file._wrappers.values()
+
+
+def test_h5_dict_should_not_reuse_wrappers_of_closed_files(h5_dict):
+    dataset = h5_dict.file["c"]["e"]
+    h5_dict.file.file.close()
+
+    with File("backed_dict", H5Mode.READ) as h5_file:
+        reopened = h5_file["uns"]["c"]["e"]
+
+        assert reopened is not dataset
+        assert reopened.id.valid
+        assert reopened.attrs["dtype"] == "int64"
+
+
+def test_h5_dict_should_not_write_equal_values_in_read_only_file(h5_dict):
+    h5_dict.file.create_dataset("contiguous", data=np.arange(10))
+    h5_dict.file["c"]["e"].discard_fingerprint()
+    h5_dict.file.file.close()
+
+    with File("backed_dict", H5Mode.READ) as h5_file:
+        read_only = H5Dict(h5_file["uns"])
+
+        read_only["f"] = np.zeros((10, 10, 10))
+        read_only["c"]["e"] = np.arange(100)
+        read_only["contiguous"] = np.arange(10)
+
+        assert "__h5_fingerprint__" not in h5_file["uns"]["c"]["e"].attrs.keys()
+
+
 def test_h5_dict_copy_should_be_regular_dict(h5_dict):
     c = h5_dict.copy()
 
@@ -153,6 +202,23 @@ def test_h5_dict_copy_dataset_proxy_should_be_array(h5_dict):
     assert type(c["b"]) == np.ndarray
 
 
+def test_h5_dict_copy_should_read_nested_arrays(h5_dict):
+    c = h5_dict.copy()
+
+    assert c["c"]["d"] == "test"
+    assert np.array_equal(c["c"]["e"], np.arange(100))
+    assert isinstance(c["f"], np.ndarray) and c["f"].shape == (10, 10, 10)
+
+
+def test_h5_dict_lazy_copy_should_read_on_first_access(h5_dict):
+    c = h5_dict.copy(lazy=True)
+
+    assert isinstance(c["c"], dict)
+    assert isinstance(c["c"]["e"], LazyObject) and not c["c"]["e"].is_loaded
+    assert np.array_equal(c["c"]["e"], np.arange(100))
+    assert c["c"]["e"].is_loaded and c["c"]["e"].shape == (100,)
+
+
 class ComplexObject:
     def __init__(self, value: int):
         self.value = value
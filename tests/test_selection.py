@@ -5,7 +5,9 @@ from typing import Any
 import numpy as np
 import pytest
 
-from ch5mpy.indexing import FullSlice, ListIndex, as_indexer
+import ch5mpy
+from ch5mpy.indexing import FullSlice, ListIndex, MaskIndex, as_hyperslab, as_indexer
+from ch5mpy.indexing.planner import get_chunk_cache_size, plan_read, plan_write
 from ch5mpy.indexing.selection import Selection
 
 
@@ -227,3 +229,116 @@ def test_should_optimize(indices, shape, expected: Selection):
 )
 def test_should_get_shape(sel, shape):
     assert sel.out_shape == shape
+
+
+def test_should_get_hyperslabs():
+    hyperslabs, shape, list_axis, inverse = get_sel(slice(2, 8, 2), [7, 0, 1, 2, 1], shape=(10, 10)).get_hyperslabs()
+
+    assert hyperslabs == [((2, 0), (3, 3), (2, 1)), ((2, 7), (3, 1), (2, 1))]
+    assert shape == (3, 4)
+    assert list_axis == 1
+    assert np.array_equal(inverse, [3, 0, 1, 2, 1])
+
+
+def test_should_get_hyperslabs_of_negative_index():
+    hyperslabs, *_ = get_sel(-4, [1, 2, 5], shape=(10, 10)).get_hyperslabs()
+
+    assert hyperslabs == [((6, 1), (1, 2), (1, 1)), ((6, 5), (1, 1), (1, 1))]
+
+
+@pytest.mark.parametrize(
+    "sel, chunks, strategy",
+    [
+        (get_sel([10, 12, 15, 19], shape=(1000, 1000)), (100, 100), "bounding_box"),
+        (get_sel([0, 500_000, 999_999], shape=(1_000_000,)), (1000,), "indexers"),
+        (get_sel([0, 2, 4] + list(range(500_000, 600_000)) + [999_999], shape=(1_000_000,)), (1000,), "hyperslabs"),
+        (get_sel([0, 999], [0, 999], shape=(1000, 1000)), (10, 10), "points"),
+        (get_sel(slice(5), shape=(10, 10)), None, "direct"),
+    ],
+)
+def test_should_plan_read(sel, chunks, strategy):
+    assert plan_read(sel, np.float64, chunks).strategy == strategy
+
+
+def test_should_get_bounding_box_of_negative_index():
+    assert get_sel(-1, [5, 1], shape=(10, 10)).get_bounding_box() == ((9, 1), (1, 5), (1, 1))
+
+
+def test_should_plan_negative_index_as_positive_index():
+    negative, positive = get_sel(-9, [1, 4, 8], shape=(10, 10)), get_sel(1, [1, 4, 8], shape=(10, 10))
+
+    assert negative.explain(np.float64, (3, 3)).split("\n")[1:] == positive.explain(np.float64, (3, 3)).split("\n")[1:]
+    assert get_chunk_cache_size(negative, np.float64, (3, 3)) == get_chunk_cache_size(positive, np.float64, (3, 3))
+
+
+def test_should_not_plan_bounding_box_larger_than_memory():
+    sel = get_sel([10, 12, 15, 19], shape=(1000, 1000))
+
+    with ch5mpy.options(max_memory=1000):
+        assert "bounding_box" not in sel.explain(np.float64, (100, 100))
+
+
+def test_should_plan_chunk_gather_when_points_thrash_chunk_cache():
+    rng = np.random.default_rng(0)
+    sel = get_sel(rng.integers(0, 10_000, 5000), rng.integers(0, 1000, 5000), shape=(10_000, 1000))
+
+    with ch5mpy.options(max_memory="10M"):
+        assert plan_read(sel, np.float64, (100, 100), cache_size=1024 * 1024).strategy == "chunk_gather"
+        assert plan_read(sel, np.float64, (100, 100), cache_size=2**40).strategy == "points"
+
+
+def test_should_store_mask_as_runs():
+    mask = np.array([True, True, False, True, False, False, True, True, True, False])
+    sel = Selection.from_selector((mask,), (10, 10))
+    (index,) = (i for i in sel if not isinstance(i, FullSlice))
+
+    assert isinstance(index, MaskIndex)
+    assert index.bounds == (0, 8)
+    assert np.array_equal(index.as_runs()[0], [0, 3, 6])
+    assert np.array_equal(index.as_runs()[1], [2, 1, 3])
+    assert np.array_equal(index.as_array(), np.flatnonzero(mask))
+
+
+def test_should_reuse_selection_from_simple_selectors():
+    sel = Selection.from_selector((1, slice(2, 5)), (10, 10))
+
+    assert Selection.from_selector((1, slice(2, 5)), (10, 10)) is sel
+    assert Selection.from_selector((1, slice(2, 5)), (10, 11)) is not sel
+    assert Selection.from_selector(([1], 2), (10, 10)) is not Selection.from_selector(([1], 2), (10, 10))
+    assert not sel.is_slice.flags.writeable
+
+
+@pytest.mark.parametrize(
+    "index, hyperslab",
+    [
+        ((2, -1), (((2, 9), (1, 1), (1, 1)), ())),
+        (slice(1, 4), (((1, 0), (3, 10), (1, 1)), (3, 10))),
+        ((slice(None), 3), (((0, 3), (10, 1), (1, 1)), (10,))),
+        ((slice(None, None, 2), 3), None),
+        (([1, 2], 3), None),
+        (slice(5, 5), None),
+    ],
+)
+def test_should_get_hyperslab_from_simple_index(index: Any, hyperslab: Any) -> None:
+    assert as_hyperslab(index, (10, 10)) == hyperslab
+
+
+@pytest.mark.parametrize(
+    "sel, chunks, strategy",
+    [
+        (get_sel([10, 11, 12, 13, 20, 21, 22], shape=(1000, 10)), None, "hyperslabs"),
+        (get_sel(list(range(0, 4000, 2)) + [5001], shape=(10_000, 10)), None, "indexers"),
+        (get_sel([0, 999], [0, 999], shape=(1000, 1000)), None, "points"),
+        (get_sel(slice(5), shape=(10, 10)), None, "direct"),
+    ],
+)
+def test_should_plan_write(sel, chunks, strategy):
+    assert plan_write(sel, np.float64, chunks) == strategy
+
+
+def test_single_list_should_stay_in_place():
+    sel = get_sel(slice(1, 4), [3, 1], slice(2, 6), shape=(10, 10, 10))
+    assert sel.out_shape == (3, 2, 4)
+
+    sel = Selection((FullSlice.whole_axis(10), as_indexer(np.array([[4, 1], [2, 2], [0, 3]]), max=10)), shape=(10, 10))
+    assert sel.out_shape == (10, 3, 2)
@@ -3,10 +3,14 @@ from __future__ import annotations
 from enum import Enum
 from typing import Any
 
+import h5py
 import numpy as np
 import pytest
 
-from ch5mpy import File, Group, write_dataset, write_object
+import ch5mpy
+from ch5mpy import Dataset, File, Group, write_dataset, write_object
+from ch5mpy.io.fingerprint import compute_fingerprint
+from ch5mpy.io.write import guess_chunks
 
 
 class State(Enum):
@@ -76,3 +80,109 @@ def test_write_object(group, name, obj):
     write_object(obj, group, name)
 
     assert are_equal(obj, group[name])
+
+
+@pytest.mark.parametrize(
+    "shape, axis, expected",
+    [
+        ((1000, 30), 0, (1000, 30)),
+        ((100_000, 300), 0, (436, 300)),
+        ((100_000, 300), 1, (100_000, 1)),
+        ((0, 3), 0, (43690, 3)),
+        ((10, 100_000, 3), 0, (1, 43690, 3)),
+    ],
+)
+def test_should_guess_chunks(shape, axis, expected):
+    assert guess_chunks(shape, 8, 1024 * 1024, axis) == expected
+
+
+def test_should_write_with_filters(group):
+    write_object(
+        {"a": np.arange(1000)}, group, "data", filters={"compression": "gzip", "compression_opts": 4, "shuffle": True}
+    )
+
+    assert group["data"]["a"].filters == {"compression": "gzip", "compression_opts": 4, "shuffle": True}
+    assert np.array_equal(group["data"]["a"][()], np.arange(1000))
+
+
+def test_should_write_with_filters_option(group):
+    with ch5mpy.options(filters={"compression": "lzf"}, chunk_bytes="1K"):
+        write_dataset(np.arange(1000), group, "a")
+        write_dataset(np.arange(1000), group, "b", chunks=False)
+
+    assert group["a"].compression == "lzf" and group["a"].chunks == (128,)
+    assert group["b"].compression is None
+
+
+def test_should_not_write_filters_for_contiguous_dataset(group):
+    with pytest.raises(ValueError):
+        write_dataset(np.arange(1000), group, "a", chunks=False, filters={"compression": "gzip"})
+
+
+def test_should_write_fingerprint(group):
+    write_dataset(np.arange(1000), group, "a", chunks=(100,))
+
+    assert "__h5_fingerprint__" not in group["a"].attrs.keys()
+
+    with ch5mpy.options(trust_fingerprints=True):
+        write_dataset(np.arange(1000), group, "b", chunks=(100,))
+
+    assert group["b"].attrs["__h5_fingerprint__"].shape == (10, 16)
+
+    ch5mpy.H5Array(group["b"])[5] = -1
+
+    assert "__h5_fingerprint__" not in group["b"].attrs.keys()
+
+
+def test_should_fingerprint_many_chunks_as_hash_tree():
+    fingerprint = compute_fingerprint(np.arange(10_000), (1,))
+
+    assert fingerprint.shape == (2500, 16)
+
+
+@pytest.mark.parametrize("trusted", [True, False])
+def test_should_only_write_changed_chunks(group, monkeypatch, trusted):
+    values = np.arange(1000)
+    write_dataset(values, group, "a", chunks=(100,))
+
+    written = []
+    write_direct = Dataset.write_direct
+
+    def spy(self, source, dest_sel=None):
+        written.append(dest_sel)
+        write_direct(self, source, dest_sel=dest_sel)
+
+    monkeypatch.setattr(Dataset, "write_direct", spy)
+
+    with ch5mpy.options(trust_fingerprints=trusted):
+        write_dataset(values, group, "a")
+        assert written == []
+        assert ("__h5_fingerprint__" in group["a"].attrs.keys()) is trusted
+
+        values = values.copy()
+        values[550] = -1
+        write_dataset(values, group, "a")
+
+    assert written == [(slice(500, 600),)]
+    assert np.array_equal(group["a"][()], values)
+    assert ("__h5_fingerprint__" in group["a"].attrs.keys()) is trusted
+
+
+def test_should_compare_chunks_unless_fingerprints_are_trusted(group):
+    values = np.arange(1000)
+
+    with ch5mpy.options(trust_fingerprints=True):
+        write_dataset(values, group, "a", chunks=(100,))
+
+    # write with h5py, which leaves the fingerprint stale
+    h5py.Dataset.__setitem__(group["a"], 550, -1)
+    assert "__h5_fingerprint__" in group["a"].attrs.keys()
+
+    with ch5mpy.options(trust_fingerprints=True):
+        write_dataset(values, group, "a")
+
+    assert group["a"][550] == -1
+
+    write_dataset(values, group, "a")
+
+    assert np.array_equal(group["a"][()], values)
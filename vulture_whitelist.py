@@ -25,3 +25,10 @@ encoding  # unused variable (ch5mpy/objects/dataset.py:235)
 errors  # unused variable (ch5mpy/objects/dataset.py:235)
 _.attributes  # unused property (ch5mpy/objects/object.py:55)
 max_memory_usage  # unused variable (ch5mpy/options.py:9)
+overwrite_input  # unused variable (ch5mpy/array/functions/statistics.py:268)
+_.merge  # unused method (ch5mpy/array/sketch.py:100)
+_.explain  # unused method (ch5mpy/indexing/selection.py:517)
+_.writeable  # unused attribute (ch5mpy/indexing/selection.py:113)
+_.is_single  # unused property (ch5mpy/indexing/selection.py:242)
+_.is_slice  # unused property (ch5mpy/indexing/selection.py:250)
+_.iat  # unused property (ch5mpy/array/array.py:336)